@@ -73,23 +73,16 @@ def main():
 
     # 4. Check traffic lights
     print("\nChecking traffic lights...")
-    lights = client.traffic_lights.list()
-    summary = lights.summary
+    summary = client.traffic_lights.summary()
     print(f"✓ Projects: {summary.green} green, {summary.yellow} yellow, {summary.red} red")
 
-    # 5. Start heartbeat loop
+    # 5. Start heartbeats (one scheduler thread serves any number of agents)
     print("\nStarting heartbeat (Ctrl+C to stop)...")
+    beats = client.agents.heartbeats(interval=30, deregister_on_close=False)
+    beats.add(agent_id)
     while True:
-        client.agents.heartbeat(
-            agent_id=agent_id,
-            status="active",
-            metrics={
-                "uptime": time.time(),
-                "memory_mb": 50  # Example metric
-            }
-        )
-        print("♥", end="", flush=True)
         time.sleep(30)
+        print("♥", end="", flush=True)
 
 
 if __name__ == "__main__":
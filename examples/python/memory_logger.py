@@ -52,9 +52,13 @@ def main():
         }
     ]
 
-    for entry in actions:
-        result = client.memory.log(**entry)
-        print(f"  ✓ {entry['action']}: {result.id[:12]}...")
+    # Buffered logging queues entries and sends them in background batches
+    # instead of paying a round trip per entry.
+    with client.memory.buffered(batch_size=50, flush_interval=0.5) as buffer:
+        pending = [(entry, buffer.log(**entry)) for entry in actions]
+
+    for entry, future in pending:
+        print(f"  ✓ {entry['action']}: {future.result().id[:12]}...")
 
     # 2. Query recent entries
     print("\nQuerying recent entries...")
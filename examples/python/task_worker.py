@@ -9,19 +9,22 @@ import os
 import time
 import signal
 import sys
-from blackroad import BlackRoadClient
+from blackroad import BlackRoadClient, RetryPolicy
 
 API_KEY = os.environ.get("BLACKROAD_API_KEY")
 WORKER_SKILLS = os.environ.get("WORKER_SKILLS", "python,testing").split(",")
+WORKERS = int(os.environ.get("WORKERS", "4"))
 
-client = BlackRoadClient(api_key=API_KEY)
-running = True
+# Transient failures (5xx, 429 with Retry-After, dropped connections) are
+# retried with backoff inside the client.
+client = BlackRoadClient(api_key=API_KEY, retry=RetryPolicy(max_attempts=5))
+worker = None
 
 
 def signal_handler(sig, frame):
-    global running
     print("\nShutting down...")
-    running = False
+    if worker is not None:
+        worker.stop(wait=False)
 
 
 def process_task(task):
@@ -38,67 +41,24 @@ def process_task(task):
     return f"Completed {task.title} successfully"
 
 
-def worker_loop():
-    """Main worker loop"""
-    global running
+def on_complete(task, summary):
+    print(f"✓ Completed: {task.id}")
 
-    print(f"Worker skills: {', '.join(WORKER_SKILLS)}")
-    print("Polling for tasks (Ctrl+C to stop)...\n")
-
-    while running:
-        try:
-            # Fetch available tasks
-            tasks = client.tasks.list(status="available")
-
-            # Filter by skills
-            matching = [
-                t for t in tasks.tasks
-                if not t.required_skills or
-                any(s in WORKER_SKILLS for s in t.required_skills)
-            ]
-
-            if matching:
-                print(f"Found {len(matching)} matching tasks")
-
-                # Try to claim the first matching task
-                task = matching[0]
-
-                try:
-                    claimed = client.tasks.claim(task.id)
-                    print(f"✓ Claimed: {task.id}")
-
-                    # Process the task
-                    summary = process_task(claimed)
+    # Log to memory
+    client.memory.log(
+        action="progress",
+        entity=task.id,
+        details=summary,
+        tags=["task", "completed", "worker"]
+    )
 
-                    # Complete the task
-                    client.tasks.complete(task.id, summary=summary)
-                    print(f"✓ Completed: {task.id}")
 
-                    # Log to memory
-                    client.memory.log(
-                        action="progress",
-                        entity=task.id,
-                        details=summary,
-                        tags=["task", "completed", "worker"]
-                    )
-
-                except Exception as e:
-                    if "409" in str(e):
-                        print(f"Task already claimed: {task.id}")
-                    else:
-                        raise
-
-            else:
-                print(".", end="", flush=True)
-
-            time.sleep(5)
-
-        except Exception as e:
-            print(f"Error: {e}")
-            time.sleep(10)
+def on_error(task, error):
+    print(f"Error{f' on {task.id}' if task else ''}: {error}")
 
 
 def main():
+    global worker
     print("=== BlackRoad Task Worker Example ===\n")
 
     signal.signal(signal.SIGINT, signal_handler)
@@ -112,10 +72,22 @@ def main():
     print(f"   Completed: {stats.completed}")
     print()
 
-    # Start worker loop
-    worker_loop()
-
-    print("Worker stopped")
+    print(f"Worker skills: {', '.join(WORKER_SKILLS)}")
+    print(f"Processing with {WORKERS} workers (Ctrl+C to stop)...\n")
+
+    # Matching tasks are prefetched by priority; tasks claimed by someone
+    # else first are skipped without re-polling.
+    worker = client.tasks.worker(
+        process_task,
+        skills=WORKER_SKILLS,
+        workers=WORKERS,
+        on_complete=on_complete,
+        on_error=on_error,
+    )
+    final = worker.run()
+
+    print(f"Worker stopped: {final.completed} completed, "
+          f"{final.conflicts} lost to other workers, {final.failed} failed")
 
 
 if __name__ == "__main__":
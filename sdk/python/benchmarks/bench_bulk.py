@@ -0,0 +1,72 @@
+"""
+Bulk Lifecycle Benchmark
+
+Compare a sequential register loop with ``register_many`` at several
+concurrency levels against a mock server with fixed per-request latency.
+
+Usage:
+    python benchmarks/bench_bulk.py [--agents 500] [--latency-ms 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx  # noqa: E402
+
+from blackroad import BlackRoadClient  # noqa: E402
+
+import payloads  # noqa: E402
+
+
+def make_client(latency: float) -> BlackRoadClient:
+    template = payloads.agents(1)[0]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(latency)
+        body = json.loads(request.content or b"{}")
+        return httpx.Response(200, json=dict(template, name=body.get("name", "")))
+
+    client = BlackRoadClient(api_key="bench")
+    client._client = httpx.Client(
+        transport=httpx.MockTransport(handler), base_url="http://bench"
+    )
+    return client
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--agents", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--concurrency", default="1,8,32,64")
+    args = parser.parse_args()
+
+    client = make_client(args.latency_ms / 1000)
+    names = [f"worker-{i}" for i in range(args.agents)]
+
+    start = time.perf_counter()
+    for name in names:
+        client.agents.register(name)
+    baseline = time.perf_counter() - start
+    print(f"{'mode':>22}{'seconds':>10}{'agents/s':>12}{'speedup':>10}")
+    print(f"{'sequential loop':>22}{baseline:>10.2f}{args.agents / baseline:>12.0f}{1:>10.1f}")
+
+    for concurrency in (int(c) for c in args.concurrency.split(",")):
+        start = time.perf_counter()
+        failed = sum(
+            not r.ok for r in client.agents.register_many(names, concurrency)
+        )
+        elapsed = time.perf_counter() - start
+        label = f"register_many({concurrency})"
+        print(
+            f"{label:>22}{elapsed:>10.2f}{args.agents / elapsed:>12.0f}"
+            f"{baseline / elapsed:>10.1f}" + (f"  ({failed} failed)" if failed else "")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Codec Benchmark
+
+Compare JSON codecs on realistic response and request payloads.
+
+Usage:
+    python benchmarks/bench_codec.py [--sizes 100,1000,10000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from blackroad.codec import available_codecs, get_codec  # noqa: E402
+from blackroad.codex import CodexComponent  # noqa: E402
+from blackroad.memory import MemoryEntry  # noqa: E402
+
+import payloads  # noqa: E402
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    """Fastest wall time of ``repeat`` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def touch(models) -> None:
+    """Read every field, forcing the lazy decode."""
+    for model in models:
+        model.to_dict()
+
+
+def run(sizes: List[int], repeat: int) -> List[Dict[str, object]]:
+    cases = [
+        ("memory", "entries", MemoryEntry, payloads.memory_entries),
+        ("codex", "components", CodexComponent, payloads.codex_components),
+    ]
+    rows = []
+    for name, key, model, generate in cases:
+        for size in sizes:
+            data = generate(size)
+            body = payloads.response_body(key, data)
+            for codec_name in available_codecs():
+                codec = get_codec(codec_name)
+                rows.append({
+                    "payload": name,
+                    "rows": size,
+                    "kb": len(body) // 1024,
+                    "codec": codec_name,
+                    "loads": best_of(lambda: codec.loads(body), repeat),
+                    "models": best_of(lambda: codec.decode(body, model, key), repeat),
+                    "models+read": best_of(
+                        lambda: touch(codec.decode(body, model, key)), repeat
+                    ),
+                    "dumps": best_of(lambda: codec.dumps({key: data}), repeat),
+                })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    columns = ["payload", "rows", "kb", "codec", "loads", "models", "models+read", "dumps"]
+    print(("{:>12}" * len(columns)).format(*columns))
+    for row in run(sizes, args.repeat):
+        print("".join(
+            f"{row[c]:>12.2f}" if isinstance(row[c], float) else f"{row[c]:>12}"
+            for c in columns
+        ))
+    print("\nTimes in ms (best of %d)." % args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+"""
+SDK Benchmark Suite
+
+Measure every sub-client against an in-process mock API, with no network.
+
+For each call the suite reports requests per second, p50/p99 latency and
+peak bytes allocated per call; for each model it reports the time to
+parse 1,000 rows. Results are written as JSON so runs of two versions
+can be compared with ``--compare``.
+
+Usage:
+    python benchmarks/bench_sdk.py [--calls 2000] [--rows 100] [--output results.json]
+    python benchmarks/bench_sdk.py --compare baseline.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx  # noqa: E402
+
+import blackroad  # noqa: E402
+from blackroad import BlackRoadClient  # noqa: E402
+from blackroad.agents import Agent  # noqa: E402
+from blackroad.codec import get_codec  # noqa: E402
+from blackroad.codex import CodexComponent  # noqa: E402
+from blackroad.memory import MemoryEntry  # noqa: E402
+from blackroad.tasks import Task  # noqa: E402
+from blackroad.traffic import TrafficLight  # noqa: E402
+
+import payloads  # noqa: E402
+
+# Regression threshold used by --compare, as a fraction of the baseline.
+THRESHOLD = 0.10
+
+
+class MockAPI:
+    """Serve pre-encoded responses for the API routes the SDK uses."""
+
+    def __init__(self, rows: int):
+        agents = payloads.agents(rows)
+        entries = payloads.memory_entries(rows)
+        components = payloads.codex_components(rows)
+        self.routes: List[Tuple[str, "re.Pattern[str]", bytes]] = []
+        self.add("GET", r"/v1/agents", payloads.response_body("agents", agents))
+        self.add("GET", r"/v1/agents/[^/]+", json.dumps(agents[0]).encode())
+        self.add("POST", r"/v1/agents", json.dumps(agents[0]).encode())
+        self.add("PUT", r"/v1/agents/[^/]+", json.dumps(agents[0]).encode())
+        self.add("POST", r"/v1/agents/[^/]+/heartbeat", b'{"ok": true}')
+        self.add("GET", r"/v1/memory/search", payloads.response_body("entries", entries))
+        self.add("POST", r"/v1/memory/log", json.dumps(entries[0]).encode())
+        self.add("GET", r"/v1/memory/summary", b'{"entries": 1, "agents": 1}')
+        self.add("GET", r"/v1/codex/search", payloads.response_body("components", components))
+        self.add("GET", r"/v1/codex/stats", b'{"components": 22000, "repositories": 1085}')
+        self.add("GET", r"/v1/tasks", payloads.response_body("tasks", payloads.tasks(rows)))
+        self.add(
+            "GET",
+            r"/v1/traffic-lights",
+            payloads.response_body("projects", payloads.traffic_lights(rows)),
+        )
+
+    def add(self, method: str, pattern: str, body: bytes):
+        self.routes.append((method, re.compile(pattern + "$"), body))
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        for method, pattern, body in self.routes:
+            if method == request.method and pattern.match(path):
+                return httpx.Response(
+                    200, content=body, headers={"Content-Type": "application/json"}
+                )
+        return httpx.Response(404, json={"error": "not found"})
+
+
+def make_client(rows: int) -> BlackRoadClient:
+    client = BlackRoadClient(api_key="bench")
+    client._client = httpx.Client(
+        transport=httpx.MockTransport(MockAPI(rows)), base_url="http://bench"
+    )
+    return client
+
+
+def request_cases(client: BlackRoadClient, rows: int) -> List[Tuple[str, Callable[[], Any]]]:
+    """(name, call) for every benchmarked SDK entry point."""
+    return [
+        ("client.get", lambda: client.get("/v1/memory/summary")),
+        ("client.post", lambda: client.post("/v1/agents/a/heartbeat", data={})),
+        (f"agents.list[{rows}]", lambda: client.agents.list()),
+        ("agents.get", lambda: client.agents.get("agent_0000")),
+        ("agents.register", lambda: client.agents.register("bench", capabilities=["x"])),
+        ("agents.heartbeat", lambda: client.agents.heartbeat("agent_0000")),
+        (f"memory.search[{rows}]", lambda: client.memory.search(limit=rows)),
+        (f"memory.search_batch[{rows}]", lambda: client.memory.search_batch(limit=rows)),
+        ("memory.log", lambda: client.memory.log("progress", "bench", "step done", ["x"])),
+        (f"codex.search[{rows}]", lambda: client.codex.search("deploy", limit=rows)),
+        ("codex.stats", lambda: client.codex.stats()),
+        (f"tasks.list[{rows}]", lambda: client.tasks.list(status="available")),
+        (f"traffic_lights.list[{rows}]", lambda: client.traffic_lights.list()),
+    ]
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure_calls(fn: Callable[[], Any], calls: int, alloc_calls: int) -> Dict[str, float]:
+    for _ in range(min(50, calls)):
+        fn()
+
+    latencies = []
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(calls):
+        t0 = time.perf_counter_ns()
+        fn()
+        latencies.append(time.perf_counter_ns() - t0)
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    # Peak traced memory during a call, above what was live before it.
+    tracemalloc.start()
+    total = 0
+    for _ in range(alloc_calls):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        fn()
+        total += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    return {
+        "req_per_s": calls / elapsed,
+        "p50_us": percentile(latencies, 0.50) / 1000,
+        "p99_us": percentile(latencies, 0.99) / 1000,
+        "alloc_bytes": total / alloc_calls,
+    }
+
+
+def measure_parse(repeat: int) -> List[Dict[str, Any]]:
+    """Time to turn 1,000 rows into models, lazily and with every field read."""
+    codec = get_codec()
+    cases = [
+        ("Agent", "agents", Agent, payloads.agents(1000)),
+        ("MemoryEntry", "entries", MemoryEntry, payloads.memory_entries(1000)),
+        ("CodexComponent", "components", CodexComponent, payloads.codex_components(1000)),
+        ("Task", "tasks", Task, payloads.tasks(1000)),
+        ("TrafficLight", "projects", TrafficLight, payloads.traffic_lights(1000)),
+    ]
+    results = []
+    for name, key, model, rows in cases:
+        body = payloads.response_body(key, rows)
+
+        def decode():
+            return codec.decode(body, model, key)
+
+        def decode_read():
+            for item in codec.decode(body, model, key):
+                item.to_dict()
+
+        results.append({
+            "model": name,
+            "codec": codec.name,
+            "decode_ms_per_1k": best_of(decode, repeat),
+            "decode_read_ms_per_1k": best_of(decode_read, repeat),
+        })
+    return results
+
+
+def best_of(fn: Callable[[], object], repeat: int) -> float:
+    """Fastest wall time of ``repeat`` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(calls: int, rows: int, repeat: int, only: str = "") -> Dict[str, Any]:
+    client = make_client(rows)
+    requests = []
+    for name, fn in request_cases(client, rows):
+        if only and only not in name:
+            continue
+        requests.append(dict(name=name, **measure_calls(fn, calls, max(1, calls // 20))))
+    client.close()
+    return {
+        "sdk_version": blackroad.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "settings": {"calls": calls, "rows": rows, "repeat": repeat},
+        "requests": requests,
+        "parse": measure_parse(repeat),
+    }
+
+
+def print_results(results: Dict[str, Any]):
+    print(f"{'call':>28}{'req/s':>10}{'p50 us':>10}{'p99 us':>10}{'alloc B':>10}")
+    for row in results["requests"]:
+        print(
+            f"{row['name']:>28}{row['req_per_s']:>10.0f}{row['p50_us']:>10.1f}"
+            f"{row['p99_us']:>10.1f}{row['alloc_bytes']:>10.0f}"
+        )
+    print(f"\n{'model':>28}{'decode ms/1k':>14}{'+read ms/1k':>14}")
+    for row in results["parse"]:
+        print(
+            f"{row['model']:>28}{row['decode_ms_per_1k']:>14.2f}"
+            f"{row['decode_read_ms_per_1k']:>14.2f}"
+        )
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]) -> int:
+    """Print changes against ``baseline``; returns the number of regressions."""
+    # Metric name -> True when larger is better.
+    metrics = {
+        "req_per_s": True,
+        "p50_us": False,
+        "p99_us": False,
+        "alloc_bytes": False,
+        "decode_ms_per_1k": False,
+        "decode_read_ms_per_1k": False,
+    }
+    old = {row.get("name") or row["model"]: row for row in baseline["requests"] + baseline["parse"]}
+    regressions = 0
+    print(f"\nvs {baseline['sdk_version']} ({baseline['timestamp']}):")
+    for row in results["requests"] + results["parse"]:
+        name = row.get("name") or row["model"]
+        if name not in old:
+            continue
+        for metric, higher_is_better in metrics.items():
+            if metric not in row or not old[name].get(metric):
+                continue
+            change = row[metric] / old[name][metric] - 1
+            worse = -change if higher_is_better else change
+            if worse > THRESHOLD:
+                regressions += 1
+                print(f"  REGRESSION {name} {metric}: {change:+.1%}")
+            elif worse < -THRESHOLD:
+                print(f"  improved   {name} {metric}: {change:+.1%}")
+    print(f"{regressions} regression(s) beyond {THRESHOLD:.0%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", default="", help="run calls whose name contains this")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="JSON results of a previous run")
+    args = parser.parse_args()
+
+    results = run(args.calls, args.rows, args.repeat, args.only)
+    print_results(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nWrote {args.output}")
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        sys.exit(1 if compare(results, baseline) else 0)
+
+
+if __name__ == "__main__":
+    main()
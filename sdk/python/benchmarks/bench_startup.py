@@ -0,0 +1,117 @@
+"""
+Startup Benchmark
+
+Measure SDK import time and time to first request in fresh interpreters.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from statistics import median
+
+SDK_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Each snippet runs in a new interpreter and prints its timings as JSON.
+SNIPPETS = {
+    "import blackroad": """
+t0 = time.perf_counter()
+import blackroad
+out["total"] = time.perf_counter() - t0
+""",
+    "construct client": """
+t0 = time.perf_counter()
+from blackroad import BlackRoadClient
+client = BlackRoadClient(api_key="bench", base_url=URL)
+out["total"] = time.perf_counter() - t0
+""",
+    "first request": """
+t0 = time.perf_counter()
+from blackroad import BlackRoadClient
+client = BlackRoadClient(api_key="bench", base_url=URL)
+out["ready"] = time.perf_counter() - t0
+client.memory.summary()
+out["total"] = time.perf_counter() - t0
+""",
+}
+
+PRELUDE = """
+import json, os, sys, time
+URL = os.environ["BENCH_URL"]
+out = {}
+"""
+
+EPILOGUE = """
+out["httpx_loaded"] = "httpx" in sys.modules
+out["modules"] = len(sys.modules)
+print(json.dumps(out))
+"""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b'{"total_entries": 0}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def run_snippet(code: str, url: str) -> dict:
+    env = dict(os.environ, BENCH_URL=url, PYTHONPATH=SDK_ROOT)
+    result = subprocess.run(
+        [sys.executable, "-c", PRELUDE + code + EPILOGUE],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--json", help="Also write results to this file")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    results = {}
+    try:
+        for name, code in SNIPPETS.items():
+            runs = [run_snippet(code, url) for _ in range(args.runs)]
+            results[name] = {
+                "median_ms": median(r["total"] for r in runs) * 1000,
+                "min_ms": min(r["total"] for r in runs) * 1000,
+                "httpx_loaded": runs[-1]["httpx_loaded"],
+                "modules": runs[-1]["modules"],
+            }
+    finally:
+        server.shutdown()
+
+    print(f"{'phase':>18}{'median ms':>12}{'min ms':>10}{'httpx':>8}{'modules':>9}")
+    for name, r in results.items():
+        print(
+            f"{name:>18}{r['median_ms']:>12.1f}{r['min_ms']:>10.1f}"
+            f"{str(r['httpx_loaded']):>8}{r['modules']:>9}"
+        )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
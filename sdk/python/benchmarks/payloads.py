@@ -0,0 +1,120 @@
+"""
+Benchmark Payloads
+
+Deterministic, realistically shaped API responses shared by the benchmarks.
+"""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any
+
+ACTIONS = ["announce", "progress", "deployed", "created", "configured", "fixed"]
+TAGS = ["prod", "staging", "api", "infra", "agents", "codex", "memory", "ci"]
+LANGUAGES = ["python", "javascript", "typescript", "go", "rust"]
+TYPES = ["function", "class", "module"]
+WORDS = (
+    "agent registry memory journal codex search deploy route cache token "
+    "heartbeat worker queue stream index verify sync replica gateway"
+).split()
+
+
+def memory_entries(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Rows shaped like ``/v1/memory/search`` entries."""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    rows = []
+    previous = "0" * 64
+    for i in range(count):
+        digest = "%064x" % rng.getrandbits(256)
+        rows.append({
+            "id": f"mem_{i:08d}",
+            "timestamp": (start + timedelta(seconds=i * 7)).isoformat(),
+            "action": rng.choice(ACTIONS),
+            "entity": f"service-{rng.randrange(200)}",
+            "details": " ".join(rng.choice(WORDS) for _ in range(rng.randrange(8, 30))),
+            "tags": rng.sample(TAGS, rng.randrange(1, 4)),
+            "agent_id": f"agent_{rng.randrange(500):04d}",
+            "hash": digest,
+            "previous_hash": previous,
+        })
+        previous = digest
+    return rows
+
+
+def codex_components(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Rows shaped like ``/v1/codex/search`` components."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        name = "_".join(rng.choice(WORDS) for _ in range(rng.randrange(1, 4)))
+        rows.append({
+            "name": name,
+            "type": rng.choice(TYPES),
+            "language": rng.choice(LANGUAGES),
+            "file_path": f"src/{rng.choice(WORDS)}/{rng.choice(WORDS)}_{i % 97}.py",
+            "line_number": rng.randrange(1, 2000),
+            "signature": f"def {name}(self, {rng.choice(WORDS)}: str) -> None",
+            "docstring": " ".join(rng.choice(WORDS) for _ in range(rng.randrange(5, 40))),
+            "repository": f"BlackRoad-OS/{rng.choice(WORDS)}-{rng.randrange(40)}",
+        })
+    return rows
+
+
+def agents(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Rows shaped like ``/v1/agents`` entries."""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "id": f"agent_{i:04d}",
+            "name": f"{rng.choice(WORDS)}-{i}",
+            "type": rng.choice(["ai", "hardware", "hybrid"]),
+            "status": rng.choice(["active", "idle", "offline"]),
+            "capabilities": rng.sample(WORDS, rng.randrange(1, 6)),
+            "metadata": {"region": rng.choice(["us-east", "eu-west"]), "version": "1.4"},
+            "created_at": (start + timedelta(hours=i)).isoformat(),
+            "last_seen": (start + timedelta(days=30, minutes=i)).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+def tasks(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Rows shaped like ``/v1/tasks`` entries."""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "id": f"task_{i:05d}",
+            "title": " ".join(rng.choice(WORDS) for _ in range(rng.randrange(2, 6))),
+            "description": " ".join(rng.choice(WORDS) for _ in range(rng.randrange(10, 40))),
+            "status": "available",
+            "priority": rng.choice(["low", "medium", "high", "urgent"]),
+            "tags": rng.sample(TAGS, rng.randrange(1, 4)),
+            "requiredSkills": rng.sample(LANGUAGES, rng.randrange(0, 3)),
+            "createdAt": (start + timedelta(minutes=i)).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+def traffic_lights(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Rows shaped like ``/v1/traffic-lights`` projects."""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "projectId": f"{rng.choice(WORDS)}-{i}",
+            "status": rng.choices(["green", "yellow", "red"], [90, 8, 2])[0],
+            "reason": " ".join(rng.choice(WORDS) for _ in range(rng.randrange(2, 8))),
+            "updatedAt": (start + timedelta(minutes=i)).isoformat(),
+            "updatedBy": f"agent_{rng.randrange(500):04d}",
+        }
+        for i in range(count)
+    ]
+
+
+def response_body(key: str, rows: List[Dict[str, Any]]) -> bytes:
+    """Encode rows the way the API returns them."""
+    return json.dumps({key: rows, "total": len(rows)}).encode()
@@ -5,18 +5,138 @@ Official Python client for BlackRoad OS infrastructure.
 © 2026 BlackRoad OS, Inc.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 __author__ = "BlackRoad OS, Inc."
 
-from .client import BlackRoadClient
-from .agents import AgentRegistry, Agent
-from .memory import MemorySystem
-from .codex import CodexSearch
-
-__all__ = [
-    "BlackRoadClient",
-    "AgentRegistry",
-    "Agent",
-    "MemorySystem",
-    "CodexSearch",
-]
+# Public names are imported from their modules on first access, so
+# ``import blackroad`` stays cheap for short-lived scripts.
+_LAZY = {
+    "BlackRoadClient": ".client",
+    "AsyncBlackRoadClient": ".client",
+    "BlackRoadConfig": ".client",
+    "TransportConfig": ".client",
+    "PoolStats": ".client",
+    "RetryPolicy": ".retry",
+    "RateLimiter": ".retry",
+    "ResponseCache": ".cache",
+    "CacheStats": ".cache",
+    "CoalesceStats": ".coalesce",
+    "ConditionalCache": ".conditional",
+    "ConditionalStats": ".conditional",
+    "MemoryValidatorStore": ".conditional",
+    "DiskValidatorStore": ".conditional",
+    "RequestHook": ".metrics",
+    "RequestTrace": ".metrics",
+    "RequestMetrics": ".metrics",
+    "EndpointStats": ".metrics",
+    "CompressionConfig": ".compression",
+    "JSONCodec": ".codec",
+    "OrjsonCodec": ".codec",
+    "get_codec": ".codec",
+    "ModelBatch": ".models",
+    "BulkResult": ".bulk",
+    "AgentRegistry": ".agents",
+    "AsyncAgentRegistry": ".agents",
+    "Agent": ".agents",
+    "HeartbeatManager": ".heartbeat",
+    "HeartbeatStats": ".heartbeat",
+    "MemorySystem": ".memory",
+    "AsyncMemorySystem": ".memory",
+    "MemoryEntry": ".memory",
+    "MemoryLogBuffer": ".batching",
+    "MemoryOutbox": ".outbox",
+    "OutboxStats": ".outbox",
+    "MemoryReplica": ".replica",
+    "MemoryIndex": ".query",
+    "ColumnTable": ".columnar",
+    "ChainVerifier": ".verify",
+    "VerificationResult": ".verify",
+    "CodexSearch": ".codex",
+    "AsyncCodexSearch": ".codex",
+    "CodexComponent": ".codex",
+    "CodexSnapshot": ".snapshot",
+    "TaskQueue": ".tasks",
+    "AsyncTaskQueue": ".tasks",
+    "Task": ".tasks",
+    "TaskStats": ".tasks",
+    "TaskWorker": ".worker",
+    "TaskWorkerStats": ".worker",
+    "SkillIndex": ".worker",
+    "TrafficLights": ".traffic",
+    "AsyncTrafficLights": ".traffic",
+    "TrafficLight": ".traffic",
+    "TrafficLightSummary": ".traffic",
+    "TrafficLightChange": ".traffic",
+    "TrafficLightSnapshot": ".traffic",
+    "TrafficSnapshotStats": ".traffic",
+    "StandInServer": ".standin",
+    "FaultConfig": ".standin",
+    "run_load": ".loadgen",
+    "LoadReport": ".loadgen",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+if TYPE_CHECKING:
+    from .client import (
+        BlackRoadClient,
+        AsyncBlackRoadClient,
+        BlackRoadConfig,
+        TransportConfig,
+        PoolStats,
+    )
+    from .retry import RetryPolicy, RateLimiter
+    from .cache import ResponseCache, CacheStats
+    from .coalesce import CoalesceStats
+    from .conditional import (
+        ConditionalCache,
+        ConditionalStats,
+        MemoryValidatorStore,
+        DiskValidatorStore,
+    )
+    from .metrics import RequestHook, RequestTrace, RequestMetrics, EndpointStats
+    from .compression import CompressionConfig
+    from .codec import JSONCodec, OrjsonCodec, get_codec
+    from .models import ModelBatch
+    from .bulk import BulkResult
+    from .agents import AgentRegistry, AsyncAgentRegistry, Agent
+    from .heartbeat import HeartbeatManager, HeartbeatStats
+    from .memory import MemorySystem, AsyncMemorySystem, MemoryEntry
+    from .batching import MemoryLogBuffer
+    from .outbox import MemoryOutbox, OutboxStats
+    from .replica import MemoryReplica
+    from .query import MemoryIndex
+    from .columnar import ColumnTable
+    from .verify import ChainVerifier, VerificationResult
+    from .codex import CodexSearch, AsyncCodexSearch, CodexComponent
+    from .snapshot import CodexSnapshot
+    from .tasks import TaskQueue, AsyncTaskQueue, Task, TaskStats
+    from .worker import TaskWorker, TaskWorkerStats, SkillIndex
+    from .traffic import (
+        TrafficLights,
+        AsyncTrafficLights,
+        TrafficLight,
+        TrafficLightSummary,
+        TrafficLightChange,
+        TrafficLightSnapshot,
+        TrafficSnapshotStats,
+    )
+    from .standin import StandInServer, FaultConfig
+    from .loadgen import run_load, LoadReport
@@ -4,13 +4,34 @@ BlackRoad OS Agent Registry
 Manage AI agents in the BlackRoad ecosystem.
 """
 
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Any,
+    Iterable,
+    Iterator,
+    AsyncIterator,
+    Mapping,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
 from datetime import datetime
 
+from .models import Model, ModelBatch, Field, slots, parse_datetime
+from .pagination import iter_pages, aiter_pages, iter_items, aiter_items
 
-@dataclass
-class Agent:
+if TYPE_CHECKING:
+    from .bulk import BulkResult
+    from .heartbeat import HeartbeatManager
+
+
+AgentSpec = Union[str, Dict[str, Any]]
+AgentUpdates = Union[Mapping[str, Dict[str, Any]], Iterable[Tuple[str, Dict[str, Any]]]]
+
+
+class Agent(Model):
     """Represents a BlackRoad agent."""
     id: str
     name: str
@@ -19,21 +40,67 @@ class Agent:
     capabilities: List[str]
     metadata: Dict[str, Any]
     created_at: datetime
-    last_seen: Optional[datetime] = None
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Agent":
-        """Create Agent from API response."""
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            type=data["type"],
-            status=data["status"],
-            capabilities=data.get("capabilities", []),
-            metadata=data.get("metadata", {}),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            last_seen=datetime.fromisoformat(data["last_seen"]) if data.get("last_seen") else None,
-        )
+    last_seen: Optional[datetime]
+
+    _fields = (
+        Field("id"),
+        Field("name"),
+        Field("type"),
+        Field("status"),
+        Field("capabilities", default_factory=list),
+        Field("metadata", default_factory=dict),
+        Field("created_at", decode=parse_datetime),
+        Field("last_seen", decode=parse_datetime, default=None),
+    )
+    __slots__ = slots(*_fields)
+
+
+def _list_params(
+    type: Optional[str], status: Optional[str], limit: int
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"limit": limit}
+    if type:
+        params["type"] = type
+    if status:
+        params["status"] = status
+    return params
+
+
+def _register_body(
+    name: str,
+    type: str,
+    capabilities: Optional[List[str]],
+    metadata: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "type": type,
+        "capabilities": capabilities or [],
+        "metadata": metadata or {},
+    }
+
+
+def _register_args(spec: AgentSpec) -> Dict[str, Any]:
+    return {"name": spec} if isinstance(spec, str) else dict(spec)
+
+
+def _update_items(updates: AgentUpdates) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    return updates.items() if isinstance(updates, Mapping) else updates
+
+
+def _update_body(
+    status: Optional[str],
+    capabilities: Optional[List[str]],
+    metadata: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    data: Dict[str, Any] = {}
+    if status:
+        data["status"] = status
+    if capabilities:
+        data["capabilities"] = capabilities
+    if metadata:
+        data["metadata"] = metadata
+    return data
 
 
 class AgentRegistry:
@@ -57,19 +124,41 @@ class AgentRegistry:
         limit: int = 100,
     ) -> List[Agent]:
         """List all registered agents."""
-        params = {"limit": limit}
-        if type:
-            params["type"] = type
-        if status:
-            params["status"] = status
+        params = _list_params(type, status, limit)
+        return self._client.get("/v1/agents", params=params, model=Agent, key="agents")
 
+    def list_batch(
+        self,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+    ) -> ModelBatch[Agent]:
+        """List agents into a columnar :class:`~blackroad.models.ModelBatch`."""
+        params = _list_params(type, status, limit)
         response = self._client.get("/v1/agents", params=params)
-        return [Agent.from_dict(a) for a in response.get("agents", [])]
+        return ModelBatch(Agent, response.get("agents", []))
+
+    def iter_agents(
+        self,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        page_size: int = 100,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[Agent]:
+        """
+        Iterate over every matching agent, fetching pages lazily.
+
+        The next page is prefetched in the background while the current
+        one is consumed; at most two pages are held in memory.
+        """
+        params = _list_params(type, status, page_size)
+        pages = iter_pages(self._client.get, "/v1/agents", params, "agents", prefetch)
+        return iter_items(pages, Agent.from_dict, max_items)
 
     def get(self, agent_id: str) -> Agent:
         """Get a specific agent by ID."""
-        response = self._client.get(f"/v1/agents/{agent_id}")
-        return Agent.from_dict(response)
+        return self._client.get(f"/v1/agents/{agent_id}", model=Agent)
 
     def register(
         self,
@@ -79,14 +168,8 @@ class AgentRegistry:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> Agent:
         """Register a new agent."""
-        data = {
-            "name": name,
-            "type": type,
-            "capabilities": capabilities or [],
-            "metadata": metadata or {},
-        }
-        response = self._client.post("/v1/agents", data=data)
-        return Agent.from_dict(response)
+        data = _register_body(name, type, capabilities, metadata)
+        return self._client.post("/v1/agents", data=data, model=Agent)
 
     def update(
         self,
@@ -96,22 +179,210 @@ class AgentRegistry:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> Agent:
         """Update an existing agent."""
-        data = {}
-        if status:
-            data["status"] = status
-        if capabilities:
-            data["capabilities"] = capabilities
-        if metadata:
-            data["metadata"] = metadata
-
-        response = self._client.put(f"/v1/agents/{agent_id}", data=data)
-        return Agent.from_dict(response)
+        data = _update_body(status, capabilities, metadata)
+        return self._client.put(f"/v1/agents/{agent_id}", data=data, model=Agent)
 
     def heartbeat(self, agent_id: str) -> Dict[str, Any]:
         """Send a heartbeat for an agent."""
         return self._client.post(f"/v1/agents/{agent_id}/heartbeat", data={})
 
+    def heartbeats(self, interval: float = 30.0, **options) -> "HeartbeatManager":
+        """
+        Create a manager that keeps many agents alive from one scheduler.
+
+        Options are passed to :class:`~blackroad.heartbeat.HeartbeatManager`
+        (``resolution``, ``max_concurrency``, ``tolerance``,
+        ``deregister_on_close``).
+        """
+        from .heartbeat import HeartbeatManager
+
+        return HeartbeatManager(self, interval=interval, **options)
+
     def deregister(self, agent_id: str) -> bool:
         """Remove an agent from the registry."""
         self._client.delete(f"/v1/agents/{agent_id}")
         return True
+
+    def register_many(
+        self,
+        specs: Iterable[AgentSpec],
+        max_concurrency: int = 16,
+        ordered: bool = False,
+    ) -> Iterator["BulkResult[Agent]"]:
+        """
+        Register many agents concurrently, yielding a result per agent.
+
+        Each spec is a name or a dict of :meth:`register` arguments.
+        Failures are reported on their result rather than raised.
+
+        Example:
+            >>> specs = [{"name": f"worker-{i}", "type": "ai"} for i in range(500)]
+            >>> for result in client.agents.register_many(specs, max_concurrency=32):
+            ...     if not result.ok:
+            ...         print(result.item, result.error)
+        """
+        from .bulk import run_bulk
+
+        return run_bulk(
+            lambda spec: self.register(**_register_args(spec)),
+            specs,
+            max_concurrency,
+            ordered,
+        )
+
+    def update_many(
+        self,
+        updates: AgentUpdates,
+        max_concurrency: int = 16,
+        ordered: bool = False,
+    ) -> Iterator["BulkResult[Agent]"]:
+        """
+        Update many agents concurrently from ``{agent_id: changes}`` (or
+        ``(agent_id, changes)`` pairs), yielding a result per agent.
+        """
+        from .bulk import run_bulk
+
+        return run_bulk(
+            lambda pair: self.update(pair[0], **pair[1]),
+            _update_items(updates),
+            max_concurrency,
+            ordered,
+        )
+
+    def deregister_many(
+        self,
+        agent_ids: Iterable[str],
+        max_concurrency: int = 16,
+        ordered: bool = False,
+    ) -> Iterator["BulkResult[bool]"]:
+        """Deregister many agents concurrently, yielding a result per agent."""
+        from .bulk import run_bulk
+
+        return run_bulk(self.deregister, agent_ids, max_concurrency, ordered)
+
+
+class AsyncAgentRegistry:
+    """
+    Asyncio counterpart of :class:`AgentRegistry`.
+
+    Example:
+        >>> agents = await client.agents.list(type="ai")
+        >>> await client.agents.heartbeat(agents[0].id)
+    """
+
+    def __init__(self, client):
+        self._client = client
+
+    async def list(
+        self,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Agent]:
+        """List all registered agents."""
+        params = _list_params(type, status, limit)
+        return await self._client.get(
+            "/v1/agents", params=params, model=Agent, key="agents"
+        )
+
+    async def list_batch(
+        self,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+    ) -> ModelBatch[Agent]:
+        """List agents into a columnar :class:`~blackroad.models.ModelBatch`."""
+        params = _list_params(type, status, limit)
+        response = await self._client.get("/v1/agents", params=params)
+        return ModelBatch(Agent, response.get("agents", []))
+
+    def iter_agents(
+        self,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        page_size: int = 100,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Agent]:
+        """Iterate over every matching agent with ``async for``."""
+        params = _list_params(type, status, page_size)
+        pages = aiter_pages(self._client.get, "/v1/agents", params, "agents", prefetch)
+        return aiter_items(pages, Agent.from_dict, max_items)
+
+    async def get(self, agent_id: str) -> Agent:
+        """Get a specific agent by ID."""
+        return await self._client.get(f"/v1/agents/{agent_id}", model=Agent)
+
+    async def register(
+        self,
+        name: str,
+        type: str = "ai",
+        capabilities: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Agent:
+        """Register a new agent."""
+        data = _register_body(name, type, capabilities, metadata)
+        return await self._client.post("/v1/agents", data=data, model=Agent)
+
+    async def update(
+        self,
+        agent_id: str,
+        status: Optional[str] = None,
+        capabilities: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Agent:
+        """Update an existing agent."""
+        data = _update_body(status, capabilities, metadata)
+        return await self._client.put(f"/v1/agents/{agent_id}", data=data, model=Agent)
+
+    async def heartbeat(self, agent_id: str) -> Dict[str, Any]:
+        """Send a heartbeat for an agent."""
+        return await self._client.post(f"/v1/agents/{agent_id}/heartbeat", data={})
+
+    async def deregister(self, agent_id: str) -> bool:
+        """Remove an agent from the registry."""
+        await self._client.delete(f"/v1/agents/{agent_id}")
+        return True
+
+    def register_many(
+        self,
+        specs: Iterable[AgentSpec],
+        max_concurrency: int = 16,
+        ordered: bool = False,
+    ) -> AsyncIterator["BulkResult[Agent]"]:
+        """Register many agents concurrently; iterate results with ``async for``."""
+        from .bulk import arun_bulk
+
+        return arun_bulk(
+            lambda spec: self.register(**_register_args(spec)),
+            specs,
+            max_concurrency,
+            ordered,
+        )
+
+    def update_many(
+        self,
+        updates: AgentUpdates,
+        max_concurrency: int = 16,
+        ordered: bool = False,
+    ) -> AsyncIterator["BulkResult[Agent]"]:
+        """Update many agents concurrently; iterate results with ``async for``."""
+        from .bulk import arun_bulk
+
+        return arun_bulk(
+            lambda pair: self.update(pair[0], **pair[1]),
+            _update_items(updates),
+            max_concurrency,
+            ordered,
+        )
+
+    def deregister_many(
+        self,
+        agent_ids: Iterable[str],
+        max_concurrency: int = 16,
+        ordered: bool = False,
+    ) -> AsyncIterator["BulkResult[bool]"]:
+        """Deregister many agents concurrently; iterate results with ``async for``."""
+        from .bulk import arun_bulk
+
+        return arun_bulk(self.deregister, agent_ids, max_concurrency, ordered)
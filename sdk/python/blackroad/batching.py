@@ -0,0 +1,219 @@
+"""
+BlackRoad OS Memory Log Batching
+
+Buffer memory log entries in-process and flush them in the background.
+"""
+
+import json
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Optional, List, Dict, Any, Tuple
+
+from .memory import MemoryEntry, _log_body
+
+
+_Pending = Tuple[Dict[str, Any], "Future[MemoryEntry]", int]
+
+
+def _post_bulk(memory, endpoint: str, bodies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Log ``bodies`` in one request to a bulk endpoint; returns the raw stored entries."""
+    response = memory._client.post(endpoint, data={"entries": bodies})
+    entries = response.get("entries") if isinstance(response, dict) else None
+    if not isinstance(entries, list) or len(entries) != len(bodies):
+        raise ValueError(
+            f"Bulk log returned {len(entries or ())} entries for {len(bodies)} submitted"
+        )
+    return entries
+
+
+class MemoryLogBuffer:
+    """
+    Buffered, batched writer for ``MemorySystem.log``.
+
+    ``log()`` queues the entry and returns a ``Future`` immediately. A
+    background thread flushes the queue whenever ``batch_size`` entries or
+    ``max_bytes`` of payload are waiting, or the oldest entry has waited
+    ``flush_interval`` seconds. Batches go to ``bulk_endpoint`` in one
+    request when the server provides one, otherwise as up to
+    ``max_concurrency`` concurrent single-entry posts. Once that many
+    posts are in flight the flusher waits for one to finish, so the queue
+    fills and ``log()`` blocks when ``max_queue`` entries are waiting
+    rather than buffering without bound.
+
+    Example:
+        >>> with client.memory.buffered(batch_size=50) as buf:
+        ...     for step in steps:
+        ...         buf.log("progress", "etl-job", f"finished {step}")
+        ...     entry = buf.log("milestone", "etl-job", "done").result()
+        >>> print(entry.id)
+    """
+
+    def __init__(
+        self,
+        memory,
+        batch_size: int = 100,
+        max_bytes: int = 256 * 1024,
+        flush_interval: float = 1.0,
+        max_concurrency: int = 8,
+        max_queue: int = 10_000,
+        bulk_endpoint: Optional[str] = None,
+    ):
+        self._memory = memory
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.bulk_endpoint = bulk_endpoint
+
+        self._pending: List[_Pending] = []
+        self._pending_bytes = 0
+        self._oldest = 0.0
+        self._inflight: "set[Future[MemoryEntry]]" = set()
+        self._closed = False
+        self._cond = threading.Condition()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="blackroad-memlog"
+        )
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._thread = threading.Thread(
+            target=self._run, name="blackroad-memlog-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def log(
+        self,
+        action: str,
+        entity: str,
+        details: str,
+        tags: Optional[List[str]] = None,
+    ) -> "Future[MemoryEntry]":
+        """Queue an entry; the returned future resolves to the stored entry."""
+        body = _log_body(action, entity, details, tags)
+        size = len(json.dumps(body))
+        future: "Future[MemoryEntry]" = Future()
+        with self._cond:
+            while len(self._pending) >= self.max_queue and not self._closed:
+                self._cond.wait()
+            # Checked after the wait too: close() may run while we block.
+            if self._closed:
+                raise RuntimeError("MemoryLogBuffer is closed")
+            if not self._pending:
+                self._oldest = time.monotonic()
+            self._pending.append((body, future, size))
+            self._pending_bytes += size
+            self._inflight.add(future)
+            # The first entry starts the flush_interval clock for the flusher.
+            if len(self._pending) == 1 or self._due():
+                self._cond.notify_all()
+        future.add_done_callback(self._discard)
+        return future
+
+    def flush(self, timeout: Optional[float] = None):
+        """Send everything queued so far and wait for it to be acknowledged."""
+        with self._cond:
+            waiting = list(self._inflight)
+            batches = []
+            while self._pending:
+                batches.append(self._take())
+            self._cond.notify_all()
+        for batch in batches:
+            self._send(batch)
+        wait(waiting, timeout=timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        """Flush remaining entries and stop the background flusher."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        self.flush(timeout)
+        self._executor.shutdown(wait=True)
+
+    @property
+    def pending(self) -> int:
+        """Entries queued but not yet handed to the transport."""
+        with self._cond:
+            return len(self._pending)
+
+    def _discard(self, future: "Future[MemoryEntry]"):
+        with self._cond:
+            self._inflight.discard(future)
+
+    def _due(self) -> bool:
+        if not self._pending:
+            return False
+        return (
+            self._closed
+            or len(self._pending) >= self.batch_size
+            or self._pending_bytes >= self.max_bytes
+            or time.monotonic() - self._oldest >= self.flush_interval
+        )
+
+    def _take(self) -> List[_Pending]:
+        """Pop one batch, bounded by batch_size and max_bytes. Caller holds the lock."""
+        count, size = 0, 0
+        for _, _, entry_size in self._pending:
+            if count and (count >= self.batch_size or size + entry_size > self.max_bytes):
+                break
+            count += 1
+            size += entry_size
+        batch = self._pending[:count]
+        del self._pending[:count]
+        self._pending_bytes -= size
+        self._oldest = time.monotonic()
+        self._cond.notify_all()
+        return batch
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._due():
+                    if self._closed:
+                        return
+                    timeout = None
+                    if self._pending:
+                        elapsed = time.monotonic() - self._oldest
+                        timeout = max(0.0, self.flush_interval - elapsed)
+                    self._cond.wait(timeout)
+                batch = self._take()
+            self._send(batch)
+
+    def _send(self, batch: List[_Pending]):
+        if not batch:
+            return
+        if self.bulk_endpoint:
+            self._send_bulk(batch)
+        else:
+            for body, future, _ in batch:
+                self._slots.acquire()
+                self._executor.submit(self._send_one, body, future)
+
+    def _send_bulk(self, batch: List[_Pending]):
+        try:
+            entries = _post_bulk(
+                self._memory, self.bulk_endpoint, [body for body, _, _ in batch]
+            )
+        except Exception as exc:
+            for _, future, _ in batch:
+                future.set_exception(exc)
+            return
+        for (_, future, _), data in zip(batch, entries):
+            future.set_result(MemoryEntry.from_dict(data))
+
+    def _send_one(self, body: Dict[str, Any], future: "Future[MemoryEntry]"):
+        try:
+            response = self._memory._client.post("/v1/memory/log", data=body)
+            future.set_result(MemoryEntry.from_dict(response))
+        except Exception as exc:
+            future.set_exception(exc)
+        finally:
+            self._slots.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
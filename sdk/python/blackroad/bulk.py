@@ -0,0 +1,142 @@
+"""
+BlackRoad OS Bulk Operations
+
+Run many independent API calls with bounded concurrency and per-item results.
+"""
+
+from dataclasses import dataclass
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Callable,
+    Awaitable,
+    Iterable,
+    Iterator,
+    AsyncIterator,
+    Generic,
+    Tuple,
+    TypeVar,
+)
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class BulkResult(Generic[T]):
+    """Outcome of one item of a bulk operation."""
+    index: int
+    item: Any
+    value: Optional[T] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _window(max_concurrency: int) -> int:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    return max_concurrency * 2
+
+
+def run_bulk(
+    fn: Callable[[Any], T],
+    items: Iterable[Any],
+    max_concurrency: int = 16,
+    ordered: bool = False,
+) -> Iterator[BulkResult[T]]:
+    """
+    Call ``fn`` on every item using up to ``max_concurrency`` threads.
+
+    Results are yielded as calls finish (or in input order with
+    ``ordered``). A failing item yields a result carrying its exception
+    instead of stopping the run. ``items`` is consumed lazily, so at most a
+    couple of windows of work are held at once.
+    """
+    from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+    window = _window(max_concurrency)
+    source = enumerate(items)
+    pending: Dict[Any, Tuple[int, Any]] = {}
+    ready: Dict[int, BulkResult[T]] = {}
+    next_index = 0
+    pool = ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="blackroad-bulk"
+    )
+
+    def fill():
+        while len(pending) + len(ready) < window:
+            try:
+                index, item = next(source)
+            except StopIteration:
+                return
+            pending[pool.submit(fn, item)] = (index, item)
+
+    try:
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item = pending.pop(future)
+                error = future.exception()
+                result = BulkResult(
+                    index, item, None if error else future.result(), error
+                )
+                if not ordered:
+                    yield result
+                    continue
+                ready[index] = result
+                while next_index in ready:
+                    yield ready.pop(next_index)
+                    next_index += 1
+            fill()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def arun_bulk(
+    fn: Callable[[Any], Awaitable[T]],
+    items: Iterable[Any],
+    max_concurrency: int = 16,
+    ordered: bool = False,
+) -> AsyncIterator[BulkResult[T]]:
+    """Asyncio counterpart of :func:`run_bulk`, running calls as tasks."""
+    import asyncio
+
+    window = _window(max_concurrency)
+    source = enumerate(items)
+    pending: Dict[Any, Tuple[int, Any]] = {}
+    ready: Dict[int, BulkResult[T]] = {}
+    next_index = 0
+
+    def fill():
+        # Tasks are cheap, but only max_concurrency of them run at once.
+        while len(pending) + len(ready) < window and len(pending) < max_concurrency:
+            try:
+                index, item = next(source)
+            except StopIteration:
+                return
+            pending[asyncio.ensure_future(fn(item))] = (index, item)
+
+    try:
+        fill()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index, item = pending.pop(task)
+                error = task.exception()
+                result = BulkResult(index, item, None if error else task.result(), error)
+                if not ordered:
+                    yield result
+                    continue
+                ready[index] = result
+                while next_index in ready:
+                    yield ready.pop(next_index)
+                    next_index += 1
+            fill()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,244 @@
+"""
+BlackRoad OS Response Cache
+
+Size-bounded LRU cache with per-endpoint TTLs and stale-while-revalidate.
+"""
+
+import copy
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Awaitable, Callable, Hashable, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+@dataclass
+class CacheStats:
+    """Counters for a :class:`ResponseCache`."""
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    fresh_until: float
+    stale_until: float
+
+
+def normalize_params(params: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Canonical, hashable form of request parameters: keys are sorted and
+    values rendered as they are sent (lists comma-joined), never altered.
+    """
+    if not params:
+        return ()
+    items = []
+    for name, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = ",".join(str(v) for v in value)
+        items.append((name, str(value)))
+    return tuple(sorted(items))
+
+
+class ResponseCache:
+    """
+    LRU cache for read-only API results.
+
+    Results are grouped by name (``"search"``, ``"get"``, ``"stats"``,
+    ``"languages"``), and each name has a TTL during which results are
+    served from memory. For ``stale_ttl`` seconds after that, the stale
+    value is still returned immediately while a background refresh
+    fetches a new one. Entries are evicted least-recently-used once
+    ``max_entries`` is reached.
+
+    Hits return the cached objects themselves, so results must be treated
+    as read-only. Pass ``copy_values=True`` to get a deep copy on every
+    hit instead, at a much higher cost per hit.
+
+    Example:
+        >>> cache = ResponseCache(max_entries=2048, ttls={"search": 30})
+        >>> client = BlackRoadClient(codex_cache=cache)
+        >>> client.codex.search("auth")   # network
+        >>> client.codex.search("auth")   # memory
+        >>> cache.stats.hits
+        1
+    """
+
+    DEFAULT_TTLS = {
+        "search": 60.0,
+        "get": 300.0,
+        "stats": 300.0,
+        "languages": 3600.0,
+    }
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 60.0,
+        stale_ttl: float = 300.0,
+        refresh_workers: int = 2,
+        copy_values: bool = False,
+    ):
+        self.max_entries = max_entries
+        self.copy_values = copy_values
+        self.ttls = dict(self.DEFAULT_TTLS, **(ttls or {}))
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._refreshing: set = set()
+        self._tasks: set = set()
+        self._lock = threading.Lock()
+        self._refresh_workers = refresh_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_fetch(
+        self,
+        name: str,
+        params: Optional[Dict[str, Any]],
+        fetch: Callable[[], T],
+    ) -> T:
+        """Return the cached result for ``name`` and ``params``, fetching on a miss."""
+        key: CacheKey = (name, normalize_params(params))
+        with self._lock:
+            entry, stale = self._lookup(key)
+            if entry is not None:
+                if stale and key not in self._refreshing:
+                    self._refreshing.add(key)
+                    self._pool().submit(self._refresh, key, name, fetch)
+                return self._copy(entry.value)
+
+        value = fetch()
+        self._store(key, name, self._copy(value))
+        return value
+
+    async def aget_or_fetch(
+        self,
+        name: str,
+        params: Optional[Dict[str, Any]],
+        fetch: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Asyncio counterpart of :meth:`get_or_fetch`; stale entries refresh on a task."""
+        import asyncio
+
+        key: CacheKey = (name, normalize_params(params))
+        with self._lock:
+            entry, stale = self._lookup(key)
+            if entry is not None:
+                if stale and key not in self._refreshing:
+                    self._refreshing.add(key)
+                    task = asyncio.ensure_future(self._arefresh(key, name, fetch))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                return self._copy(entry.value)
+
+        value = await fetch()
+        self._store(key, name, self._copy(value))
+        return value
+
+    def invalidate(self, name: Optional[str] = None, path: Optional[str] = None):
+        """
+        Drop cached results for ``name`` (e.g. ``"search"``), for one API
+        ``path`` (e.g. ``"/v1/codex/stats"``), or everything.
+        """
+        with self._lock:
+            if name is None and path is None:
+                self._entries.clear()
+                return
+            for key in [
+                k for k in self._entries
+                if (name is None or k[0] == name)
+                and (path is None or ("_path", path) in k[1])
+            ]:
+                del self._entries[key]
+
+    def close(self):
+        """Stop the background refresh workers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _lookup(self, key: CacheKey) -> Tuple[Optional[_Entry], bool]:
+        """(entry, is stale) for a usable entry, counting the hit or miss. Caller holds the lock."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is None or now >= entry.stale_until:
+            self.stats.misses += 1
+            return None, False
+        self._entries.move_to_end(key)
+        if now < entry.fresh_until:
+            self.stats.hits += 1
+            return entry, False
+        self.stats.stale_hits += 1
+        return entry, True
+
+    def _copy(self, value: T) -> T:
+        return copy.deepcopy(value) if self.copy_values else value
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._refresh_workers,
+                thread_name_prefix="blackroad-cache",
+            )
+        return self._executor
+
+    def _store(self, key: CacheKey, name: str, value: Any):
+        ttl = self.ttls.get(name, self.default_ttl)
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = _Entry(value, now + ttl, now + ttl + self.stale_ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def _refresh(self, key: CacheKey, name: str, fetch: Callable[[], Any]):
+        try:
+            value = fetch()
+        except Exception:
+            with self._lock:
+                self.stats.refresh_errors += 1
+        else:
+            self._store(key, name, value)
+            with self._lock:
+                self.stats.refreshes += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    async def _arefresh(self, key: CacheKey, name: str, fetch: Callable[[], Awaitable[Any]]):
+        try:
+            value = await fetch()
+        except Exception:
+            with self._lock:
+                self.stats.refresh_errors += 1
+        else:
+            self._store(key, name, value)
+            with self._lock:
+                self.stats.refreshes += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
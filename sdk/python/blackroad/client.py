@@ -5,10 +5,58 @@ Main client for interacting with BlackRoad OS infrastructure.
 """
 
 import os
-import json
-import httpx
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
+import time
+import threading
+from functools import cached_property
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Type, TYPE_CHECKING
+from dataclasses import dataclass, field, replace
+
+from .retry import RetryPolicy, RateLimiter
+from .codec import JSONCodec, get_codec
+from .models import Model
+
+if TYPE_CHECKING:
+    import httpx
+    from .cache import ResponseCache
+    from .coalesce import CoalesceStats
+    from .conditional import ConditionalCache
+    from .metrics import RequestHook, RequestTrace
+    from .compression import CompressionConfig
+    from .agents import AgentRegistry, AsyncAgentRegistry
+    from .memory import MemorySystem, AsyncMemorySystem
+    from .codex import CodexSearch, AsyncCodexSearch
+    from .tasks import TaskQueue, AsyncTaskQueue
+    from .traffic import TrafficLights, AsyncTrafficLights
+
+
+@dataclass
+class TransportConfig:
+    """Connection pool and protocol settings for the HTTP transport."""
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 5.0
+    http2: bool = False
+
+    def limits(self) -> "httpx.Limits":
+        """Build the httpx pool limits for this configuration."""
+        import httpx
+
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclass
+class PoolStats:
+    """Point-in-time view of the connection pool."""
+    open: int = 0
+    idle: int = 0
+    in_use: int = 0
+    waiting: int = 0
+    max_connections: Optional[int] = None
+    http2: bool = False
 
 
 @dataclass
@@ -17,17 +65,24 @@ class BlackRoadConfig:
     api_key: str
     base_url: str = "https://api.blackroad.io"
     timeout: int = 30
+    transport: TransportConfig = field(default_factory=TransportConfig)
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    rate_limiter: Optional[RateLimiter] = None
+    codec: Optional[JSONCodec] = None
+    coalesce: bool = False
+    conditional_cache: Optional["ConditionalCache"] = None
+    hooks: Sequence["RequestHook"] = ()
+    compression: Optional["CompressionConfig"] = None
+    codex_cache: Optional["ResponseCache"] = None
 
 
-class BlackRoadClient:
+class _BaseClient:
     """
-    Main client for BlackRoad OS API.
+    Configuration and request plumbing shared by the sync and async clients.
 
-    Example:
-        >>> from blackroad import BlackRoadClient
-        >>> client = BlackRoadClient(api_key="br_...")
-        >>> agents = client.agents.list()
-        >>> print(f"Found {len(agents)} agents")
+    The httpx client is only built when the first request is made, and
+    sub-clients (``agents``, ``memory``, ``codex``) on first access, so
+    constructing a client is cheap.
     """
 
     def __init__(
@@ -35,33 +90,285 @@ class BlackRoadClient:
         api_key: Optional[str] = None,
         base_url: str = "https://api.blackroad.io",
         timeout: int = 30,
+        config: Optional[BlackRoadConfig] = None,
+        transport: Optional[TransportConfig] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        codec: Optional[JSONCodec] = None,
+        coalesce: Optional[bool] = None,
+        conditional_cache: Optional["ConditionalCache"] = None,
+        hooks: Optional[Sequence["RequestHook"]] = None,
+        compression: Optional["CompressionConfig"] = None,
+        codex_cache: Optional["ResponseCache"] = None,
     ):
-        self.api_key = api_key or os.environ.get("BLACKROAD_API_KEY")
-        if not self.api_key:
+        if config is None:
+            config = BlackRoadConfig(
+                api_key=api_key or os.environ.get("BLACKROAD_API_KEY") or "",
+                base_url=base_url,
+                timeout=timeout,
+            )
+        if transport is not None:
+            config = replace(config, transport=transport)
+        if retry is not None:
+            config = replace(config, retry=retry)
+        if rate_limiter is not None:
+            config = replace(config, rate_limiter=rate_limiter)
+        if codec is not None:
+            config = replace(config, codec=codec)
+        if coalesce is not None:
+            config = replace(config, coalesce=coalesce)
+        if conditional_cache is not None:
+            config = replace(config, conditional_cache=conditional_cache)
+        if hooks is not None:
+            config = replace(config, hooks=tuple(hooks))
+        if compression is not None:
+            config = replace(config, compression=compression)
+        if codex_cache is not None:
+            config = replace(config, codex_cache=codex_cache)
+        if not config.api_key:
             raise ValueError(
                 "API key required. Pass api_key or set BLACKROAD_API_KEY env var."
             )
 
-        self.base_url = base_url.rstrip("/")
-        self.timeout = timeout
-        self._client = httpx.Client(
-            base_url=self.base_url,
-            timeout=timeout,
-            headers={
+        self.config = config
+        self.api_key = config.api_key
+        self.base_url = config.base_url.rstrip("/")
+        self.timeout = config.timeout
+        self.transport = config.transport
+        self.retry = config.retry
+        self.rate_limiter = config.rate_limiter
+        self.codec = config.codec or get_codec()
+        self._http = None
+        self._http_lock = threading.Lock()
+        self._flight = self._create_flight() if config.coalesce else None
+        self.conditional_cache = config.conditional_cache
+        self.hooks = tuple(config.hooks)
+        self.compression = config.compression
+        self._codex_cache = config.codex_cache
+
+    @property
+    def _client(self):
+        """The underlying httpx client, created on first use."""
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    self._http = self._create_client()
+        return self._http
+
+    @_client.setter
+    def _client(self, client):
+        self._http = client
+
+    def _create_client(self):
+        raise NotImplementedError
+
+    def _create_flight(self):
+        raise NotImplementedError
+
+    def _flight_key(
+        self, endpoint: str, params: Optional[Dict[str, Any]], headers: Dict[str, str]
+    ):
+        from .coalesce import flight_key
+
+        return (flight_key(endpoint, params), tuple(sorted(headers.items())))
+
+    def coalesce_stats(self) -> "CoalesceStats":
+        """
+        How many GET requests were made, sent, and collapsed into a call
+        already in flight. All zero when coalescing is off.
+        """
+        from .coalesce import CoalesceStats
+
+        if self._flight is None:
+            return CoalesceStats()
+        return replace(self._flight.stats)
+
+    def _client_options(self) -> Dict[str, Any]:
+        """Keyword arguments for the underlying httpx client."""
+        if self.transport.http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "HTTP/2 support requires the 'h2' package. "
+                    "Install it with: pip install blackroad[http2]"
+                ) from None
+        from .compression import CompressionConfig
+
+        compression = self.compression or CompressionConfig()
+        return {
+            "base_url": self.base_url,
+            "timeout": self.timeout,
+            "limits": self.transport.limits(),
+            "http2": self.transport.http2,
+            "headers": {
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json",
+                "Accept-Encoding": compression.accept_encoding(),
                 "User-Agent": "blackroad-python/0.1.0",
             },
+        }
+
+    def _compress(
+        self, content: Optional[bytes], trace: Optional["RequestTrace"] = None
+    ) -> Tuple[Optional[bytes], Optional[Dict[str, str]]]:
+        """Compress a request body at or over the configured size threshold."""
+        compression = self.compression
+        if (
+            content is None
+            or compression is None
+            or compression.request_threshold is None
+            or len(content) < compression.request_threshold
+        ):
+            return content, None
+        headers = {"Content-Encoding": compression.request_encoding}
+        if trace is None:
+            return compression.compress(content), headers
+        return trace.compress(compression, content), headers
+
+    def pool_stats(self) -> PoolStats:
+        """
+        Report how many pooled connections are open, idle and in use,
+        and how many requests are queued waiting for a connection.
+        """
+        stats = PoolStats(
+            max_connections=self.transport.max_connections,
+            http2=self.transport.http2,
+        )
+        # httpcore keeps its bookkeeping private; transports without a
+        # pool (mock or custom transports) report an empty pool, as does a
+        # client that has not sent anything yet.
+        pool = getattr(getattr(self._http, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "_connections", []))
+        requests = list(getattr(pool, "_requests", []))
+
+        stats.open = len(connections)
+        stats.idle = sum(1 for c in connections if c.is_idle())
+        stats.in_use = stats.open - stats.idle
+        stats.waiting = sum(1 for r in requests if r.is_queued())
+        return stats
+
+    def _retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional["httpx.Response"] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """Delay before retrying, or None if the failure should be raised."""
+        delay = self.retry.retry_delay(method, attempt, response, error)
+        if (
+            delay is not None
+            and response is not None
+            and response.status_code == 429
+            and self.rate_limiter is not None
+        ):
+            self.rate_limiter.pause(delay)
+        return delay
+
+
+class BlackRoadClient(_BaseClient):
+    """
+    Main client for BlackRoad OS API.
+
+    Example:
+        >>> from blackroad import BlackRoadClient
+        >>> client = BlackRoadClient(api_key="br_...")
+        >>> agents = client.agents.list()
+        >>> print(f"Found {len(agents)} agents")
+
+    Pool sizing, keep-alive and HTTP/2 are set with ``transport``:
+        >>> client = BlackRoadClient(
+        ...     api_key="br_...",
+        ...     transport=TransportConfig(max_connections=200, http2=True),
+        ... )
+        >>> client.pool_stats()
+        PoolStats(open=0, idle=0, in_use=0, waiting=0, max_connections=200, http2=True)
+
+    Identical concurrent GETs can share one HTTP call with ``coalesce``:
+        >>> client = BlackRoadClient(api_key="br_...", coalesce=True)
+        >>> client.coalesce_stats()
+        CoalesceStats(requests=0, executed=0, coalesced=0)
+
+    Polled GETs can be revalidated with ETags via ``conditional_cache``:
+        >>> client = BlackRoadClient(api_key="br_...", conditional_cache=ConditionalCache())
+
+    Codex reads can be cached in-process with ``codex_cache``:
+        >>> client = BlackRoadClient(api_key="br_...", codex_cache=ResponseCache())
+
+    JSON is handled by ``codec`` (orjson when installed, else the stdlib):
+        >>> client = BlackRoadClient(api_key="br_...", codec=get_codec("json"))
+
+    Large request bodies can be gzipped with ``compression``:
+        >>> client = BlackRoadClient(
+        ...     api_key="br_...", compression=CompressionConfig(request_threshold=4096)
+        ... )
+
+    Request phases can be observed with ``hooks``, e.g. for metrics:
+        >>> client = BlackRoadClient(api_key="br_...", hooks=[RequestMetrics()])
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = "https://api.blackroad.io",
+        timeout: int = 30,
+        config: Optional[BlackRoadConfig] = None,
+        transport: Optional[TransportConfig] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        codec: Optional[JSONCodec] = None,
+        coalesce: Optional[bool] = None,
+        conditional_cache: Optional["ConditionalCache"] = None,
+        hooks: Optional[Sequence["RequestHook"]] = None,
+        compression: Optional["CompressionConfig"] = None,
+        *,
+        codex_cache: Optional["ResponseCache"] = None,
+    ):
+        super().__init__(
+            api_key, base_url, timeout, config, transport, retry, rate_limiter,
+            codec, coalesce, conditional_cache, hooks, compression, codex_cache,
         )
 
-        # Initialize sub-clients
+    def _create_client(self) -> "httpx.Client":
+        import httpx
+
+        return httpx.Client(**self._client_options())
+
+    def _create_flight(self):
+        from .coalesce import SingleFlight
+
+        return SingleFlight()
+
+    @cached_property
+    def agents(self) -> "AgentRegistry":
         from .agents import AgentRegistry
+
+        return AgentRegistry(self)
+
+    @cached_property
+    def memory(self) -> "MemorySystem":
         from .memory import MemorySystem
+
+        return MemorySystem(self)
+
+    @cached_property
+    def codex(self) -> "CodexSearch":
         from .codex import CodexSearch
 
-        self.agents = AgentRegistry(self)
-        self.memory = MemorySystem(self)
-        self.codex = CodexSearch(self)
+        return CodexSearch(self, cache=self._codex_cache)
+
+    @cached_property
+    def tasks(self) -> "TaskQueue":
+        from .tasks import TaskQueue
+
+        return TaskQueue(self)
+
+    @cached_property
+    def traffic_lights(self) -> "TrafficLights":
+        from .traffic import TrafficLights
+
+        return TrafficLights(self)
 
     def request(
         self,
@@ -69,16 +376,133 @@ class BlackRoadClient:
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        """Make an API request."""
-        response = self._client.request(
-            method=method,
-            url=endpoint,
-            json=data,
-            params=params,
+        model: Optional[Type[Model]] = None,
+        key: Optional[str] = None,
+    ) -> Any:
+        """
+        Make an API request, retrying per the client's RetryPolicy.
+
+        The body is encoded and the response decoded with the client's
+        codec; ``model`` and ``key`` are passed to :meth:`JSONCodec.decode`.
+        With coalescing on, identical concurrent GETs share one HTTP call;
+        with a conditional cache, GETs are revalidated rather than re-fetched.
+        With ``hooks``, each phase of the request is reported to them.
+        """
+        if self.hooks:
+            return self._traced_request(method, endpoint, data, params, model, key)
+        if method != "GET" or data is not None:
+            content = self.codec.dumps(data) if data is not None else None
+            content, headers = self._compress(content)
+            response = self._send(method, endpoint, content, params, headers)
+        elif self.conditional_cache is not None:
+            return self.conditional_cache.fetch(
+                endpoint,
+                params,
+                lambda headers: self._get(endpoint, params, headers),
+                self.codec.decode,
+                model,
+                key,
+            )
+        else:
+            response = self._get(endpoint, params, {})
+        return self.codec.decode(response.content, model, key)
+
+    def _traced_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        model: Optional[Type[Model]],
+        key: Optional[str],
+    ) -> Any:
+        """:meth:`request` reporting its phases to ``self.hooks``."""
+        from .metrics import RequestTrace
+
+        trace = RequestTrace(method, endpoint, self.hooks)
+        try:
+            if method != "GET" or data is not None:
+                content = trace.encode(self.codec, data) if data is not None else None
+                content, headers = self._compress(content, trace)
+                response = self._send(method, endpoint, content, params, headers, trace)
+            elif self.conditional_cache is not None:
+                value = self.conditional_cache.fetch(
+                    endpoint,
+                    params,
+                    lambda headers: self._get(endpoint, params, headers, trace),
+                    lambda body, model, key: trace.decode(self.codec, body, model, key),
+                    model,
+                    key,
+                )
+                return trace.finish(value)
+            else:
+                response = self._get(endpoint, params, {}, trace)
+            return trace.finish(trace.decode(self.codec, response.content, model, key))
+        except BaseException as exc:
+            trace.finish(error=exc)
+            raise
+
+    def _get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        trace: Optional["RequestTrace"] = None,
+    ) -> "httpx.Response":
+        """GET, sharing the call with identical concurrent GETs if coalescing."""
+        if self._flight is None:
+            return self._send("GET", endpoint, None, params, headers, trace)
+        return self._flight.do(
+            self._flight_key(endpoint, params, headers),
+            lambda: self._send("GET", endpoint, None, params, headers, trace),
         )
-        response.raise_for_status()
-        return response.json()
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        content: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]] = None,
+        trace: Optional["RequestTrace"] = None,
+    ) -> "httpx.Response":
+        """Send until a successful response or a failure that is not retried."""
+        import httpx
+
+        http = self._client
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            if trace is not None:
+                trace.attempt(content)
+            try:
+                response = http.request(
+                    method=method,
+                    url=endpoint,
+                    content=content,
+                    params=params,
+                    headers=headers,
+                    extensions=trace.extensions if trace is not None else None,
+                )
+            except httpx.TransportError as exc:
+                if trace is not None:
+                    trace.received(None)
+                delay = self._retry_delay(method, attempt, error=exc)
+                if delay is None:
+                    raise
+            else:
+                if trace is not None:
+                    trace.received(response)
+                if not response.is_error:
+                    return response
+                delay = self._retry_delay(method, attempt, response=response)
+                if delay is None:
+                    response.raise_for_status()
+            if trace is not None:
+                trace.backoff(delay)
+            time.sleep(delay)
+            attempt += 1
 
     def get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """GET request."""
@@ -96,12 +520,299 @@ class BlackRoadClient:
         """DELETE request."""
         return self.request("DELETE", endpoint, **kwargs)
 
+    def get_response(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> "httpx.Response":
+        """
+        GET ``endpoint`` and return the undecoded response.
+
+        For callers that revalidate with their own ``If-None-Match`` /
+        ``If-Modified-Since`` headers and need to see a 304. Retries, rate
+        limiting, coalescing and ``hooks`` apply as in :meth:`request`.
+        """
+        if not self.hooks:
+            return self._get(endpoint, params, headers or {})
+        from .metrics import RequestTrace
+
+        trace = RequestTrace("GET", endpoint, self.hooks)
+        try:
+            return trace.finish(self._get(endpoint, params, headers or {}, trace))
+        except BaseException as exc:
+            trace.finish(error=exc)
+            raise
+
     def close(self):
         """Close the client connection."""
-        self._client.close()
+        if self._http is not None:
+            self._http.close()
 
     def __enter__(self):
         return self
 
     def __exit__(self, *args):
         self.close()
+
+
+class AsyncBlackRoadClient(_BaseClient):
+    """
+    Asyncio client for BlackRoad OS API.
+
+    Mirrors :class:`BlackRoadClient` on top of ``httpx.AsyncClient`` so a
+    single event loop can keep many requests in flight.
+
+    Example:
+        >>> import asyncio
+        >>> from blackroad import AsyncBlackRoadClient
+        >>> async def main():
+        ...     async with AsyncBlackRoadClient(api_key="br_...") as client:
+        ...         agents, results = await asyncio.gather(
+        ...             client.agents.list(),
+        ...             client.codex.search("auth"),
+        ...         )
+        >>> asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = "https://api.blackroad.io",
+        timeout: int = 30,
+        config: Optional[BlackRoadConfig] = None,
+        transport: Optional[TransportConfig] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        codec: Optional[JSONCodec] = None,
+        coalesce: Optional[bool] = None,
+        conditional_cache: Optional["ConditionalCache"] = None,
+        hooks: Optional[Sequence["RequestHook"]] = None,
+        compression: Optional["CompressionConfig"] = None,
+        *,
+        codex_cache: Optional["ResponseCache"] = None,
+    ):
+        super().__init__(
+            api_key, base_url, timeout, config, transport, retry, rate_limiter,
+            codec, coalesce, conditional_cache, hooks, compression, codex_cache,
+        )
+
+    def _create_client(self) -> "httpx.AsyncClient":
+        import httpx
+
+        return httpx.AsyncClient(**self._client_options())
+
+    def _create_flight(self):
+        from .coalesce import AsyncSingleFlight
+
+        return AsyncSingleFlight()
+
+    @cached_property
+    def agents(self) -> "AsyncAgentRegistry":
+        from .agents import AsyncAgentRegistry
+
+        return AsyncAgentRegistry(self)
+
+    @cached_property
+    def memory(self) -> "AsyncMemorySystem":
+        from .memory import AsyncMemorySystem
+
+        return AsyncMemorySystem(self)
+
+    @cached_property
+    def codex(self) -> "AsyncCodexSearch":
+        from .codex import AsyncCodexSearch
+
+        return AsyncCodexSearch(self, cache=self._codex_cache)
+
+    @cached_property
+    def tasks(self) -> "AsyncTaskQueue":
+        from .tasks import AsyncTaskQueue
+
+        return AsyncTaskQueue(self)
+
+    @cached_property
+    def traffic_lights(self) -> "AsyncTrafficLights":
+        from .traffic import AsyncTrafficLights
+
+        return AsyncTrafficLights(self)
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        model: Optional[Type[Model]] = None,
+        key: Optional[str] = None,
+    ) -> Any:
+        """
+        Make an API request, retrying per the client's RetryPolicy.
+
+        The body is encoded and the response decoded with the client's
+        codec; ``model`` and ``key`` are passed to :meth:`JSONCodec.decode`.
+        With coalescing on, identical concurrent GETs share one HTTP call;
+        with a conditional cache, GETs are revalidated rather than re-fetched.
+        With ``hooks``, each phase of the request is reported to them.
+        """
+        if self.hooks:
+            return await self._traced_request(method, endpoint, data, params, model, key)
+        if method != "GET" or data is not None:
+            content = self.codec.dumps(data) if data is not None else None
+            content, headers = self._compress(content)
+            response = await self._send(method, endpoint, content, params, headers)
+        elif self.conditional_cache is not None:
+            return await self.conditional_cache.afetch(
+                endpoint,
+                params,
+                lambda headers: self._get(endpoint, params, headers),
+                self.codec.decode,
+                model,
+                key,
+            )
+        else:
+            response = await self._get(endpoint, params, {})
+        return self.codec.decode(response.content, model, key)
+
+    async def _traced_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        model: Optional[Type[Model]],
+        key: Optional[str],
+    ) -> Any:
+        """:meth:`request` reporting its phases to ``self.hooks``."""
+        from .metrics import RequestTrace
+
+        trace = RequestTrace(method, endpoint, self.hooks).use_async()
+        try:
+            if method != "GET" or data is not None:
+                content = trace.encode(self.codec, data) if data is not None else None
+                content, headers = self._compress(content, trace)
+                response = await self._send(method, endpoint, content, params, headers, trace)
+            elif self.conditional_cache is not None:
+                value = await self.conditional_cache.afetch(
+                    endpoint,
+                    params,
+                    lambda headers: self._get(endpoint, params, headers, trace),
+                    lambda body, model, key: trace.decode(self.codec, body, model, key),
+                    model,
+                    key,
+                )
+                return trace.finish(value)
+            else:
+                response = await self._get(endpoint, params, {}, trace)
+            return trace.finish(trace.decode(self.codec, response.content, model, key))
+        except BaseException as exc:
+            trace.finish(error=exc)
+            raise
+
+    async def _get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+        trace: Optional["RequestTrace"] = None,
+    ) -> "httpx.Response":
+        """GET, sharing the call with identical concurrent GETs if coalescing."""
+        if self._flight is None:
+            return await self._send("GET", endpoint, None, params, headers, trace)
+        return await self._flight.do(
+            self._flight_key(endpoint, params, headers),
+            lambda: self._send("GET", endpoint, None, params, headers, trace),
+        )
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        content: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]] = None,
+        trace: Optional["RequestTrace"] = None,
+    ) -> "httpx.Response":
+        """Send until a successful response or a failure that is not retried."""
+        import asyncio
+        import httpx
+
+        http = self._client
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            if trace is not None:
+                trace.attempt(content)
+            try:
+                response = await http.request(
+                    method=method,
+                    url=endpoint,
+                    content=content,
+                    params=params,
+                    headers=headers,
+                    extensions=trace.extensions if trace is not None else None,
+                )
+            except httpx.TransportError as exc:
+                if trace is not None:
+                    trace.received(None)
+                delay = self._retry_delay(method, attempt, error=exc)
+                if delay is None:
+                    raise
+            else:
+                if trace is not None:
+                    trace.received(response)
+                if not response.is_error:
+                    return response
+                delay = self._retry_delay(method, attempt, response=response)
+                if delay is None:
+                    response.raise_for_status()
+            if trace is not None:
+                trace.backoff(delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """GET request."""
+        return await self.request("GET", endpoint, **kwargs)
+
+    async def post(self, endpoint: str, data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """POST request."""
+        return await self.request("POST", endpoint, data=data, **kwargs)
+
+    async def put(self, endpoint: str, data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """PUT request."""
+        return await self.request("PUT", endpoint, data=data, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """DELETE request."""
+        return await self.request("DELETE", endpoint, **kwargs)
+
+    async def get_response(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> "httpx.Response":
+        """Asyncio counterpart of :meth:`BlackRoadClient.get_response`."""
+        if not self.hooks:
+            return await self._get(endpoint, params, headers or {})
+        from .metrics import RequestTrace
+
+        trace = RequestTrace("GET", endpoint, self.hooks).use_async()
+        try:
+            return trace.finish(await self._get(endpoint, params, headers or {}, trace))
+        except BaseException as exc:
+            trace.finish(error=exc)
+            raise
+
+    async def aclose(self):
+        """Close the client connection."""
+        if self._http is not None:
+            await self._http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
@@ -0,0 +1,121 @@
+"""
+BlackRoad OS Request Coalescing
+
+Single-flight execution of identical concurrent GET requests.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Callable, Awaitable, Hashable, TypeVar
+
+from .cache import normalize_params
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class CoalesceStats:
+    """Counters for request coalescing."""
+    requests: int = 0
+    executed: int = 0
+    coalesced: int = 0
+
+    @property
+    def coalesced_ratio(self) -> float:
+        return self.coalesced / self.requests if self.requests else 0.0
+
+
+def flight_key(endpoint: str, params: Optional[Dict[str, Any]]) -> Hashable:
+    """Identity of a GET request for coalescing."""
+    return (endpoint, normalize_params(params))
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Share one in-flight call between threads asking for the same key.
+
+    The first caller for a key runs ``fn``; callers arriving before it
+    finishes wait and receive the same result or exception.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> flight.do(("GET", "/v1/codex/stats"), fetch_stats)
+        >>> flight.stats
+        CoalesceStats(requests=1, executed=1, coalesced=0)
+    """
+
+    def __init__(self):
+        self.stats = CoalesceStats()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn``, or wait for the identical call already running."""
+        with self._lock:
+            self.stats.requests += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats.executed += 1
+            else:
+                self.stats.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio counterpart of :class:`SingleFlight`.
+
+    The shared call runs as its own task, so cancelling one waiter does not
+    cancel the request for the others.
+    """
+
+    def __init__(self):
+        self.stats = CoalesceStats()
+        self._tasks: Dict[Hashable, Any] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()``, or the identical call already running."""
+        import asyncio
+
+        self.stats.requests += 1
+        task = self._tasks.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.stats.executed += 1
+        else:
+            self.stats.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
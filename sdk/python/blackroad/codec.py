@@ -0,0 +1,130 @@
+"""
+BlackRoad OS JSON Codecs
+
+Pluggable JSON encoding and decoding, using orjson when it is installed.
+"""
+
+import json
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Type, TypeVar, Union
+
+from .models import Model
+
+
+M = TypeVar("M", bound=Model)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Model):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    """
+    Standard-library codec, always available.
+
+    :meth:`decode` turns a response body straight into model objects. The
+    models wrap the decoded rows without copying them (see
+    :class:`~blackroad.models.Model`), so the body is walked exactly once.
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), default=_default).encode()
+
+    def decode(
+        self,
+        data: Union[bytes, str],
+        model: Optional[Type[M]] = None,
+        key: Optional[str] = None,
+    ) -> Any:
+        """
+        Decode a response body.
+
+        With ``key`` the list under that key is returned; with ``model``
+        rows (or the whole body, if no ``key``) become model instances.
+        """
+        return self.build(self.loads(data), model, key)
+
+    def build(
+        self,
+        payload: Any,
+        model: Optional[Type[M]] = None,
+        key: Optional[str] = None,
+    ) -> Any:
+        """The model-building half of :meth:`decode`, for an already parsed body."""
+        if key is not None:
+            payload = payload.get(key, [])
+            if model is not None:
+                from_dict = model.from_dict
+                return [from_dict(row) for row in payload]
+            return payload
+        if model is not None:
+            return model.from_dict(payload)
+        return payload
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by ``orjson`` (``pip install blackroad[fast]``)."""
+
+    name = "orjson"
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError(
+                "The orjson codec requires the 'orjson' package. "
+                "Install it with: pip install blackroad[fast]"
+            ) from None
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj, default=_default, option=self._options)
+
+
+CODECS: Dict[str, Type[JSONCodec]] = {
+    "json": JSONCodec,
+    "orjson": OrjsonCodec,
+}
+
+
+def available_codecs() -> List[str]:
+    """Names of the codecs that can be used in this environment."""
+    names = []
+    for name, codec in CODECS.items():
+        try:
+            codec()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Build a codec by name, or the fastest one installed when ``name`` is None.
+    """
+    if name is not None:
+        if name not in CODECS:
+            raise ValueError(f"Unknown codec {name!r}; choose from {sorted(CODECS)}")
+        return CODECS[name]()
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JSONCodec()
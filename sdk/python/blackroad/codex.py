@@ -4,34 +4,68 @@ BlackRoad OS Codex Search
 Search the indexed codebase of 22,000+ components.
 """
 
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Any,
+    Iterator,
+    AsyncIterator,
+    Type,
+    TYPE_CHECKING,
+)
 
+from .models import Model, ModelBatch, Field, slots
+from .pagination import iter_pages, aiter_pages, iter_items, aiter_items
+from .cache import ResponseCache
 
-@dataclass
-class CodexComponent:
+if TYPE_CHECKING:
+    from .columnar import ColumnTable
+    from .snapshot import CodexSnapshot
+
+
+class CodexComponent(Model):
     """A component from the Codex index."""
     name: str
     type: str  # 'function', 'class', 'module'
     language: str
     file_path: str
     line_number: int
-    signature: Optional[str] = None
-    docstring: Optional[str] = None
-    repository: Optional[str] = None
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "CodexComponent":
-        return cls(
-            name=data["name"],
-            type=data["type"],
-            language=data["language"],
-            file_path=data["file_path"],
-            line_number=data["line_number"],
-            signature=data.get("signature"),
-            docstring=data.get("docstring"),
-            repository=data.get("repository"),
-        )
+    signature: Optional[str]
+    docstring: Optional[str]
+    repository: Optional[str]
+
+    _fields = (
+        Field("name"),
+        Field("type"),
+        Field("language"),
+        Field("file_path"),
+        Field("line_number"),
+        Field("signature", default=None),
+        Field("docstring", default=None),
+        Field("repository", default=None),
+    )
+    __slots__ = slots(*_fields)
+
+
+def _search_params(
+    query: str,
+    type: Optional[str],
+    language: Optional[str],
+    repository: Optional[str],
+    limit: int,
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {
+        "q": query,
+        "limit": limit,
+    }
+    if type:
+        params["type"] = type
+    if language:
+        params["language"] = language
+    if repository:
+        params["repository"] = repository
+    return params
 
 
 class CodexSearch:
@@ -48,10 +82,30 @@ class CodexSearch:
         >>> results = codex.search("agent registry")
         >>> for comp in results:
         ...     print(f"{comp.name} ({comp.type}) in {comp.file_path}")
+
+    Reads (``search``, ``get``, ``stats``, ``languages``) are served from
+    ``cache`` when one is configured.
     """
 
-    def __init__(self, client):
+    def __init__(self, client, cache: Optional[ResponseCache] = None):
         self._client = client
+        self.cache = cache
+
+    def _cached(
+        self,
+        name: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        model: Optional[Type[Model]] = None,
+        key: Optional[str] = None,
+    ):
+        """Fetch and decode ``endpoint``, going through the cache if enabled."""
+        def fetch():
+            return self._client.get(endpoint, params=params, model=model, key=key)
+
+        if self.cache is None:
+            return fetch()
+        return self.cache.get_or_fetch(name, dict(params or {}, _path=endpoint), fetch)
 
     def search(
         self,
@@ -71,30 +125,175 @@ class CodexSearch:
             repository: Filter by repository name
             limit: Maximum results to return
         """
-        params = {
-            "q": query,
-            "limit": limit,
-        }
-        if type:
-            params["type"] = type
-        if language:
-            params["language"] = language
-        if repository:
-            params["repository"] = repository
+        params = _search_params(query, type, language, repository, limit)
+        results = self._cached(
+            "search", "/v1/codex/search", params, CodexComponent, "components"
+        )
+        return list(results)
 
+    def search_batch(
+        self,
+        query: str,
+        type: Optional[str] = None,
+        language: Optional[str] = None,
+        repository: Optional[str] = None,
+        limit: int = 20,
+    ) -> ModelBatch[CodexComponent]:
+        """Search into a columnar :class:`~blackroad.models.ModelBatch` (uncached)."""
+        params = _search_params(query, type, language, repository, limit)
         response = self._client.get("/v1/codex/search", params=params)
-        return [CodexComponent.from_dict(c) for c in response.get("components", [])]
+        return ModelBatch(CodexComponent, response.get("components", []))
+
+    def iter_components(
+        self,
+        query: str,
+        type: Optional[str] = None,
+        language: Optional[str] = None,
+        repository: Optional[str] = None,
+        page_size: int = 50,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[CodexComponent]:
+        """
+        Iterate over every matching component, fetching pages lazily.
+
+        The next page is prefetched in the background while the current
+        one is consumed; at most two pages are held in memory.
+        """
+        params = _search_params(query, type, language, repository, page_size)
+        pages = iter_pages(
+            self._client.get, "/v1/codex/search", params, "components", prefetch
+        )
+        return iter_items(pages, CodexComponent.from_dict, max_items)
+
+    def export(
+        self,
+        query: str = "*",
+        type: Optional[str] = None,
+        language: Optional[str] = None,
+        repository: Optional[str] = None,
+        page_size: int = 100,
+        max_items: Optional[int] = None,
+    ) -> "ColumnTable":
+        """Fetch matching components into a columnar :class:`~blackroad.columnar.ColumnTable`."""
+        from .columnar import ColumnTable, CODEX_SCHEMA
+
+        params = _search_params(query, type, language, repository, page_size)
+        pages = iter_pages(self._client.get, "/v1/codex/search", params, "components")
+        return ColumnTable.build(CODEX_SCHEMA, pages, max_items)
+
+    def snapshot(self, query: str = "*", **filters) -> "CodexSnapshot":
+        """
+        Download components into a local :class:`~blackroad.snapshot.CodexSnapshot`
+        for offline, in-process search.
+        """
+        from .snapshot import CodexSnapshot
+
+        return CodexSnapshot.download(self, query, **filters)
 
     def get(self, component_id: str) -> CodexComponent:
         """Get a specific component by ID."""
-        response = self._client.get(f"/v1/codex/components/{component_id}")
-        return CodexComponent.from_dict(response)
+        return self._cached(
+            "get", f"/v1/codex/components/{component_id}", model=CodexComponent
+        )
 
     def stats(self) -> Dict[str, Any]:
         """Get Codex statistics."""
-        return self._client.get("/v1/codex/stats")
+        return self._cached("stats", "/v1/codex/stats")
 
     def languages(self) -> List[Dict[str, Any]]:
         """Get breakdown by language."""
-        response = self._client.get("/v1/codex/languages")
-        return response.get("languages", [])
+        return self._cached("languages", "/v1/codex/languages", key="languages")
+
+
+class AsyncCodexSearch:
+    """
+    Asyncio counterpart of :class:`CodexSearch`.
+
+    Example:
+        >>> results = await client.codex.search("agent registry", language="python")
+
+    Reads (``search``, ``get``, ``stats``, ``languages``) are served from
+    ``cache`` when one is configured.
+    """
+
+    def __init__(self, client, cache: Optional[ResponseCache] = None):
+        self._client = client
+        self.cache = cache
+
+    async def _cached(
+        self,
+        name: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        model: Optional[Type[Model]] = None,
+        key: Optional[str] = None,
+    ):
+        """Fetch and decode ``endpoint``, going through the cache if enabled."""
+        def fetch():
+            return self._client.get(endpoint, params=params, model=model, key=key)
+
+        if self.cache is None:
+            return await fetch()
+        return await self.cache.aget_or_fetch(
+            name, dict(params or {}, _path=endpoint), fetch
+        )
+
+    async def search(
+        self,
+        query: str,
+        type: Optional[str] = None,
+        language: Optional[str] = None,
+        repository: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[CodexComponent]:
+        """Search for components in the Codex."""
+        params = _search_params(query, type, language, repository, limit)
+        results = await self._cached(
+            "search", "/v1/codex/search", params, CodexComponent, "components"
+        )
+        return list(results)
+
+    async def search_batch(
+        self,
+        query: str,
+        type: Optional[str] = None,
+        language: Optional[str] = None,
+        repository: Optional[str] = None,
+        limit: int = 20,
+    ) -> ModelBatch[CodexComponent]:
+        """Search into a columnar :class:`~blackroad.models.ModelBatch` (uncached)."""
+        params = _search_params(query, type, language, repository, limit)
+        response = await self._client.get("/v1/codex/search", params=params)
+        return ModelBatch(CodexComponent, response.get("components", []))
+
+    def iter_components(
+        self,
+        query: str,
+        type: Optional[str] = None,
+        language: Optional[str] = None,
+        repository: Optional[str] = None,
+        page_size: int = 50,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[CodexComponent]:
+        """Iterate over every matching component with ``async for``."""
+        params = _search_params(query, type, language, repository, page_size)
+        pages = aiter_pages(
+            self._client.get, "/v1/codex/search", params, "components", prefetch
+        )
+        return aiter_items(pages, CodexComponent.from_dict, max_items)
+
+    async def get(self, component_id: str) -> CodexComponent:
+        """Get a specific component by ID."""
+        return await self._cached(
+            "get", f"/v1/codex/components/{component_id}", model=CodexComponent
+        )
+
+    async def stats(self) -> Dict[str, Any]:
+        """Get Codex statistics."""
+        return await self._cached("stats", "/v1/codex/stats")
+
+    async def languages(self) -> List[Dict[str, Any]]:
+        """Get breakdown by language."""
+        return await self._cached("languages", "/v1/codex/languages", key="languages")
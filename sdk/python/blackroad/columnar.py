@@ -0,0 +1,563 @@
+"""
+BlackRoad OS Columnar Export
+
+Typed column arrays for memory and codex results, with group-by and a
+memory-mapped binary format.
+"""
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from typing import Optional, List, Dict, Any, Callable, Iterable, Sequence, Tuple, Union
+
+from .models import Model, ModelBatch, parse_datetime
+from .replica import _EPOCH, _to_micros
+
+
+# Column kinds: "string" (UTF-8 blob plus int64 offsets), "time" (int64
+# epoch microseconds), "int64", "category" (int32 codes into a category
+# list, -1 for None) and "category_list" (int64 offsets into int32 codes).
+MEMORY_SCHEMA: Tuple[Tuple[str, str], ...] = (
+    ("id", "string"),
+    ("timestamp", "time"),
+    ("action", "category"),
+    ("entity", "category"),
+    ("details", "string"),
+    ("tags", "category_list"),
+    ("agent_id", "category"),
+    ("hash", "string"),
+    ("previous_hash", "string"),
+)
+
+CODEX_SCHEMA: Tuple[Tuple[str, str], ...] = (
+    ("name", "string"),
+    ("type", "category"),
+    ("language", "category"),
+    ("file_path", "string"),
+    ("line_number", "int64"),
+    ("signature", "string"),
+    ("docstring", "string"),
+    ("repository", "category"),
+)
+
+MAGIC = b"BRCOLS01"
+_HEADER = struct.Struct("<8sQ")
+_ALIGN = 8
+
+Buffer = Union[array, memoryview]
+
+
+def _numpy(required: bool = True):
+    try:
+        import numpy
+    except ImportError:
+        if not required:
+            return None
+        raise ImportError(
+            "NumPy arrays require the 'numpy' package. "
+            "Install it with: pip install blackroad[analytics]"
+        ) from None
+    return numpy
+
+
+def _micros(value: Any) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        value = parse_datetime(value)
+    return _to_micros(value)
+
+
+class _ColumnBuilder:
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.offsets = array("q", [0])
+        self.blob = bytearray()
+        self.values = array("i" if kind in ("category", "category_list") else "q")
+        self.categories: List[str] = []
+        self._codes: Dict[Optional[str], int] = {None: -1}
+
+    def _code(self, value: Optional[str]) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+    def extend(self, values: List[Any]):
+        kind = self.kind
+        if kind == "string":
+            encoded = [v.encode() if v else b"" for v in values]
+            base = len(self.blob)
+            self.blob += b"".join(encoded)
+            self.offsets.extend(base + end for end in accumulate(map(len, encoded)))
+        elif kind == "time":
+            self.values.extend(map(_micros, values))
+        elif kind == "int64":
+            self.values.extend(0 if v is None else v for v in values)
+        elif kind == "category":
+            self.values.extend(map(self._code, values))
+        else:
+            for items in values:
+                self.values.extend(map(self._code, items or ()))
+                self.offsets.append(len(self.values))
+
+    def buffers(self) -> Dict[str, Buffer]:
+        if self.kind == "string":
+            return {"offsets": self.offsets, "data": memoryview(bytes(self.blob))}
+        if self.kind == "category_list":
+            return {"offsets": self.offsets, "codes": self.values}
+        if self.kind == "category":
+            return {"codes": self.values}
+        return {"values": self.values}
+
+
+class ColumnTable:
+    """
+    Columnar table of memory entries or codex components.
+
+    Each column is a typed array: timestamps are int64 epoch
+    microseconds, actions, entities, agents, tags, languages and the
+    like are categorical codes, and text is one UTF-8 buffer with int64
+    offsets. :meth:`group_by` aggregates over the arrays directly (with
+    NumPy when it is installed), and :meth:`save` writes a binary file
+    that :meth:`load` maps back without parsing.
+
+    Example:
+        >>> table = client.memory.export(since=datetime(2026, 10, 1))
+        >>> table.group_by("entity", "action", interval=3600).count()
+        {('api-gateway', 'deployed', datetime(2026, 10, 1, 9, 0, ...)): 4, ...}
+        >>> table.group_by("agent_id").nunique("entity")
+        {'agent_123': 12, ...}
+        >>> table.save("october.brcol")
+        >>> table = ColumnTable.load("october.brcol")
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        schema: Sequence[Tuple[str, str]],
+        buffers: Dict[str, Dict[str, Buffer]],
+        categories: Dict[str, List[Optional[str]]],
+        source: Optional[mmap.mmap] = None,
+    ):
+        self.rows = rows
+        self.schema = tuple((name, kind) for name, kind in schema)
+        self._kinds = dict(self.schema)
+        self._buffers = buffers
+        self._categories = categories
+        self._mmap = source
+
+    @classmethod
+    def build(
+        cls,
+        schema: Sequence[Tuple[str, str]],
+        pages: Iterable[Sequence[Dict[str, Any]]],
+        max_items: Optional[int] = None,
+    ) -> "ColumnTable":
+        """
+        Build from pages of raw API rows (dicts keyed by column name),
+        transposing one page at a time.
+        """
+        def chunks():
+            remaining = max_items
+            for page in pages:
+                if remaining is not None:
+                    page = page[:remaining]
+                    remaining -= len(page)
+                if page:
+                    yield {name: [row.get(name) for row in page] for name, _ in schema}
+                if remaining == 0:
+                    return
+
+        return cls._from_chunks(schema, chunks())
+
+    @classmethod
+    def _from_chunks(
+        cls, schema: Sequence[Tuple[str, str]], chunks: Iterable[Dict[str, List[Any]]]
+    ) -> "ColumnTable":
+        builders = {name: _ColumnBuilder(kind) for name, kind in schema}
+        rows = 0
+        for chunk in chunks:
+            for name, builder in builders.items():
+                builder.extend(chunk[name])
+            rows += len(chunk[schema[0][0]])
+        return cls(
+            rows,
+            schema,
+            {name: b.buffers() for name, b in builders.items()},
+            {name: b.categories for name, b in builders.items() if "category" in b.kind},
+        )
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Union[ModelBatch, Iterable[Model], Iterable[Dict[str, Any]]],
+        schema: Optional[Sequence[Tuple[str, str]]] = None,
+    ) -> "ColumnTable":
+        """
+        Build from a ``ModelBatch``, models or raw rows. The schema is
+        inferred for memory entries and codex components.
+        """
+        if isinstance(results, ModelBatch):
+            schema = schema or _schema_for(results.model)
+            return cls._from_chunks(schema, [{name: results.column(name) for name, _ in schema}])
+        rows = [r.to_dict() if isinstance(r, Model) else r for r in results]
+        if schema is None:
+            if not rows:
+                raise ValueError("Cannot infer a schema from no results; pass schema")
+            schema = MEMORY_SCHEMA if "action" in rows[0] else CODEX_SCHEMA
+        return cls.build(schema, [rows])
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __repr__(self):
+        return f"ColumnTable({self.rows} rows, {[name for name, _ in self.schema]})"
+
+    @property
+    def names(self) -> List[str]:
+        return [name for name, _ in self.schema]
+
+    def categories(self, name: str) -> List[Optional[str]]:
+        """Category values of a categorical column, indexed by code."""
+        return self._categories[name]
+
+    def buffer(self, name: str, part: Optional[str] = None) -> Buffer:
+        """
+        Raw typed array behind a column: ``values`` (time, int64),
+        ``codes`` (category, category_list), ``offsets`` (string,
+        category_list) or ``data`` (string).
+        """
+        buffers = self._buffers[name]
+        if part is None:
+            part = "values" if "values" in buffers else "codes"
+        return buffers[part]
+
+    def column(self, name: str, decode: bool = False) -> List[Any]:
+        """
+        Values of one column as Python objects. Categories come back as
+        strings; timestamps as epoch microseconds, or datetimes with
+        ``decode``.
+        """
+        kind = self._kinds[name]
+        buffers = self._buffers[name]
+        if kind == "string":
+            offsets, data = buffers["offsets"], buffers["data"]
+            return [
+                bytes(data[offsets[i]:offsets[i + 1]]).decode() for i in range(self.rows)
+            ]
+        if kind in ("time", "int64"):
+            values = list(buffers["values"])
+            if decode and kind == "time":
+                return [_EPOCH + timedelta(microseconds=v) for v in values]
+            return values
+        lookup = self._categories[name] + [None]
+        if kind == "category":
+            return [lookup[c] for c in buffers["codes"]]
+        offsets, codes = buffers["offsets"], buffers["codes"]
+        return [
+            [lookup[c] for c in codes[offsets[i]:offsets[i + 1]]] for i in range(self.rows)
+        ]
+
+    def array(self, name: str, part: Optional[str] = None):
+        """A column's typed array as a NumPy array (zero-copy)."""
+        buffer = self.buffer(name, part)
+        return _numpy().frombuffer(buffer, dtype=_typecode(buffer))
+
+    def value_counts(self, name: str) -> Dict[Optional[str], int]:
+        """Rows per category (per tag occurrence for ``tags``), most common first."""
+        return self.group_by(name).count()
+
+    def group_by(
+        self, *keys: str, interval: Optional[int] = None, use_numpy: Optional[bool] = None
+    ) -> "GroupBy":
+        """
+        Group rows by categorical, int64 or time columns. Time keys are
+        bucketed into ``interval`` seconds (default one hour). Grouping by
+        a ``category_list`` column counts a row once per item.
+        """
+        return GroupBy(self, keys, interval or 3600, use_numpy)
+
+    def save(self, path: str):
+        """Write the table in the binary column format."""
+        columns = []
+        chunks: List[Buffer] = []
+        offset = 0
+        for name, kind in self.schema:
+            parts = {}
+            for part, buffer in self._buffers[name].items():
+                view = memoryview(buffer).cast("B")
+                parts[part] = [offset, len(view), _typecode(buffer)]
+                chunks.append(view)
+                offset += len(view)
+                pad = -offset % _ALIGN
+                if pad:
+                    chunks.append(memoryview(bytes(pad)))
+                    offset += pad
+            entry: Dict[str, Any] = {"name": name, "kind": kind, "buffers": parts}
+            if name in self._categories:
+                entry["categories"] = self._categories[name]
+            columns.append(entry)
+        header = json.dumps({"rows": self.rows, "columns": columns}).encode()
+        header += b" " * (-(len(header) + _HEADER.size) % _ALIGN)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, len(header)))
+            f.write(header)
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ColumnTable":
+        """Memory-map a file written by :meth:`save`; columns are views into it."""
+        with open(path, "rb") as f:
+            view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_size = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            view.close()
+            raise ValueError(f"{path} is not a BlackRoad column file")
+        header = json.loads(view[_HEADER.size:_HEADER.size + header_size])
+        base = _HEADER.size + header_size
+        whole = memoryview(view)
+        buffers: Dict[str, Dict[str, Buffer]] = {}
+        categories: Dict[str, List[Optional[str]]] = {}
+        schema = []
+        for column in header["columns"]:
+            name = column["name"]
+            schema.append((name, column["kind"]))
+            buffers[name] = {
+                part: whole[base + start:base + start + size].cast(typecode)
+                for part, (start, size, typecode) in column["buffers"].items()
+            }
+            if "categories" in column:
+                categories[name] = column["categories"]
+        return cls(header["rows"], schema, buffers, categories, source=view)
+
+    def close(self):
+        """Release the memory map of a loaded table."""
+        if self._mmap is not None:
+            self._buffers = {}
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _typecode(buffer: Buffer) -> str:
+    return buffer.format if isinstance(buffer, memoryview) else buffer.typecode
+
+
+def _schema_for(model) -> Sequence[Tuple[str, str]]:
+    names = {f.name for f in model._fields}
+    if {"action", "entity"} <= names:
+        return MEMORY_SCHEMA
+    if {"language", "signature"} <= names:
+        return CODEX_SCHEMA
+    raise ValueError(f"No column schema for {model.__name__}; pass schema")
+
+
+class GroupBy:
+    """Aggregates over the groups of a :meth:`ColumnTable.group_by`."""
+
+    def __init__(
+        self, table: ColumnTable, keys: Sequence[str], interval: int, use_numpy: Optional[bool]
+    ):
+        if not keys:
+            raise ValueError("group_by needs at least one key")
+        self.table = table
+        self.keys = tuple(keys)
+        self.interval = interval
+        self._np = _numpy() if use_numpy else (None if use_numpy is False else _numpy(False))
+        self._rows = None
+        self._key_seqs = []
+        for key in self.keys:
+            kind = table._kinds[key]
+            if kind == "category_list":
+                if self._rows is not None:
+                    raise ValueError("group_by supports one category_list key")
+                self._rows = self._explode(key)
+        for key in self.keys:
+            self._key_seqs.append(self._key_codes(key))
+        self._groups = None
+
+    # Row selection and keys.
+
+    def _explode(self, key: str):
+        offsets = self.table.buffer(key, "offsets")
+        np = self._np
+        if np is not None:
+            counts = np.diff(np.frombuffer(offsets, dtype=np.int64))
+            return np.repeat(np.arange(self.table.rows, dtype=np.int64), counts)
+        rows = array("q")
+        for i in range(self.table.rows):
+            rows.extend([i] * (offsets[i + 1] - offsets[i]))
+        return rows
+
+    def _gather(self, values):
+        """``values`` aligned to the (possibly exploded) grouped rows."""
+        if self._rows is None:
+            return values
+        if self._np is not None:
+            return values[self._rows]
+        return [values[i] for i in self._rows]
+
+    def _values(self, name: str):
+        buffer = self.table.buffer(name)
+        if self._np is not None:
+            return self._np.frombuffer(buffer, dtype=_typecode(buffer))
+        return buffer
+
+    def _key_codes(self, key: str):
+        kind = self.table._kinds[key]
+        if kind == "string":
+            raise ValueError(f"Cannot group by string column {key!r}")
+        if kind == "category_list":
+            return self._values(key)
+        values = self._gather(self._values(key))
+        if kind == "time":
+            step = self.interval * 1_000_000
+            if self._np is not None:
+                return values // step
+            return [v // step for v in values]
+        return values
+
+    def _decoder(self, key: str) -> Callable[[int], Any]:
+        kind = self.table._kinds[key]
+        if kind == "int64":
+            return int
+        if kind == "time":
+            interval = self.interval
+            buckets: Dict[int, datetime] = {}
+
+            def bucket(code: int) -> datetime:
+                value = buckets.get(code)
+                if value is None:
+                    value = buckets[code] = datetime.fromtimestamp(code * interval, tz=timezone.utc)
+                return value
+
+            return bucket
+        # Code -1 (None) indexes the appended None.
+        return (self.table._categories[key] + [None]).__getitem__
+
+    def _labels(self, groups: Iterable[Tuple[int, ...]]) -> List[Any]:
+        decoders = [self._decoder(key) for key in self.keys]
+        if len(decoders) == 1:
+            decode = decoders[0]
+            return [decode(codes[0]) for codes in groups]
+        return [tuple(d(c) for d, c in zip(decoders, codes)) for codes in groups]
+
+    # NumPy grouping: one inverse index per row.
+
+    def _np_groups(self):
+        if self._groups is None:
+            np = self._np
+            seqs = [np.asarray(s, dtype=np.int64) for s in self._key_seqs]
+            # Mixed-radix pack keys into one int64 when the ranges allow.
+            combined = np.zeros(len(seqs[0]), dtype=np.int64)
+            radix, packed = 1, True
+            for seq in seqs:
+                low = int(seq.min()) if len(seq) else 0
+                span = (int(seq.max()) - low + 1) if len(seq) else 1
+                if radix * span >= 1 << 62:
+                    packed = False
+                    break
+                combined += (seq - low) * radix
+                radix *= span
+            if packed:
+                _, first, inverse = np.unique(combined, return_index=True, return_inverse=True)
+                keys = np.stack([seq[first] for seq in seqs], axis=1)
+            else:
+                keys, inverse = np.unique(np.stack(seqs, axis=1), axis=0, return_inverse=True)
+            self._groups = (list(map(tuple, keys.tolist())), inverse.ravel())
+        return self._groups
+
+    def _np_reduce(self, values, ufunc):
+        np = self._np
+        labels, inverse = self._np_groups()
+        order = np.argsort(inverse, kind="stable")
+        starts = np.searchsorted(inverse[order], np.arange(len(labels)))
+        return labels, ufunc.reduceat(values[order], starts)
+
+    # Aggregates.
+
+    def count(self) -> Dict[Any, int]:
+        """Rows per group, largest first."""
+        if self._np is not None:
+            labels, inverse = self._np_groups()
+            counts = self._np.bincount(inverse, minlength=len(labels))
+            result = dict(zip(self._labels(labels), counts.tolist()))
+        else:
+            counted = Counter(self._zip())
+            result = dict(zip(self._labels(counted), counted.values()))
+        return dict(sorted(result.items(), key=lambda kv: -kv[1]))
+
+    def sum(self, column: str) -> Dict[Any, int]:
+        return self._aggregate(column, "sum")
+
+    def min(self, column: str) -> Dict[Any, int]:
+        return self._aggregate(column, "min")
+
+    def max(self, column: str) -> Dict[Any, int]:
+        return self._aggregate(column, "max")
+
+    def mean(self, column: str) -> Dict[Any, float]:
+        totals = self.sum(column)
+        counts = self.count()
+        return {k: totals[k] / counts[k] for k in totals}
+
+    def nunique(self, column: str) -> Dict[Any, int]:
+        """Distinct values of a categorical or numeric column per group."""
+        if self.table._kinds[column] in ("string", "category_list"):
+            raise ValueError(f"nunique needs a category or numeric column, not {column!r}")
+        values = self._gather(self._values(column))
+        if self._np is not None:
+            np = self._np
+            labels, inverse = self._np_groups()
+            values = np.asarray(values, dtype=np.int64)
+            low = int(values.min()) if len(values) else 0
+            span = (int(values.max()) - low + 1) if len(values) else 1
+            if span * len(labels) < 1 << 62:
+                groups = np.unique(inverse * span + (values - low)) // span
+            else:
+                groups = np.unique(np.stack([inverse, values], axis=1), axis=0)[:, 0]
+            counts = np.bincount(groups, minlength=len(labels))
+            return dict(zip(self._labels(labels), counts.tolist()))
+        seen: Dict[Any, set] = defaultdict(set)
+        for key, value in zip(self._zip(), values):
+            seen[key].add(value)
+        return dict(zip(self._labels(seen), map(len, seen.values())))
+
+    def _zip(self):
+        if len(self._key_seqs) == 1:
+            return ((k,) for k in self._key_seqs[0])
+        return zip(*self._key_seqs)
+
+    def _aggregate(self, column: str, how: str) -> Dict[Any, int]:
+        if self.table._kinds[column] not in ("int64", "time"):
+            raise ValueError(f"Cannot {how} non-numeric column {column!r}")
+        values = self._gather(self._values(column))
+        if self._np is not None:
+            np = self._np
+            ufunc = {"sum": np.add, "min": np.minimum, "max": np.maximum}[how]
+            labels, reduced = self._np_reduce(np.asarray(values, dtype=np.int64), ufunc)
+            return dict(zip(self._labels(labels), reduced.tolist()))
+        result: Dict[Any, int] = {}
+        if how == "sum":
+            for key, value in zip(self._zip(), values):
+                result[key] = result.get(key, 0) + value
+        else:
+            pick = min if how == "min" else max
+            for key, value in zip(self._zip(), values):
+                result[key] = pick(result[key], value) if key in result else value
+        return dict(zip(self._labels(result), result.values()))
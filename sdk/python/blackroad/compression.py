@@ -0,0 +1,124 @@
+"""
+BlackRoad OS Compression
+
+Response encoding negotiation and opt-in compression of request bodies.
+"""
+
+import re
+import gzip
+from dataclasses import dataclass
+from typing import Optional, List, Sequence, Set, Tuple
+
+
+# Preferred first; gzip and deflate are always available.
+ENCODINGS = ("zstd", "br", "gzip", "deflate")
+
+_DEFAULT_LEVELS = {"gzip": 6, "zstd": 3, "br": 4}
+
+
+def _has_module(*names: str) -> bool:
+    from importlib.util import find_spec
+
+    return any(find_spec(name) is not None for name in names)
+
+
+def _httpx_decoders() -> Optional[Set[str]]:
+    """Encodings the installed httpx will decode, or None if it does not say."""
+    try:
+        from httpx._decoders import SUPPORTED_DECODERS
+    except ImportError:
+        return None
+    return set(SUPPORTED_DECODERS)
+
+
+def _httpx_version() -> Tuple[int, ...]:
+    import httpx
+
+    return tuple(int(part) for part in re.findall(r"\d+", httpx.__version__)[:3])
+
+
+def available_encodings() -> List[str]:
+    """
+    Content encodings this environment can decode, preferred first.
+
+    Only encodings httpx itself decodes are listed: having ``zstandard``
+    installed is not enough, since httpx decodes zstd only from 0.27.1.
+    """
+    decoders = _httpx_decoders()
+    if decoders is not None:
+        zstd, br = "zstd" in decoders, "br" in decoders
+    else:
+        zstd = _has_module("zstandard") and _httpx_version() >= (0, 27, 1)
+        br = _has_module("brotli", "brotlicffi")
+    encodings = []
+    if zstd:
+        encodings.append("zstd")
+    if br:
+        encodings.append("br")
+    encodings.extend(["gzip", "deflate"])
+    return encodings
+
+
+def _missing(encoding: str, package: str) -> ImportError:
+    return ImportError(
+        f"{encoding} compression requires the '{package}' package. "
+        "Install it with: pip install blackroad[compression]"
+    )
+
+
+@dataclass
+class CompressionConfig:
+    """
+    Compression settings for request and response bodies.
+
+    ``accept`` lists the encodings advertised in ``Accept-Encoding``
+    (default: every encoding that can be decoded here, zstd and brotli
+    first when their packages are installed). Request bodies of at least
+    ``request_threshold`` bytes are compressed with ``request_encoding``;
+    leave the threshold at None unless the server accepts compressed
+    bodies.
+
+    Example:
+        >>> client = BlackRoadClient(
+        ...     compression=CompressionConfig(request_threshold=4096),
+        ... )
+    """
+    accept: Optional[Sequence[str]] = None
+    request_threshold: Optional[int] = None
+    request_encoding: str = "gzip"
+    level: Optional[int] = None
+
+    def __post_init__(self):
+        if self.request_encoding not in _DEFAULT_LEVELS:
+            raise ValueError(
+                f"Unknown request encoding {self.request_encoding!r}; "
+                f"choose from {sorted(_DEFAULT_LEVELS)}"
+            )
+        unknown = set(self.accept or ()) - set(ENCODINGS) - {"identity"}
+        if unknown:
+            raise ValueError(f"Unknown encodings {sorted(unknown)}; choose from {ENCODINGS}")
+
+    def accept_encoding(self) -> str:
+        """Value of the ``Accept-Encoding`` request header."""
+        encodings = self.accept if self.accept is not None else available_encodings()
+        return ", ".join(encodings) or "identity"
+
+    def compress(self, content: bytes) -> bytes:
+        """Compress a request body with ``request_encoding``."""
+        level = self.level if self.level is not None else _DEFAULT_LEVELS[self.request_encoding]
+        if self.request_encoding == "gzip":
+            return gzip.compress(content, compresslevel=level, mtime=0)
+        if self.request_encoding == "zstd":
+            try:
+                import zstandard
+            except ImportError:
+                raise _missing("zstd", "zstandard") from None
+            return zstandard.ZstdCompressor(level=level).compress(content)
+        try:
+            import brotli
+        except ImportError:
+            try:
+                import brotlicffi as brotli
+            except ImportError:
+                raise _missing("brotli", "brotli") from None
+        return brotli.compress(content, quality=level)
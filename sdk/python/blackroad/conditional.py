@@ -0,0 +1,279 @@
+"""
+BlackRoad OS Conditional Requests
+
+Validator cache that revalidates GETs with ETag and Last-Modified.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Callable,
+    Awaitable,
+    Tuple,
+    TYPE_CHECKING,
+)
+from urllib.parse import urlencode
+
+from .cache import normalize_params
+
+if TYPE_CHECKING:
+    import httpx
+
+
+Decode = Callable[[bytes, Any, Optional[str]], Any]
+
+
+@dataclass
+class ConditionalStats:
+    """Counters for a :class:`ConditionalCache`."""
+    requests: int = 0
+    not_modified: int = 0
+    stored: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.not_modified / self.requests if self.requests else 0.0
+
+
+@dataclass
+class Validators:
+    """Validators and body of the last full response for one request."""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    body: bytes = b""
+
+    @classmethod
+    def from_response(cls, response: "httpx.Response") -> Optional["Validators"]:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return None
+        return cls(etag, last_modified, response.content)
+
+    def headers(self) -> Dict[str, str]:
+        """Conditional request headers for these validators."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def request_key(endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+    """Stable string identity of a GET request."""
+    query = urlencode(normalize_params(params))
+    return f"{endpoint}?{query}" if query else endpoint
+
+
+class ValidatorStore:
+    """Storage backend for :class:`ConditionalCache`."""
+
+    def get(self, key: str) -> Optional[Validators]:
+        raise NotImplementedError
+
+    def set(self, key: str, validators: Validators):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class MemoryValidatorStore(ValidatorStore):
+    """In-process LRU store holding up to ``max_entries`` responses."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Validators]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Validators]:
+        with self._lock:
+            validators = self._entries.get(key)
+            if validators is not None:
+                self._entries.move_to_end(key)
+            return validators
+
+    def set(self, key: str, validators: Validators):
+        with self._lock:
+            self._entries[key] = validators
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskValidatorStore(ValidatorStore):
+    """
+    Store responses as files under ``path`` so they survive restarts.
+
+    Each request is one file: a JSON header line followed by the raw body.
+    Bodies are stored as received; point ``path`` at a directory only the
+    client's user can read.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        os.makedirs(self.path, exist_ok=True)
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, hashlib.sha256(key.encode()).hexdigest())
+
+    def get(self, key: str) -> Optional[Validators]:
+        try:
+            with open(self._file(key), "rb") as f:
+                header = json.loads(f.readline())
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if header.get("key") != key:
+            return None
+        return Validators(header.get("etag"), header.get("last_modified"), body)
+
+    def set(self, key: str, validators: Validators):
+        header = {
+            "key": key,
+            "etag": validators.etag,
+            "last_modified": validators.last_modified,
+        }
+        target = self._file(key)
+        tmp = f"{target}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(json.dumps(header).encode() + b"\n")
+            f.write(validators.body)
+        os.replace(tmp, target)
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._file(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        for name in os.listdir(self.path):
+            os.remove(os.path.join(self.path, name))
+
+
+class ConditionalCache:
+    """
+    Revalidate GET requests instead of re-downloading them.
+
+    Responses carrying an ``ETag`` or ``Last-Modified`` header are stored
+    in ``store``; the next identical GET sends ``If-None-Match`` /
+    ``If-Modified-Since``. On ``304 Not Modified`` the stored body is
+    decoded again, so each call gets its own model objects and callers
+    may modify them freely. A 304 without a stored body to answer from
+    is treated as a miss and re-fetched unconditionally.
+
+    Example:
+        >>> client = BlackRoadClient(conditional_cache=ConditionalCache())
+        >>> client.agents.list()   # 200, stored
+        >>> client.agents.list()   # 304, decoded from the stored body
+        >>> client.conditional_cache.stats
+        ConditionalStats(requests=2, not_modified=1, stored=1)
+
+    Use ``DiskValidatorStore`` to keep validators across process restarts.
+    """
+
+    def __init__(self, store: Optional[ValidatorStore] = None):
+        self.store = store if store is not None else MemoryValidatorStore()
+        self.stats = ConditionalStats()
+        self._lock = threading.Lock()
+
+    def fetch(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        send: Callable[[Dict[str, str]], "httpx.Response"],
+        decode: Decode,
+        model: Any = None,
+        key: Optional[str] = None,
+    ) -> Any:
+        """GET through the cache; ``send`` performs the request with extra headers."""
+        cache_key, validators = self._lookup(endpoint, params)
+        response = send(validators.headers() if validators else {})
+        if self._unanswerable(cache_key, validators, response):
+            validators, response = None, send({})
+        return self._complete(cache_key, validators, response, decode, model, key)
+
+    async def afetch(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        send: Callable[[Dict[str, str]], Awaitable["httpx.Response"]],
+        decode: Decode,
+        model: Any = None,
+        key: Optional[str] = None,
+    ) -> Any:
+        """Asyncio counterpart of :meth:`fetch`."""
+        cache_key, validators = self._lookup(endpoint, params)
+        response = await send(validators.headers() if validators else {})
+        if self._unanswerable(cache_key, validators, response):
+            validators, response = None, await send({})
+        return self._complete(cache_key, validators, response, decode, model, key)
+
+    def invalidate(self, endpoint: Optional[str] = None, params=None):
+        """Forget one request's validators, or all of them."""
+        if endpoint is None:
+            self.store.clear()
+        else:
+            self.store.delete(request_key(endpoint, params))
+
+    def _lookup(
+        self, endpoint: str, params: Optional[Dict[str, Any]]
+    ) -> Tuple[str, Optional[Validators]]:
+        cache_key = request_key(endpoint, params)
+        with self._lock:
+            self.stats.requests += 1
+        return cache_key, self.store.get(cache_key)
+
+    def _unanswerable(
+        self, cache_key: str, validators: Optional[Validators], response: "httpx.Response"
+    ) -> bool:
+        """A 304 with no stored body behind it: drop the entry and ask again."""
+        if response.status_code != 304 or (validators is not None and validators.body):
+            return False
+        self.store.delete(cache_key)
+        return True
+
+    def _complete(
+        self,
+        cache_key: str,
+        validators: Optional[Validators],
+        response: "httpx.Response",
+        decode: Decode,
+        model: Any,
+        key: Optional[str],
+    ) -> Any:
+        if response.status_code == 304 and validators is not None:
+            with self._lock:
+                self.stats.not_modified += 1
+            return decode(validators.body, model, key)
+
+        value = decode(response.content, model, key)
+        fresh = Validators.from_response(response)
+        if fresh is not None:
+            self.store.set(cache_key, fresh)
+            with self._lock:
+                self.stats.stored += 1
+        return value
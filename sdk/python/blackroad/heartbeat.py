@@ -0,0 +1,230 @@
+"""
+BlackRoad OS Heartbeat Scheduling
+
+Send heartbeats for many agents from one timer wheel and a shared pool.
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Set
+
+
+@dataclass
+class HeartbeatStats:
+    """Counters for a :class:`HeartbeatManager`."""
+    agents: int = 0
+    sent: int = 0
+    failed: int = 0
+    late: int = 0
+    missed: int = 0
+    max_lag: float = 0.0
+
+
+class _Beat:
+    __slots__ = ("agent_id", "slot", "in_flight", "last_sent", "last_error")
+
+    def __init__(self, agent_id: str, slot: int):
+        self.agent_id = agent_id
+        self.slot = slot
+        self.in_flight = False
+        self.last_sent: Optional[float] = None
+        self.last_error: Optional[BaseException] = None
+
+
+class HeartbeatManager:
+    """
+    Heartbeats for many agents from a single scheduler thread.
+
+    Agents are placed on a timer wheel with one slot per ``resolution``
+    seconds of ``interval``; each new agent goes into the least-occupied
+    slot, so beats are spread evenly over the interval instead of arriving
+    in bursts. Due beats are sent by up to ``max_concurrency`` workers
+    over the client's shared connection pool.
+
+    A beat that completes more than ``tolerance`` seconds after it was due
+    is counted as late. A beat that fails, or is skipped because the
+    agent's previous beat is still in flight, is counted as missed.
+    Managed agents are deregistered on :meth:`close` unless
+    ``deregister_on_close`` is False.
+
+    Example:
+        >>> with client.agents.heartbeats(interval=30) as beats:
+        ...     for i in range(2000):
+        ...         beats.register(f"worker-{i}", capabilities=["etl"])
+        ...     run_forever()
+        >>> beats.stats()
+        HeartbeatStats(agents=2000, sent=..., failed=0, late=0, missed=0, ...)
+    """
+
+    def __init__(
+        self,
+        registry,
+        interval: float = 30.0,
+        resolution: float = 0.1,
+        max_concurrency: int = 32,
+        tolerance: Optional[float] = None,
+        deregister_on_close: bool = True,
+    ):
+        if interval <= 0 or resolution <= 0:
+            raise ValueError("interval and resolution must be positive")
+        self._registry = registry
+        self.interval = interval
+        self.tolerance = interval * 0.1 if tolerance is None else tolerance
+        self.deregister_on_close = deregister_on_close
+
+        self._slots = max(1, round(interval / resolution))
+        self._tick = interval / self._slots
+        self._wheel: List[Set[str]] = [set() for _ in range(self._slots)]
+        self._beats: Dict[str, _Beat] = {}
+        self._stats = HeartbeatStats()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="blackroad-heartbeat"
+        )
+        self._start = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._run, name="blackroad-heartbeat-wheel", daemon=True
+        )
+        self._thread.start()
+
+    def add(self, agent_id: str):
+        """Start sending heartbeats for an already registered agent."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("HeartbeatManager is closed")
+            if agent_id in self._beats:
+                return
+            slot = min(range(self._slots), key=lambda s: len(self._wheel[s]))
+            self._beats[agent_id] = _Beat(agent_id, slot)
+            self._wheel[slot].add(agent_id)
+
+    def register(self, name: str, **options):
+        """Register a new agent and start its heartbeats. Returns the Agent."""
+        agent = self._registry.register(name, **options)
+        self.add(agent.id)
+        return agent
+
+    def remove(self, agent_id: str, deregister: bool = False):
+        """Stop heartbeats for ``agent_id``, optionally deregistering it."""
+        with self._lock:
+            beat = self._beats.pop(agent_id, None)
+            if beat is not None:
+                self._wheel[beat.slot].discard(agent_id)
+        if deregister:
+            self._registry.deregister(agent_id)
+
+    def agents(self) -> List[str]:
+        """IDs of the agents being kept alive."""
+        with self._lock:
+            return list(self._beats)
+
+    def last_beat(self, agent_id: str) -> Optional[float]:
+        """``time.monotonic()`` of the agent's last successful beat."""
+        beat = self._beats.get(agent_id)
+        return beat.last_sent if beat is not None else None
+
+    def stats(self) -> HeartbeatStats:
+        """Snapshot of the manager's counters."""
+        with self._lock:
+            return HeartbeatStats(
+                agents=len(self._beats),
+                sent=self._stats.sent,
+                failed=self._stats.failed,
+                late=self._stats.late,
+                missed=self._stats.missed,
+                max_lag=self._stats.max_lag,
+            )
+
+    def close(self, deregister: Optional[bool] = None):
+        """Stop the scheduler and, by default, deregister every managed agent."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            agent_ids = list(self._beats)
+            self._beats.clear()
+            for slot in self._wheel:
+                slot.clear()
+        self._stop.set()
+        self._thread.join()
+        if self.deregister_on_close if deregister is None else deregister:
+            for agent_id in agent_ids:
+                self._executor.submit(self._deregister, agent_id)
+        self._executor.shutdown(wait=True)
+
+    def __len__(self) -> int:
+        return len(self._beats)
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self._beats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _run(self):
+        tick = 0
+        while not self._stop.is_set():
+            due = self._start + tick * self._tick
+            now = time.monotonic()
+            if now < due:
+                self._stop.wait(due - now)
+                continue
+            behind = int((now - self._start) / self._tick) - tick
+            if behind >= self._slots:
+                # Stalled for a whole lap or more: skip ahead rather than
+                # firing every slot back to back.
+                skipped = behind - self._slots + 1
+                with self._lock:
+                    for t in range(tick, tick + skipped):
+                        self._stats.missed += len(self._wheel[t % self._slots])
+                tick += skipped
+                continue
+            self._fire(tick % self._slots, due)
+            tick += 1
+
+    def _fire(self, slot: int, due: float):
+        with self._lock:
+            beats = [self._beats[agent_id] for agent_id in self._wheel[slot]]
+            ready = []
+            for beat in beats:
+                if beat.in_flight:
+                    self._stats.missed += 1
+                else:
+                    beat.in_flight = True
+                    ready.append(beat)
+        for beat in ready:
+            self._executor.submit(self._send, beat, due)
+
+    def _send(self, beat: _Beat, due: float):
+        error: Optional[BaseException] = None
+        try:
+            self._registry.heartbeat(beat.agent_id)
+        except Exception as exc:
+            error = exc
+        now = time.monotonic()
+        lag = now - due
+        with self._lock:
+            beat.in_flight = False
+            beat.last_error = error
+            if error is not None:
+                self._stats.failed += 1
+                self._stats.missed += 1
+                return
+            beat.last_sent = now
+            self._stats.sent += 1
+            self._stats.max_lag = max(self._stats.max_lag, lag)
+            if lag > self.tolerance:
+                self._stats.late += 1
+
+    def _deregister(self, agent_id: str):
+        try:
+            self._registry.deregister(agent_id)
+        except Exception:
+            pass
@@ -0,0 +1,294 @@
+"""
+BlackRoad OS Load Generator
+
+Drive a BlackRoadClient with a weighted mix of operations from many threads.
+"""
+
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Optional, List, Dict, Any, Callable, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import BlackRoadClient
+
+
+# Operation name -> relative weight, roughly an agent fleet's traffic.
+DEFAULT_MIX: Dict[str, float] = {
+    "agents.heartbeat": 30,
+    "memory.log": 25,
+    "memory.search": 15,
+    "agents.list": 10,
+    "codex.search": 10,
+    "traffic_lights.list": 4,
+    "traffic_lights.set": 1,
+    "tasks.list": 4,
+    "tasks.claim": 1,
+}
+
+_WORDS = ("deploy", "agent", "memory", "search", "route", "worker", "index", "sync")
+
+
+@dataclass
+class OperationStats:
+    """Latency and outcome counts for one operation."""
+    name: str
+    calls: int = 0
+    errors: int = 0
+    p50_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+    error_types: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class LoadReport:
+    """Result of :func:`run_load`."""
+    duration: float
+    concurrency: int
+    calls: int
+    errors: int
+    operations: List[OperationStats]
+
+    @property
+    def throughput(self) -> float:
+        return self.calls / self.duration if self.duration else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(asdict(self), throughput=self.throughput)
+
+    def format(self) -> str:
+        lines = [
+            f"{self.calls} calls in {self.duration:.1f}s with {self.concurrency} threads: "
+            f"{self.throughput:.0f} req/s, {self.errors} errors",
+            f"{'operation':>22}{'calls':>8}{'errors':>8}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}",
+        ]
+        for op in self.operations:
+            lines.append(
+                f"{op.name:>22}{op.calls:>8}{op.errors:>8}"
+                f"{op.p50_ms:>9.2f}{op.p99_ms:>9.2f}{op.max_ms:>9.2f}"
+            )
+        return "\n".join(lines)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def operations(
+    client: "BlackRoadClient",
+    agent_ids: Sequence[str],
+    projects: int = 200,
+    tasks: int = 200,
+) -> Dict[str, Callable[[random.Random], Any]]:
+    """
+    Operation name -> callable taking a ``random.Random``.
+
+    Heartbeats and agent reads pick from ``agent_ids`` (:func:`run_load`
+    registers them and deregisters them afterwards). ``projects`` and
+    ``tasks`` bound the ids used for traffic lights and task claims (the
+    stand-in seeds ``project-N`` and ``task-N``).
+    """
+
+    def claim(rng: random.Random):
+        return client.tasks.try_claim(f"task-{rng.randrange(tasks)}")
+
+    return {
+        "agents.heartbeat": lambda rng: client.agents.heartbeat(rng.choice(agent_ids)),
+        "agents.list": lambda rng: client.agents.list(limit=50),
+        "agents.get": lambda rng: client.agents.get(rng.choice(agent_ids)),
+        "memory.log": lambda rng: client.memory.log(
+            "progress", "loadgen", f"step {rng.randrange(10**6)}", [rng.choice(_WORDS)]
+        ),
+        "memory.search": lambda rng: client.memory.search(tags=[rng.choice(_WORDS)], limit=20),
+        "codex.search": lambda rng: client.codex.search(rng.choice(_WORDS), limit=20),
+        "codex.stats": lambda rng: client.codex.stats(),
+        "traffic_lights.list": lambda rng: client.traffic_lights.list(),
+        "traffic_lights.set": lambda rng: client.traffic_lights.set(
+            f"project-{rng.randrange(projects)}", rng.choice(("green", "yellow")), "loadgen"
+        ),
+        "tasks.list": lambda rng: client.tasks.list(status="available"),
+        "tasks.claim": claim,
+    }
+
+
+def run_load(
+    client: "BlackRoadClient",
+    duration: float = 10.0,
+    concurrency: int = 16,
+    mix: Optional[Dict[str, float]] = None,
+    seed: int = 0,
+    agents: int = 16,
+) -> LoadReport:
+    """
+    Call operations drawn from ``mix`` on ``concurrency`` threads for
+    ``duration`` seconds, sharing ``client``. Exceptions count as errors
+    and do not stop the run. ``agents`` load agents are registered first
+    and deregistered when the run ends, however it ends.
+
+    Example:
+        >>> with StandInServer(faults=FaultConfig(latency=0.002)) as server:
+        ...     client = BlackRoadClient(api_key="test", base_url=server.url)
+        ...     report = run_load(client, duration=5, concurrency=8)
+        >>> print(report.format())
+    """
+    mix = mix or DEFAULT_MIX
+    known = operations(client, ())
+    unknown = set(mix) - set(known)
+    if unknown:
+        raise ValueError(f"Unknown operations {sorted(unknown)}; choose from {sorted(known)}")
+    agent_ids: List[str] = []
+    try:
+        for i in range(agents):
+            agent_ids.append(client.agents.register(f"load-{i}", capabilities=["python"]).id)
+        return _drive(operations(client, agent_ids), mix, duration, concurrency, seed)
+    finally:
+        # Failures are reported per result rather than raised, so cleanup
+        # never hides how the run itself ended.
+        for _ in client.agents.deregister_many(agent_ids):
+            pass
+
+
+def _drive(
+    available: Dict[str, Callable[[random.Random], Any]],
+    mix: Dict[str, float],
+    duration: float,
+    concurrency: int,
+    seed: int,
+) -> LoadReport:
+    names = list(mix)
+    weights = [mix[name] for name in names]
+
+    # Each thread records into its own lists; merged after the run.
+    samples: List[Dict[str, List[float]]] = [{} for _ in range(concurrency)]
+    failures: List[Dict[str, Dict[str, int]]] = [{} for _ in range(concurrency)]
+    deadline = time.perf_counter() + duration
+
+    def worker(index: int):
+        rng = random.Random(seed * 1000 + index)
+        latencies = samples[index]
+        errors = failures[index]
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            try:
+                available[name](rng)
+            except Exception as exc:
+                kinds = errors.setdefault(name, {})
+                kinds[type(exc).__name__] = kinds.get(type(exc).__name__, 0) + 1
+            latencies.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(target=worker, args=(i,), name=f"blackroad-load-{i}", daemon=True)
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    results = []
+    for name in names:
+        latencies = sorted(t for s in samples for t in s.get(name, ()))
+        error_types: Dict[str, int] = {}
+        for errors in failures:
+            for kind, count in errors.get(name, {}).items():
+                error_types[kind] = error_types.get(kind, 0) + count
+        results.append(OperationStats(
+            name=name,
+            calls=len(latencies),
+            errors=sum(error_types.values()),
+            p50_ms=_percentile(latencies, 0.50),
+            p99_ms=_percentile(latencies, 0.99),
+            max_ms=latencies[-1] if latencies else 0.0,
+            error_types=error_types,
+        ))
+    return LoadReport(
+        duration=elapsed,
+        concurrency=concurrency,
+        calls=sum(op.calls for op in results),
+        errors=sum(op.errors for op in results),
+        operations=results,
+    )
+
+
+def _parse_mix(value: str) -> Dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def main(argv: Optional[List[str]] = None):
+    import argparse
+
+    from .client import BlackRoadClient, TransportConfig
+    from .retry import RetryPolicy
+
+    parser = argparse.ArgumentParser(description="Generate load against the BlackRoad API.")
+    parser.add_argument("--url", help="API base URL (default: start a local stand-in)")
+    parser.add_argument("--api-key", default="loadgen")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--agents", type=int, default=16)
+    parser.add_argument("--mix", type=_parse_mix, help="e.g. agents.heartbeat=3,memory.log=1")
+    parser.add_argument("--retries", type=int, default=3, help="attempts per call")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write the report as JSON to this file")
+    faults = parser.add_argument_group("stand-in faults (without --url)")
+    faults.add_argument("--latency-ms", type=float, default=0.0)
+    faults.add_argument("--jitter-ms", type=float, default=0.0)
+    faults.add_argument("--error-rate", type=float, default=0.0)
+    faults.add_argument("--rate-limit-rate", type=float, default=0.0)
+    faults.add_argument("--retry-after", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    server = None
+    url = args.url
+    if url is None:
+        from .standin import StandInServer, FaultConfig
+
+        server = StandInServer(seed=args.seed, faults=FaultConfig(
+            latency=args.latency_ms / 1000,
+            jitter=args.jitter_ms / 1000,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            retry_after=args.retry_after,
+        )).start()
+        url = server.url
+
+    client = BlackRoadClient(
+        api_key=args.api_key,
+        base_url=url,
+        retry=RetryPolicy(max_attempts=args.retries),
+        transport=TransportConfig(
+            max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+        ),
+    )
+    try:
+        report = run_load(
+            client, args.duration, args.concurrency, args.mix, args.seed, args.agents
+        )
+    finally:
+        client.close()
+        if server is not None:
+            server.stop()
+
+    print(report.format())
+    if server is not None:
+        print(server.stats())
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,22 @@ BlackRoad OS Memory System
 Access the distributed memory system for agent coordination.
 """
 
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Iterator, AsyncIterator, TYPE_CHECKING
+from datetime import datetime, timedelta
 
+from .models import Model, ModelBatch, Field, slots, parse_datetime
+from .pagination import iter_pages, aiter_pages, iter_items, aiter_items
 
-@dataclass
-class MemoryEntry:
+if TYPE_CHECKING:
+    from .batching import MemoryLogBuffer
+    from .columnar import ColumnTable
+    from .outbox import MemoryOutbox
+    from .query import MemoryIndex
+    from .replica import MemoryReplica
+    from .verify import VerificationResult
+
+
+class MemoryEntry(Model):
     """A single memory journal entry."""
     id: str
     timestamp: datetime
@@ -18,19 +27,55 @@ class MemoryEntry:
     entity: str
     details: str
     tags: List[str]
-    agent_id: Optional[str] = None
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "MemoryEntry":
-        return cls(
-            id=data["id"],
-            timestamp=datetime.fromisoformat(data["timestamp"]),
-            action=data["action"],
-            entity=data["entity"],
-            details=data["details"],
-            tags=data.get("tags", []),
-            agent_id=data.get("agent_id"),
-        )
+    agent_id: Optional[str]
+    hash: Optional[str]
+    previous_hash: Optional[str]
+
+    _fields = (
+        Field("id"),
+        Field("timestamp", decode=parse_datetime),
+        Field("action"),
+        Field("entity"),
+        Field("details"),
+        Field("tags", default_factory=list),
+        Field("agent_id", default=None),
+        Field("hash", default=None),
+        Field("previous_hash", default=None),
+    )
+    __slots__ = slots(*_fields)
+
+
+def _log_body(
+    action: str, entity: str, details: str, tags: Optional[List[str]]
+) -> Dict[str, Any]:
+    return {
+        "action": action,
+        "entity": entity,
+        "details": details,
+        "tags": tags or [],
+    }
+
+
+def _search_params(
+    query: Optional[str],
+    tags: Optional[List[str]],
+    action: Optional[str],
+    agent_id: Optional[str],
+    since: Optional[datetime],
+    limit: int,
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"limit": limit}
+    if query:
+        params["q"] = query
+    if tags:
+        params["tags"] = ",".join(tags)
+    if action:
+        params["action"] = action
+    if agent_id:
+        params["agent_id"] = agent_id
+    if since:
+        params["since"] = since.isoformat()
+    return params
 
 
 class MemorySystem:
@@ -62,14 +107,40 @@ class MemorySystem:
         Actions: announce, progress, deployed, created, configured,
                  decided, coordinate, blocked, fixed, validated, milestone
         """
-        data = {
-            "action": action,
-            "entity": entity,
-            "details": details,
-            "tags": tags or [],
-        }
-        response = self._client.post("/v1/memory/log", data=data)
-        return MemoryEntry.from_dict(response)
+        data = _log_body(action, entity, details, tags)
+        return self._client.post("/v1/memory/log", data=data, model=MemoryEntry)
+
+    def buffered(self, **options) -> "MemoryLogBuffer":
+        """
+        Create a buffered logger that batches entries in the background.
+
+        Options are passed to :class:`~blackroad.batching.MemoryLogBuffer`
+        (``batch_size``, ``max_bytes``, ``flush_interval``,
+        ``max_concurrency``, ``max_queue``, ``bulk_endpoint``).
+        """
+        from .batching import MemoryLogBuffer
+
+        return MemoryLogBuffer(self, **options)
+
+    def outbox(self, path: str, **options) -> "MemoryOutbox":
+        """
+        Open (or resume) a durable on-disk outbox at ``path``; its ``log()``
+        returns once the entry is spooled and delivery happens in the
+        background.
+
+        Options are passed to :class:`~blackroad.outbox.MemoryOutbox`
+        (``batch_size``, ``segment_bytes``, ``sync_interval``,
+        ``retry_base``, ``retry_max``, ``bulk_endpoint``, ``on_reject``).
+        """
+        from .outbox import MemoryOutbox
+
+        return MemoryOutbox(self, path, **options)
+
+    def replica(self, path: str) -> "MemoryReplica":
+        """Open (or create) an on-disk replica of the journal at ``path``."""
+        from .replica import MemoryReplica
+
+        return MemoryReplica(path, self)
 
     def search(
         self,
@@ -80,21 +151,127 @@ class MemorySystem:
         since: Optional[datetime] = None,
         limit: int = 100,
     ) -> List[MemoryEntry]:
-        """Search memory entries."""
-        params = {"limit": limit}
-        if query:
-            params["q"] = query
-        if tags:
-            params["tags"] = ",".join(tags)
-        if action:
-            params["action"] = action
-        if agent_id:
-            params["agent_id"] = agent_id
-        if since:
-            params["since"] = since.isoformat()
+        """
+        Search memory entries.
+
+        Filters combine with AND, and ``tags`` matches entries carrying
+        every listed tag (the API's ``tags=a,b`` semantics).
+        """
+        params = _search_params(query, tags, action, agent_id, since, limit)
+        return self._client.get(
+            "/v1/memory/search", params=params, model=MemoryEntry, key="entries"
+        )
 
+    def search_batch(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        action: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> ModelBatch[MemoryEntry]:
+        """Search memory entries into a columnar :class:`~blackroad.models.ModelBatch`."""
+        params = _search_params(query, tags, action, agent_id, since, limit)
         response = self._client.get("/v1/memory/search", params=params)
-        return [MemoryEntry.from_dict(e) for e in response.get("entries", [])]
+        return ModelBatch(MemoryEntry, response.get("entries", []))
+
+    def iter_search(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        action: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        page_size: int = 100,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[MemoryEntry]:
+        """
+        Iterate over every matching entry, fetching pages lazily.
+
+        The next page is prefetched in the background while the current
+        one is consumed; at most two pages are held in memory.
+        """
+        params = _search_params(query, tags, action, agent_id, since, page_size)
+        pages = iter_pages(
+            self._client.get, "/v1/memory/search", params, "entries", prefetch
+        )
+        return iter_items(pages, MemoryEntry.from_dict, max_items)
+
+    def index(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        action: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        page_size: int = 500,
+        max_items: Optional[int] = None,
+    ) -> "MemoryIndex":
+        """
+        Fetch matching entries into a :class:`~blackroad.query.MemoryIndex`
+        for local compound filtering.
+        """
+        from .query import MemoryIndex
+
+        return MemoryIndex(
+            self.iter_search(query, tags, action, agent_id, since, page_size, max_items)
+        )
+
+    def export(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        action: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        page_size: int = 1000,
+        max_items: Optional[int] = None,
+    ) -> "ColumnTable":
+        """
+        Fetch matching entries into a columnar
+        :class:`~blackroad.columnar.ColumnTable` for analytics, without
+        building a model per entry.
+        """
+        from .columnar import ColumnTable, MEMORY_SCHEMA
+
+        params = _search_params(query, tags, action, agent_id, since, page_size)
+        pages = iter_pages(self._client.get, "/v1/memory/search", params, "entries")
+        return ColumnTable.build(MEMORY_SCHEMA, pages, max_items)
+
+    def verify(
+        self,
+        checkpoint_path: Optional[str] = None,
+        key: Optional[bytes] = None,
+        workers: int = 1,
+        page_size: int = 1000,
+    ) -> "VerificationResult":
+        """
+        Verify the journal's hash chain locally.
+
+        With ``checkpoint_path`` only entries after the last signed
+        checkpoint are fetched and re-hashed; the checkpoint is signed with
+        ``key`` (defaults to the client's API key). ``workers > 1`` hashes
+        segments on a process pool.
+
+        Entries are streamed in the order the server returns them, which
+        must be chain order; nothing is buffered beyond the page being
+        verified. When resuming, the search starts just before the
+        checkpoint's timestamp so entries sharing that timestamp are not
+        lost whether the server treats ``since`` as inclusive or exclusive.
+        """
+        from .verify import ChainVerifier
+
+        if checkpoint_path and key is None:
+            key = self._client.api_key.encode()
+        verifier = ChainVerifier(key=key, checkpoint_path=checkpoint_path)
+        checkpoint = verifier.load_checkpoint()
+        since = None
+        if checkpoint is not None:
+            since = parse_datetime(checkpoint.timestamp) - timedelta(microseconds=1)
+        entries = self.iter_search(since=since, page_size=page_size)
+        return verifier.verify(entries, workers=workers)
 
     def summary(self) -> Dict[str, Any]:
         """Get memory system summary."""
@@ -103,3 +280,98 @@ class MemorySystem:
     def context(self, agent_id: str) -> Dict[str, Any]:
         """Get real-time context for an agent."""
         return self._client.get(f"/v1/memory/context/{agent_id}")
+
+
+class AsyncMemorySystem:
+    """
+    Asyncio counterpart of :class:`MemorySystem`.
+
+    Example:
+        >>> await client.memory.log("progress", "api-gateway", "Migrated routes")
+        >>> entries = await client.memory.search(tags=["prod"])
+    """
+
+    def __init__(self, client):
+        self._client = client
+
+    async def log(
+        self,
+        action: str,
+        entity: str,
+        details: str,
+        tags: Optional[List[str]] = None,
+    ) -> MemoryEntry:
+        """Log an entry to the memory system."""
+        data = _log_body(action, entity, details, tags)
+        return await self._client.post("/v1/memory/log", data=data, model=MemoryEntry)
+
+    async def search(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        action: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[MemoryEntry]:
+        """Search memory entries."""
+        params = _search_params(query, tags, action, agent_id, since, limit)
+        return await self._client.get(
+            "/v1/memory/search", params=params, model=MemoryEntry, key="entries"
+        )
+
+    async def search_batch(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        action: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> ModelBatch[MemoryEntry]:
+        """Search memory entries into a columnar :class:`~blackroad.models.ModelBatch`."""
+        params = _search_params(query, tags, action, agent_id, since, limit)
+        response = await self._client.get("/v1/memory/search", params=params)
+        return ModelBatch(MemoryEntry, response.get("entries", []))
+
+    def iter_search(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        action: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        page_size: int = 100,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[MemoryEntry]:
+        """Iterate over every matching entry with ``async for``."""
+        params = _search_params(query, tags, action, agent_id, since, page_size)
+        pages = aiter_pages(
+            self._client.get, "/v1/memory/search", params, "entries", prefetch
+        )
+        return aiter_items(pages, MemoryEntry.from_dict, max_items)
+
+    async def index(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        action: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        page_size: int = 500,
+        max_items: Optional[int] = None,
+    ) -> "MemoryIndex":
+        """Fetch matching entries into a :class:`~blackroad.query.MemoryIndex`."""
+        from .query import MemoryIndex
+
+        entries = self.iter_search(query, tags, action, agent_id, since, page_size, max_items)
+        return MemoryIndex([entry async for entry in entries])
+
+    async def summary(self) -> Dict[str, Any]:
+        """Get memory system summary."""
+        return await self._client.get("/v1/memory/summary")
+
+    async def context(self, agent_id: str) -> Dict[str, Any]:
+        """Get real-time context for an agent."""
+        return await self._client.get(f"/v1/memory/context/{agent_id}")
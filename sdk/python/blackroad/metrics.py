@@ -0,0 +1,489 @@
+"""
+BlackRoad OS Request Metrics
+
+Per-phase request hooks, latency histograms and a Prometheus text exporter.
+"""
+
+import re
+import time
+import bisect
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+    from http.server import ThreadingHTTPServer
+    from .codec import JSONCodec
+    from .compression import CompressionConfig
+
+
+# Request phases, in the order they happen.
+PHASES = (
+    "encode", "compress", "pool_wait", "connect", "network", "backoff", "decode", "build",
+)
+
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+_ROUTES = tuple(
+    (re.compile(pattern), template)
+    for pattern, template in (
+        (r"^/v1/agents/[^/]+/heartbeat$", "/v1/agents/{agentId}/heartbeat"),
+        (r"^/v1/agents/[^/]+$", "/v1/agents/{agentId}"),
+        (r"^/v1/memory/context/[^/]+$", "/v1/memory/context/{agentId}"),
+        (r"^/v1/codex/components/[^/]+$", "/v1/codex/components/{componentId}"),
+        (r"^/v1/tasks/[^/]+/(claim|complete)$", r"/v1/tasks/{taskId}/\1"),
+        (r"^/v1/traffic-lights/[^/]+$", "/v1/traffic-lights/{projectId}"),
+    )
+)
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(endpoint: str) -> str:
+    """Collapse IDs in ``endpoint`` so metrics are kept per route, not per object."""
+    path = endpoint.split("?", 1)[0]
+    for pattern, template in _ROUTES:
+        if pattern.match(path):
+            return pattern.sub(template, path)
+    return path
+
+
+class RequestHook:
+    """
+    Receives the phases of every request made by a client.
+
+    Subclass and override any of the methods; ``on_phase`` is called as
+    each phase completes (``network`` and ``backoff`` once per attempt),
+    ``on_end`` once with the finished :class:`RequestTrace`. Hooks run on
+    the calling thread (or event loop), so keep them fast.
+    """
+
+    def on_start(self, trace: "RequestTrace"):
+        pass
+
+    def on_phase(self, trace: "RequestTrace", phase: str, seconds: float):
+        pass
+
+    def on_end(self, trace: "RequestTrace"):
+        pass
+
+
+class RequestTrace:
+    """
+    Timings and sizes of one logical request, across its retries.
+
+    ``phases`` maps a phase name from :data:`PHASES` to seconds spent in
+    it. ``pool_wait`` and ``connect`` come from the transport's connection
+    events and are absent for transports that do not report them.
+    Byte counts are as sent and received on the wire; the ``_raw``
+    counterparts are before compression and after decompression.
+    """
+
+    __slots__ = (
+        "method", "endpoint", "path", "phases", "status", "attempts",
+        "bytes_sent", "bytes_received", "bytes_sent_raw", "bytes_received_raw",
+        "error", "duration", "extensions",
+        "_hooks", "_started", "_attempt_started", "_events", "_raw_size",
+    )
+
+    def __init__(self, method: str, path: str, hooks: Sequence[RequestHook]):
+        self.method = method
+        self.path = path
+        self.endpoint = endpoint_template(path)
+        self.phases: Dict[str, float] = {}
+        self.status: Optional[int] = None
+        self.attempts = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.bytes_sent_raw = 0
+        self.bytes_received_raw = 0
+        self.error: Optional[BaseException] = None
+        self.duration = 0.0
+        self.extensions = {"trace": self._event}
+        self._hooks = hooks
+        self._started = time.perf_counter()
+        self._attempt_started = 0.0
+        self._events: Dict[str, float] = {}
+        self._raw_size = 0
+        for hook in hooks:
+            hook.on_start(self)
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+    def phase(self, name: str, seconds: float):
+        """Add ``seconds`` to phase ``name``."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        for hook in self._hooks:
+            hook.on_phase(self, name, seconds)
+
+    def encode(self, codec: "JSONCodec", data: Any) -> bytes:
+        start = time.perf_counter()
+        content = codec.dumps(data)
+        self.phase("encode", time.perf_counter() - start)
+        return content
+
+    def compress(self, compression: "CompressionConfig", content: bytes) -> bytes:
+        start = time.perf_counter()
+        compressed = compression.compress(content)
+        self.phase("compress", time.perf_counter() - start)
+        self._raw_size = len(content)
+        return compressed
+
+    def decode(self, codec: "JSONCodec", data: bytes, model=None, key=None) -> Any:
+        start = time.perf_counter()
+        payload = codec.loads(data)
+        parsed = time.perf_counter()
+        value = codec.build(payload, model, key)
+        self.phase("decode", parsed - start)
+        self.phase("build", time.perf_counter() - parsed)
+        return value
+
+    def attempt(self, content: Optional[bytes]):
+        """Mark the start of a send attempt."""
+        self.attempts += 1
+        if content:
+            self.bytes_sent += len(content)
+            self.bytes_sent_raw += self._raw_size or len(content)
+        self._events = {}
+        self._attempt_started = time.perf_counter()
+
+    def received(self, response: Optional["httpx.Response"]):
+        """Close the current attempt with its response (None on a transport error)."""
+        end = time.perf_counter()
+        events = self._events
+        sending = events.get("send_request_headers.started")
+        connecting = events.get("connection.connect_tcp.started")
+        if sending is None:
+            # No connection events (mock or custom transport, or the
+            # connection failed): the whole attempt counts as network.
+            self.phase("network", end - self._attempt_started)
+        else:
+            first = connecting if connecting is not None else sending
+            self.phase("pool_wait", first - self._attempt_started)
+            if connecting is not None:
+                connected = events.get(
+                    "connection.start_tls.complete",
+                    events.get("connection.connect_tcp.complete", sending),
+                )
+                self.phase("connect", connected - connecting)
+            self.phase("network", end - sending)
+        if response is not None:
+            self.status = response.status_code
+            size = len(response.content)
+            # Responses not read from a socket (e.g. mock transports)
+            # report no downloaded bytes; count their body instead.
+            self.bytes_received += response.num_bytes_downloaded or size
+            self.bytes_received_raw += size
+
+    def backoff(self, seconds: float):
+        self.phase("backoff", seconds)
+
+    def finish(self, value: Any = None, error: Optional[BaseException] = None) -> Any:
+        """End the request, report it to the hooks and pass ``value`` through."""
+        self.duration = time.perf_counter() - self._started
+        self.error = error
+        for hook in self._hooks:
+            hook.on_end(self)
+        return value
+
+    def _event(self, name: str, info: Dict[str, Any]):
+        # httpcore trace callback; HTTP/1.1 and HTTP/2 events share names
+        # once the protocol prefix is dropped.
+        if name.startswith("http"):
+            name = name.split(".", 1)[1]
+        self._events.setdefault(name, time.perf_counter())
+
+    async def _aevent(self, name: str, info: Dict[str, Any]):
+        self._event(name, info)
+
+    def use_async(self) -> "RequestTrace":
+        """Switch the transport callback to the coroutine form httpx's async client needs."""
+        self.extensions = {"trace": self._aevent}
+        return self
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus ``le`` semantics."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile by interpolating within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """``(le, count)`` pairs including ``+Inf``."""
+        pairs = []
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return pairs
+
+
+@dataclass
+class EndpointStats:
+    """Aggregated metrics for one method and endpoint."""
+    method: str
+    endpoint: str
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    bytes_sent_raw: int = 0
+    bytes_received_raw: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+    mean: float = 0.0
+    p50: float = 0.0
+    p99: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes compression kept off the wire, both directions."""
+        return (
+            self.bytes_sent_raw - self.bytes_sent
+            + self.bytes_received_raw - self.bytes_received
+        )
+
+
+class _Series:
+    __slots__ = (
+        "latency", "phases", "statuses", "errors", "retries", "bytes_sent",
+        "bytes_received", "bytes_sent_raw", "bytes_received_raw",
+    )
+
+    def __init__(self, buckets: Sequence[float]):
+        self.latency = Histogram(buckets)
+        self.phases: Dict[str, Histogram] = {}
+        self.statuses: Dict[int, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.bytes_sent_raw = 0
+        self.bytes_received_raw = 0
+
+
+def _label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RequestMetrics(RequestHook):
+    """
+    Per-endpoint latency histograms and request counters.
+
+    Pass it as a client hook; each finished request is folded in under
+    one lock. :meth:`endpoints` gives in-process summaries, :meth:`render`
+    the Prometheus text format and :meth:`serve` a local ``/metrics``
+    endpoint.
+
+    Example:
+        >>> metrics = RequestMetrics()
+        >>> client = BlackRoadClient(hooks=[metrics])
+        >>> client.agents.list()
+        >>> metrics.endpoints()[0]
+        EndpointStats(method='GET', endpoint='/v1/agents', requests=1, ...)
+        >>> metrics.serve(port=9464)   # scrape http://127.0.0.1:9464/metrics
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, namespace: str = "blackroad"):
+        self.buckets = tuple(sorted(buckets))
+        self.namespace = namespace
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._lock = threading.Lock()
+
+    def on_end(self, trace: RequestTrace):
+        key = (trace.method, trace.endpoint)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(self.buckets)
+            series.latency.observe(trace.duration)
+            for phase, seconds in trace.phases.items():
+                histogram = series.phases.get(phase)
+                if histogram is None:
+                    histogram = series.phases[phase] = Histogram(self.buckets)
+                histogram.observe(seconds)
+            if trace.status is not None:
+                series.statuses[trace.status] = series.statuses.get(trace.status, 0) + 1
+            if trace.error is not None:
+                name = type(trace.error).__name__
+                series.errors[name] = series.errors.get(name, 0) + 1
+            series.retries += trace.retries
+            series.bytes_sent += trace.bytes_sent
+            series.bytes_received += trace.bytes_received
+            series.bytes_sent_raw += trace.bytes_sent_raw
+            series.bytes_received_raw += trace.bytes_received_raw
+
+    def endpoints(self) -> List[EndpointStats]:
+        """Summary per (method, endpoint), busiest first."""
+        with self._lock:
+            stats = [
+                EndpointStats(
+                    method=method,
+                    endpoint=endpoint,
+                    requests=series.latency.count,
+                    errors=sum(series.errors.values()),
+                    retries=series.retries,
+                    bytes_sent=series.bytes_sent,
+                    bytes_received=series.bytes_received,
+                    bytes_sent_raw=series.bytes_sent_raw,
+                    bytes_received_raw=series.bytes_received_raw,
+                    statuses=dict(series.statuses),
+                    mean=series.latency.sum / series.latency.count,
+                    p50=series.latency.quantile(0.5),
+                    p99=series.latency.quantile(0.99),
+                    phases={
+                        phase: histogram.sum / histogram.count
+                        for phase, histogram in series.phases.items()
+                    },
+                )
+                for (method, endpoint), series in self._series.items()
+            ]
+        return sorted(stats, key=lambda s: -s.requests)
+
+    def reset(self):
+        """Drop everything recorded so far."""
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        ns = self.namespace
+        lines: List[str] = []
+
+        def header(name: str, kind: str, help: str):
+            lines.append(f"# HELP {ns}_{name} {help}")
+            lines.append(f"# TYPE {ns}_{name} {kind}")
+
+        def histogram(name: str, labels: str, hist: Histogram):
+            for le, count in hist.cumulative():
+                lines.append(f'{ns}_{name}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{ns}_{name}_sum{{{labels}}} {hist.sum!r}")
+            lines.append(f"{ns}_{name}_count{{{labels}}} {hist.count}")
+
+        with self._lock:
+            series = sorted(self._series.items())
+            base = [
+                (f'method="{_label(m)}",endpoint="{_label(e)}"', s) for (m, e), s in series
+            ]
+
+            header("request_duration_seconds", "histogram", "Request latency including retries.")
+            for labels, s in base:
+                histogram("request_duration_seconds", labels, s.latency)
+
+            header("request_phase_seconds", "histogram", "Time spent in each request phase.")
+            for labels, s in base:
+                for phase in PHASES:
+                    if phase in s.phases:
+                        histogram(
+                            "request_phase_seconds",
+                            f'{labels},phase="{phase}"',
+                            s.phases[phase],
+                        )
+
+            header("responses_total", "counter", "Final responses by status code.")
+            for labels, s in base:
+                for status, count in sorted(s.statuses.items()):
+                    lines.append(f'{ns}_responses_total{{{labels},status="{status}"}} {count}')
+
+            header("request_errors_total", "counter", "Requests that raised, by exception type.")
+            for labels, s in base:
+                for error, count in sorted(s.errors.items()):
+                    lines.append(
+                        f'{ns}_request_errors_total{{{labels},error="{_label(error)}"}} {count}'
+                    )
+
+            header("request_retries_total", "counter", "Retried attempts.")
+            for labels, s in base:
+                lines.append(f"{ns}_request_retries_total{{{labels}}} {s.retries}")
+
+            header("request_bytes_total", "counter", "Request body bytes sent on the wire.")
+            for labels, s in base:
+                lines.append(f"{ns}_request_bytes_total{{{labels}}} {s.bytes_sent}")
+
+            header(
+                "request_bytes_uncompressed_total",
+                "counter",
+                "Request body bytes before compression.",
+            )
+            for labels, s in base:
+                lines.append(
+                    f"{ns}_request_bytes_uncompressed_total{{{labels}}} {s.bytes_sent_raw}"
+                )
+
+            header("response_bytes_total", "counter", "Response body bytes received on the wire.")
+            for labels, s in base:
+                lines.append(f"{ns}_response_bytes_total{{{labels}}} {s.bytes_received}")
+
+            header(
+                "response_bytes_uncompressed_total",
+                "counter",
+                "Response body bytes after decompression.",
+            )
+            for labels, s in base:
+                lines.append(
+                    f"{ns}_response_bytes_uncompressed_total{{{labels}}} {s.bytes_received_raw}"
+                )
+
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1") -> "ThreadingHTTPServer":
+        """
+        Serve :meth:`render` at ``http://host:port/metrics`` from a daemon
+        thread. Returns the server; call ``shutdown()`` on it to stop.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(
+            target=server.serve_forever, name="blackroad-metrics", daemon=True
+        ).start()
+        return server
@@ -0,0 +1,266 @@
+"""
+BlackRoad OS Model Base
+
+Slotted, lazily-decoded model objects and a columnar container for bulk results.
+"""
+
+import sys
+from datetime import datetime
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Generic,
+    FrozenSet,
+    overload,
+)
+
+
+M = TypeVar("M", bound="Model")
+
+_MISSING: Any = object()
+
+
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp from the API; empty values become None."""
+    if not value:
+        return None
+    if value.endswith("Z") and sys.version_info < (3, 11):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+class Field:
+    """
+    Declares one model attribute.
+
+    The value is read from the raw API payload on first access, passed
+    through ``decode`` (skipped for ``None``) and kept in the instance's
+    slot. ``key`` is the payload key when it differs from the attribute
+    name (e.g. camelCase). Fields without a default are required in the
+    payload.
+    """
+
+    __slots__ = ("name", "key", "decode", "default", "default_factory", "slot")
+
+    def __init__(
+        self,
+        name: str,
+        decode: Optional[Callable[[Any], Any]] = None,
+        default: Any = _MISSING,
+        default_factory: Optional[Callable[[], Any]] = None,
+        key: Optional[str] = None,
+    ):
+        self.name = name
+        self.key = key or name
+        self.decode = decode
+        self.default = default
+        self.default_factory = default_factory
+        self.slot: Any = None
+
+    @property
+    def required(self) -> bool:
+        return self.default is _MISSING and self.default_factory is None
+
+    def missing(self) -> Any:
+        if self.default_factory is not None:
+            return self.default_factory()
+        return self.default
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            return self.slot.__get__(obj, owner)
+        except AttributeError:
+            pass
+        value = obj._raw.get(self.key, _MISSING)
+        if value is _MISSING:
+            value = self.missing()
+        elif value is not None and self.decode is not None:
+            value = self.decode(value)
+        self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+
+def slots(*fields: Field) -> Tuple[str, ...]:
+    """Slot names backing ``fields``; assign to ``__slots__`` in the model body."""
+    return tuple(f"_{field.name}" for field in fields)
+
+
+class Model:
+    """
+    Base for API models.
+
+    Subclasses list their ``_fields`` and matching ``__slots__``. Instances
+    built with :meth:`from_dict` keep the raw payload and decode each field
+    only when it is first read, so bulk results cost little more than the
+    parsed JSON until they are used.
+    """
+
+    __slots__ = ("_raw",)
+    __hash__ = None  # type: ignore[assignment]
+
+    _fields: Tuple[Field, ...] = ()
+    _required: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for field in cls.__dict__.get("_fields", ()):
+            field.slot = cls.__dict__[f"_{field.name}"]
+            setattr(cls, field.name, field)
+        cls._required = frozenset(f.key for f in cls._fields if f.required)
+
+    def __init__(self, *args, **kwargs):
+        if len(args) > len(self._fields):
+            raise TypeError(
+                f"{type(self).__name__}() takes at most {len(self._fields)} "
+                f"positional arguments ({len(args)} given)"
+            )
+        self._raw: Dict[str, Any] = {}
+        for field, value in zip(self._fields, args):
+            field.slot.__set__(self, value)
+        for field in self._fields[len(args):]:
+            if field.name in kwargs:
+                field.slot.__set__(self, kwargs.pop(field.name))
+            elif field.required:
+                raise TypeError(
+                    f"{type(self).__name__}() missing required argument: '{field.name}'"
+                )
+            else:
+                field.slot.__set__(self, field.missing())
+        if kwargs:
+            raise TypeError(
+                f"{type(self).__name__}() got an unexpected keyword argument "
+                f"'{next(iter(kwargs))}'"
+            )
+
+    @classmethod
+    def from_dict(cls: Type[M], data: Dict[str, Any]) -> M:
+        """Wrap an API payload without decoding it."""
+        if not cls._required <= data.keys():
+            missing = sorted(cls._required - data.keys())
+            raise KeyError(missing[0])
+        obj = cls.__new__(cls)
+        obj._raw = data
+        return obj
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Field values keyed by name (decoded)."""
+        return {field.name: getattr(self, field.name) for field in self._fields}
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(
+            getattr(self, f.name) == getattr(other, f.name) for f in self._fields
+        )
+
+    def __repr__(self):
+        values = ", ".join(f"{f.name}={getattr(self, f.name)!r}" for f in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def __getstate__(self):
+        return {f.name: getattr(self, f.name) for f in self._fields}
+
+    def __setstate__(self, state):
+        self._raw = {}
+        for field in self._fields:
+            field.slot.__set__(self, state[field.name])
+
+
+class ModelBatch(Sequence[M], Generic[M]):
+    """
+    Columnar container for bulk results.
+
+    Rows are transposed into one list per field as they arrive, so the
+    per-row payload dicts can be freed. Model objects are only built when
+    an item is indexed; whole columns are available with :meth:`column`.
+
+    Example:
+        >>> batch = client.memory.search_batch(limit=100_000)
+        >>> actions = batch.column("action")
+        >>> first = batch[0]          # MemoryEntry, built on demand
+    """
+
+    __slots__ = ("model", "columns", "_keys", "_length")
+
+    def __init__(self, model: Type[M], rows: Iterable[Dict[str, Any]] = ()):
+        self.model = model
+        self.columns: Dict[str, List[Any]] = {f.name: [] for f in model._fields}
+        self._keys = [(f.key, self.columns[f.name]) for f in model._fields]
+        self._length = 0
+        self.extend(rows)
+
+    def extend(self, rows: Iterable[Dict[str, Any]]):
+        """Append raw API rows."""
+        required = self.model._required
+        columns = [(key, column.append) for key, column in self._keys]
+        for row in rows:
+            if not required <= row.keys():
+                raise KeyError(sorted(required - row.keys())[0])
+            get = row.get
+            for key, append in columns:
+                append(get(key, _MISSING))
+            self._length += 1
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[M]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ModelBatch index out of range")
+        return self.model.from_dict(self.row(index))
+
+    def __iter__(self) -> Iterator[M]:
+        for index in range(self._length):
+            yield self.model.from_dict(self.row(index))
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """The raw payload for one row."""
+        return {
+            key: column[index]
+            for key, column in self._keys
+            if column[index] is not _MISSING
+        }
+
+    def column(self, name: str, decode: bool = False) -> List[Any]:
+        """
+        Values of one field for every row.
+
+        Missing values come back as the field default. With ``decode`` the
+        field's decoder (e.g. timestamp parsing) is applied.
+        """
+        field = getattr(self.model, name)
+        values = []
+        for value in self.columns[name]:
+            if value is _MISSING:
+                value = field.missing()
+            elif decode and value is not None and field.decode is not None:
+                value = field.decode(value)
+            values.append(value)
+        return values
+
+    def __repr__(self):
+        return f"ModelBatch({self.model.__name__}, {self._length} rows)"
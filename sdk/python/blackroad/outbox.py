@@ -0,0 +1,456 @@
+"""
+BlackRoad OS Memory Outbox
+
+Durable on-disk spool for memory log entries, drained in the background.
+"""
+
+import os
+import json
+import zlib
+import random
+import struct
+import threading
+from dataclasses import dataclass, replace
+from typing import Optional, List, Dict, Any, Callable, Iterator, Tuple, BinaryIO
+
+from .batching import _post_bulk
+from .memory import _log_body
+
+
+# sequence number, payload length, CRC-32 of the payload
+_RECORD = struct.Struct("<QII")
+
+_SUFFIX = ".seg"
+
+# Statuses that condemn the entry itself. Anything else, including auth and
+# routing errors (401, 403, 404, 405), fails the whole drain and is retried.
+_PAYLOAD_ERRORS = frozenset({400, 409, 413, 422})
+
+
+@dataclass
+class OutboxStats:
+    """Counters for a :class:`MemoryOutbox` (``logged``, ``sent`` and ``rejected`` are per process)."""
+    logged: int = 0
+    sent: int = 0
+    rejected: int = 0
+    unconfirmed: int = 0
+    callback_errors: int = 0
+    retries: int = 0
+    pending: int = 0
+    segments: int = 0
+    last_error: Optional[str] = None
+
+
+class _Segment:
+    __slots__ = ("first_seq", "last_seq", "path", "size")
+
+    def __init__(self, first_seq: int, last_seq: int, path: str, size: int):
+        self.first_seq = first_seq
+        self.last_seq = last_seq
+        self.path = path
+        self.size = size
+
+
+def _records(data: bytes) -> Iterator[Tuple[int, int]]:
+    """(sequence, end offset) of each intact record; stops at a torn or corrupt one."""
+    offset = 0
+    while offset + _RECORD.size <= len(data):
+        seq, length, crc = _RECORD.unpack_from(data, offset)
+        start = offset + _RECORD.size
+        end = start + length
+        if end > len(data) or zlib.crc32(data[start:end]) != crc:
+            return
+        yield seq, end
+        offset = end
+
+
+class MemoryOutbox:
+    """
+    Write-ahead outbox for ``MemorySystem.log``.
+
+    ``log()`` appends the entry to a segmented spool under ``path`` and
+    returns its sequence number without touching the network. Writes
+    reach the OS immediately, so a crashed process loses nothing; a
+    background thread fsyncs them every ``sync_interval`` seconds (0
+    fsyncs inside ``log()``), bounding what a power loss can take.
+
+    A drainer thread replays the spool in order, ``batch_size`` entries
+    at a time (in one request when ``bulk_endpoint`` is set), backing off
+    between ``retry_base`` and ``retry_max`` seconds while the API is
+    unavailable. Progress is recorded in a cursor file and fully sent
+    segments are deleted. Entries the API rejects for their own content
+    (400, 409, 413 or 422) are moved to ``rejected.jsonl`` and passed to
+    ``on_reject`` so they cannot block the queue; exceptions from
+    ``on_reject`` are counted in ``callback_errors``. Auth and routing
+    errors (401, 403, 404, 405) are retried like an outage, so a bad key
+    or ``bulk_endpoint`` never empties the spool. A bulk request the server accepted but whose
+    reply cannot be matched to the batch counts as sent (and
+    ``unconfirmed``) rather than being sent again. Delivery is
+    at-least-once: an entry sent just before a crash may be sent again on
+    restart.
+
+    Example:
+        >>> outbox = client.memory.outbox("~/.blackroad/outbox")
+        >>> outbox.log("progress", "etl-job", "finished step 3")
+        1042
+        >>> outbox.flush(timeout=30)
+        True
+        >>> outbox.close()
+    """
+
+    def __init__(
+        self,
+        memory,
+        path: str,
+        batch_size: int = 100,
+        segment_bytes: int = 4 * 1024 * 1024,
+        sync_interval: float = 0.05,
+        retry_base: float = 1.0,
+        retry_max: float = 60.0,
+        bulk_endpoint: Optional[str] = None,
+        on_reject: Optional[Callable[[Dict[str, Any], Exception], None]] = None,
+    ):
+        self._memory = memory
+        self.path = os.path.expanduser(path)
+        self.batch_size = batch_size
+        self.segment_bytes = segment_bytes
+        self.sync_interval = sync_interval
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.bulk_endpoint = bulk_endpoint
+        self.on_reject = on_reject
+
+        os.makedirs(self.path, exist_ok=True)
+        self._cursor_path = os.path.join(self.path, "cursor")
+        self._rejected_path = os.path.join(self.path, "rejected.jsonl")
+        self._lock_file = self._acquire()
+
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._closed = False
+        self._stats = OutboxStats()
+        self._segments: List[_Segment] = []
+        self._acked = self._load_cursor()
+        self._next_seq = self._acked + 1
+        self._recover()
+        self._fd: Optional[int] = None
+        self._dirty = False
+
+        # Drainer-only read position.
+        self._read_seq = self._acked
+        self._reader: Optional[BinaryIO] = None
+        self._reader_segment: Optional[_Segment] = None
+        self._reader_offset = 0
+
+        self._threads = [
+            threading.Thread(target=self._drain, name="blackroad-outbox-drain", daemon=True)
+        ]
+        if sync_interval > 0:
+            self._threads.append(
+                threading.Thread(target=self._sync_loop, name="blackroad-outbox-sync", daemon=True)
+            )
+        for thread in self._threads:
+            thread.start()
+
+    def log(
+        self,
+        action: str,
+        entity: str,
+        details: str,
+        tags: Optional[List[str]] = None,
+    ) -> int:
+        """Spool an entry for delivery. Returns its sequence number."""
+        payload = json.dumps(
+            _log_body(action, entity, details, tags), separators=(",", ":")
+        ).encode()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("MemoryOutbox is closed")
+            seq = self._next_seq
+            record = _RECORD.pack(seq, len(payload), zlib.crc32(payload)) + payload
+            segment = self._writable(len(record))
+            os.write(self._fd, record)
+            self._next_seq += 1
+            segment.size += len(record)
+            segment.last_seq = seq
+            self._stats.logged += 1
+            if self.sync_interval > 0:
+                self._dirty = True
+            else:
+                os.fsync(self._fd)
+            self._cond.notify_all()
+        return seq
+
+    def sync(self):
+        """Fsync spooled entries now."""
+        with self._cond:
+            if self._fd is not None and self._dirty:
+                os.fsync(self._fd)
+                self._dirty = False
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything logged so far has been sent (or rejected)."""
+        with self._cond:
+            target = self._next_seq - 1
+            return self._cond.wait_for(lambda: self._acked >= target, timeout)
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """
+        Try to deliver what is spooled for up to ``timeout`` seconds, then
+        stop. Anything unsent stays on disk for the next outbox on ``path``.
+        """
+        with self._cond:
+            if self._closed:
+                return
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self.sync()
+        with self._cond:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        if self._reader is not None:
+            self._reader.close()
+        self._lock_file.close()
+
+    @property
+    def pending(self) -> int:
+        """Entries spooled but not yet sent."""
+        with self._cond:
+            return self._next_seq - 1 - self._acked
+
+    def stats(self) -> OutboxStats:
+        with self._cond:
+            return replace(
+                self._stats,
+                pending=self._next_seq - 1 - self._acked,
+                segments=len(self._segments),
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    # Spool files.
+
+    def _acquire(self) -> BinaryIO:
+        """Hold an exclusive lock on the spool directory (POSIX only)."""
+        handle = open(os.path.join(self.path, "lock"), "a+b")
+        try:
+            import fcntl
+        except ImportError:
+            return handle
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            raise RuntimeError(f"Outbox at {self.path} is in use by another process") from None
+        return handle
+
+    def _load_cursor(self) -> int:
+        try:
+            with open(self._cursor_path) as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _save_cursor(self, seq: int):
+        tmp = self._cursor_path + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(f"{seq}\n")
+        os.replace(tmp, self._cursor_path)
+
+    def _recover(self):
+        """Index existing segments, cut torn tails and drop fully sent segments."""
+        names = sorted(n for n in os.listdir(self.path) if n.endswith(_SUFFIX))
+        for name in names:
+            path = os.path.join(self.path, name)
+            with open(path, "rb") as f:
+                data = f.read()
+            last_seq, end = None, 0
+            for last_seq, end in _records(data):
+                pass
+            if end < len(data):
+                with open(path, "r+b") as f:
+                    f.truncate(end)
+            if last_seq is None or last_seq <= self._acked:
+                os.remove(path)
+                continue
+            self._segments.append(_Segment(int(name[:-len(_SUFFIX)]), last_seq, path, end))
+            self._next_seq = max(self._next_seq, last_seq + 1)
+
+    def _writable(self, size: int) -> _Segment:
+        """The segment to append to, rolling over when full. Caller holds the lock."""
+        if self._fd is not None:
+            segment = self._segments[-1]
+            if segment.size + size <= self.segment_bytes or not segment.size:
+                return segment
+            os.fsync(self._fd)
+            os.close(self._fd)
+            self._dirty = False
+        path = os.path.join(self.path, f"{self._next_seq:020d}{_SUFFIX}")
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._sync_directory()
+        segment = _Segment(self._next_seq, self._next_seq - 1, path, 0)
+        self._segments.append(segment)
+        return segment
+
+    def _sync_directory(self):
+        """Make a new segment's directory entry durable (no-op where unsupported)."""
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def _sync_loop(self):
+        while not self._stop.wait(self.sync_interval):
+            try:
+                self.sync()
+            except OSError:
+                pass
+
+    # Draining.
+
+    def _has_unread(self) -> bool:
+        return bool(self._segments) and self._segments[-1].last_seq > self._read_seq
+
+    def _read(self, limit: int) -> List[Tuple[int, bytes]]:
+        """Next spooled records after the read position, in order."""
+        records: List[Tuple[int, bytes]] = []
+        while len(records) < limit:
+            with self._cond:
+                segment = next(
+                    (s for s in self._segments if s.last_seq > self._read_seq), None
+                )
+                if segment is None:
+                    break
+                size = segment.size
+            if segment is not self._reader_segment:
+                if self._reader is not None:
+                    self._reader.close()
+                self._reader = open(segment.path, "rb")
+                self._reader_segment = segment
+                self._reader_offset = 0
+            self._reader.seek(self._reader_offset)
+            while len(records) < limit and self._reader_offset < size:
+                seq, length, _ = _RECORD.unpack(self._reader.read(_RECORD.size))
+                payload = self._reader.read(length)
+                self._reader_offset += _RECORD.size + length
+                if seq > self._read_seq:
+                    records.append((seq, payload))
+                    self._read_seq = seq
+        return records
+
+    def _drain(self):
+        batch: List[Tuple[int, bytes]] = []
+        failures = 0
+        while True:
+            if not batch:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._closed or self._has_unread())
+                    if self._closed:
+                        return
+                batch = self._read(self.batch_size)
+                continue
+            handled, error = self._send(batch)
+            if handled:
+                self._ack(batch[handled - 1][0])
+                batch = batch[handled:]
+                failures = 0
+            if error is not None:
+                failures += 1
+                with self._cond:
+                    self._stats.retries += 1
+                    self._stats.last_error = repr(error)
+                delay = min(self.retry_max, self.retry_base * 2 ** (failures - 1))
+                if self._stop.wait(delay * random.uniform(0.5, 1.0)):
+                    return
+
+    def _send(self, batch: List[Tuple[int, bytes]]) -> Tuple[int, Optional[Exception]]:
+        """Deliver ``batch`` in order. Returns (records handled, error that stopped it)."""
+        bodies = [json.loads(payload) for _, payload in batch]
+        if self.bulk_endpoint:
+            try:
+                _post_bulk(self._memory, self.bulk_endpoint, bodies)
+            except ValueError as exc:
+                # The server accepted the batch but its reply was malformed or
+                # did not match it; sending again would duplicate the entries.
+                self._count("sent", len(batch))
+                self._count("unconfirmed", len(batch))
+                with self._cond:
+                    self._stats.last_error = repr(exc)
+                return len(batch), None
+            except Exception as exc:
+                # A rejected bulk request is retried entry by entry to find the culprit.
+                if not self._rejects(exc):
+                    return 0, exc
+            else:
+                self._count("sent", len(batch))
+                return len(batch), None
+        handled = 0
+        for (seq, _), body in zip(batch, bodies):
+            try:
+                self._memory._client.post("/v1/memory/log", data=body)
+            except Exception as exc:
+                if not self._rejects(exc):
+                    return handled, exc
+                self._reject(seq, body, exc)
+            else:
+                self._count("sent", 1)
+            handled += 1
+        return handled, None
+
+    def _rejects(self, exc: Exception) -> bool:
+        """
+        Whether ``exc`` condemns the entry itself rather than the drain.
+
+        An expired key or a wrong ``bulk_endpoint`` fails every entry
+        alike; those errors back off and retry so the spool is kept.
+        """
+        response = getattr(exc, "response", None)
+        if response is None:
+            return False
+        return response.status_code in _PAYLOAD_ERRORS
+
+    def _reject(self, seq: int, body: Dict[str, Any], exc: Exception):
+        with open(self._rejected_path, "a") as f:
+            f.write(json.dumps({"seq": seq, "entry": body, "error": str(exc)}) + "\n")
+        self._count("rejected", 1)
+        if self.on_reject is None:
+            return
+        try:
+            self.on_reject(body, exc)
+        except Exception as callback_exc:
+            with self._cond:
+                self._stats.callback_errors += 1
+                self._stats.last_error = repr(callback_exc)
+
+    def _count(self, name: str, n: int):
+        with self._cond:
+            setattr(self._stats, name, getattr(self._stats, name) + n)
+
+    def _ack(self, seq: int):
+        """Record delivery through ``seq`` and delete segments it completes."""
+        self._save_cursor(seq)
+        with self._cond:
+            self._acked = seq
+            # The newest segment may still be written to; it goes once superseded.
+            done = [s for s in self._segments[:-1] if s.last_seq <= seq]
+            if done:
+                self._segments = self._segments[len(done):]
+            self._cond.notify_all()
+        for segment in done:
+            os.remove(segment.path)
@@ -0,0 +1,169 @@
+"""
+BlackRoad OS Pagination
+
+Lazy page iteration with background prefetch for list and search endpoints.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    List,
+    Dict,
+    Any,
+    Callable,
+    Awaitable,
+    Iterator,
+    AsyncIterator,
+)
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Future
+
+
+def _next_params(
+    params: Dict[str, Any], response: Dict[str, Any], key: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Parameters for the page after ``response``, or None on the last page.
+
+    Servers that return ``next_cursor`` are followed by cursor; otherwise
+    pages advance by ``offset`` until a short page comes back or the
+    reported ``total`` is reached.
+    """
+    if "next_cursor" in response:
+        cursor = response["next_cursor"]
+        return dict(params, cursor=cursor) if cursor else None
+    items = response.get(key, [])
+    if len(items) < params["limit"]:
+        return None
+    offset = params.get("offset", 0) + len(items)
+    total = response.get("total")
+    if isinstance(total, int) and offset >= total:
+        return None
+    return dict(params, offset=offset)
+
+
+def _repeated(previous: Optional[List[Any]], items: List[Any]) -> bool:
+    """
+    True if ``items`` starts where the previous page did.
+
+    ``offset`` is not part of every endpoint's contract; a server that
+    ignores it returns the first page again, and paging would never end.
+    """
+    return bool(previous and items and items[0] == previous[0])
+
+
+def iter_pages(
+    get: Callable[..., Dict[str, Any]],
+    endpoint: str,
+    params: Dict[str, Any],
+    key: str,
+    prefetch: bool = True,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield raw result pages from ``endpoint`` one at a time.
+
+    With ``prefetch`` the next page is requested on a background thread
+    while the caller consumes the current one, so at most two pages are
+    held in memory.
+    """
+    executor = None
+    if prefetch:
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=1)
+    pending: Optional["Future"] = None
+    try:
+        response = get(endpoint, params=params)
+        previous: Optional[List[Dict[str, Any]]] = None
+        while True:
+            items = response.get(key, [])
+            if _repeated(previous, items):
+                return
+            following = _next_params(params, response, key)
+            if following is not None and executor is not None:
+                pending = executor.submit(get, endpoint, params=following)
+            yield items
+            if following is None:
+                return
+            if pending is not None:
+                response, pending = pending.result(), None
+            else:
+                response = get(endpoint, params=following)
+            params, previous = following, items
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiter_pages(
+    get: Callable[..., Awaitable[Dict[str, Any]]],
+    endpoint: str,
+    params: Dict[str, Any],
+    key: str,
+    prefetch: bool = True,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Asyncio counterpart of :func:`iter_pages`, prefetching on a task."""
+    import asyncio
+
+    pending: Optional["asyncio.Task"] = None
+    try:
+        response = await get(endpoint, params=params)
+        previous: Optional[List[Dict[str, Any]]] = None
+        while True:
+            items = response.get(key, [])
+            if _repeated(previous, items):
+                return
+            following = _next_params(params, response, key)
+            if following is not None and prefetch:
+                pending = asyncio.ensure_future(get(endpoint, params=following))
+            yield items
+            if following is None:
+                return
+            if pending is not None:
+                response, pending = await pending, None
+            else:
+                response = await get(endpoint, params=following)
+            params, previous = following, items
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def iter_items(
+    pages: Iterator[List[Dict[str, Any]]],
+    from_dict: Callable[[Dict[str, Any]], Any],
+    limit: Optional[int] = None,
+) -> Iterator[Any]:
+    """Flatten pages into model objects, stopping after ``limit`` items."""
+    count = 0
+    try:
+        for page in pages:
+            for item in page:
+                if limit is not None and count >= limit:
+                    return
+                yield from_dict(item)
+                count += 1
+    finally:
+        pages.close()  # type: ignore[attr-defined]
+
+
+async def aiter_items(
+    pages: AsyncIterator[List[Dict[str, Any]]],
+    from_dict: Callable[[Dict[str, Any]], Any],
+    limit: Optional[int] = None,
+) -> AsyncIterator[Any]:
+    """Asyncio counterpart of :func:`iter_items`."""
+    count = 0
+    try:
+        async for page in pages:
+            for item in page:
+                if limit is not None and count >= limit:
+                    return
+                yield from_dict(item)
+                count += 1
+    finally:
+        await pages.aclose()  # type: ignore[attr-defined]
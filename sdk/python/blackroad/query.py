@@ -0,0 +1,354 @@
+"""
+BlackRoad OS Memory Query
+
+Indexed local filtering over fetched or replicated memory entries.
+"""
+
+import bisect
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Set, Tuple
+
+from .memory import MemoryEntry
+from .replica import _to_micros
+
+
+# Set bit positions of each byte value, low to high.
+_BYTE_BITS = tuple(tuple(i for i in range(8) if b >> i & 1) for b in range(256))
+_BYTE_BITS_DESC = tuple(bits[::-1] for bits in _BYTE_BITS)
+
+# Cached filter masks kept per index before the cache is reset.
+_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class Filter:
+    """
+    A node of a query over a :class:`MemoryIndex`.
+
+    Build leaves with :func:`tag`, :func:`action`, :func:`agent`,
+    :func:`between` and :func:`text`, and combine them with ``&``, ``|``
+    and ``~``. Filters are hashable, so an index caches the result of
+    every sub-expression it evaluates.
+
+    Example:
+        >>> where = tag("prod") & (action("deployed") | action("fixed")) & ~agent("ci")
+    """
+    op: str
+    args: Tuple[Any, ...]
+
+    def __and__(self, other: "Filter") -> "Filter":
+        return Filter("and", _flatten("and", self, other))
+
+    def __or__(self, other: "Filter") -> "Filter":
+        return Filter("or", _flatten("or", self, other))
+
+    def __invert__(self) -> "Filter":
+        return Filter("not", (self,))
+
+
+def _flatten(op: str, *filters: Filter) -> Tuple[Filter, ...]:
+    parts: List[Filter] = []
+    for f in filters:
+        parts.extend(f.args if f.op == op else (f,))
+    return tuple(parts)
+
+
+def tag(*names: str) -> Filter:
+    """
+    Entries carrying every one of ``names``, as the API's ``tags`` filter
+    does; use ``tag("a") | tag("b")`` for any of them.
+    """
+    return Filter("tag", names)
+
+
+def action(*names: str) -> Filter:
+    """Entries whose action is any of ``names``."""
+    return Filter("action", names)
+
+
+def agent(*agent_ids: Optional[str]) -> Filter:
+    """Entries logged by any of ``agent_ids`` (None matches unattributed entries)."""
+    return Filter("agent", agent_ids)
+
+
+def between(since: Optional[datetime] = None, until: Optional[datetime] = None) -> Filter:
+    """Entries with ``since <= timestamp < until``; either bound may be open."""
+    return Filter("range", (
+        _to_micros(since) if since else None,
+        _to_micros(until) if until else None,
+    ))
+
+
+def text(query: str) -> Filter:
+    """Entries whose details or entity contain ``query``, ignoring case."""
+    return Filter("text", (query.lower(),))
+
+
+def _bitmap(positions: Iterable[int], size: int) -> int:
+    buf = bytearray((size + 7) // 8)
+    for p in positions:
+        buf[p >> 3] |= 1 << (p & 7)
+    return int.from_bytes(buf, "little")
+
+
+def _bits(mask: int, newest_first: bool) -> Iterator[int]:
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    if newest_first:
+        for i in range(len(data) - 1, -1, -1):
+            byte = data[i]
+            if byte:
+                base = i << 3
+                for bit in _BYTE_BITS_DESC[byte]:
+                    yield base + bit
+    else:
+        for i, byte in enumerate(data):
+            if byte:
+                base = i << 3
+                for bit in _BYTE_BITS[byte]:
+                    yield base + bit
+
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+if hasattr(int, "bit_count"):  # Python 3.10+
+    _popcount = int.bit_count  # noqa: F811
+
+
+class MemoryIndex:
+    """
+    In-memory secondary indexes over a set of memory entries.
+
+    Entries are held in timestamp order; position ``i`` is bit ``i`` of
+    every bitmap. Tags, actions and agent ids map to compact arrays of
+    the positions holding them, and timestamps to a sorted array so time
+    ranges are two bisections. A key's bitmap is built from its positions
+    the first time a filter uses it and cached, so memory grows with the
+    entries indexed and the keys queried, not with keys times entries.
+    Compound filters are ANDs and ORs of integers, and results are read
+    newest first straight off the final bitmap. Entries with an id
+    already indexed are skipped.
+
+    Example:
+        >>> index = client.memory.index(since=datetime(2026, 10, 1))
+        >>> index.query(tag("prod") & action("deployed", "fixed"), limit=10)
+        [MemoryEntry(...), ...]
+        >>> index.facets("action", where=agent("agent_123"))
+        {'progress': 40, 'deployed': 3}
+        >>> index.extend(client.memory.iter_search(since=index.last_timestamp))
+    """
+
+    def __init__(self, entries: Iterable[MemoryEntry] = ()):
+        self._entries: List[MemoryEntry] = []
+        self._timestamps: List[int] = []
+        self._ids: Set[str] = set()
+        self._tags: Dict[str, "array[int]"] = {}
+        self._actions: Dict[str, "array[int]"] = {}
+        self._agents: Dict[Optional[str], "array[int]"] = {}
+        self._cache: Dict[Filter, int] = {}
+        self.extend(entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[MemoryEntry]:
+        return iter(self._entries)
+
+    @property
+    def last_timestamp(self) -> Optional[datetime]:
+        """Timestamp of the newest indexed entry."""
+        return self._entries[-1].timestamp if self._entries else None
+
+    def tags(self) -> List[str]:
+        return sorted(self._tags)
+
+    def actions(self) -> List[str]:
+        return sorted(self._actions)
+
+    def agents(self) -> List[Optional[str]]:
+        return sorted(self._agents, key=lambda a: (a is None, a or ""))
+
+    def extend(self, entries: Iterable[MemoryEntry]) -> int:
+        """
+        Index more entries. Returns the count added.
+
+        Entries no older than the newest indexed one are appended to the
+        existing position arrays; anything older triggers a rebuild in
+        timestamp order. Cached bitmaps are dropped either way.
+        """
+        fresh = []
+        for entry in entries:
+            if entry.id not in self._ids:
+                self._ids.add(entry.id)
+                fresh.append((_to_micros(entry.timestamp), entry))
+        if not fresh:
+            return 0
+        added = len(fresh)
+        fresh.sort(key=lambda item: item[0])
+        self._cache.clear()
+        if self._timestamps and fresh[0][0] < self._timestamps[-1]:
+            keyed = list(zip(self._timestamps, self._entries)) + fresh
+            keyed.sort(key=lambda item: item[0])
+            self._entries, self._timestamps = [], []
+            self._tags, self._actions, self._agents = {}, {}, {}
+            fresh = keyed
+
+        start = len(self._entries)
+        tags: Dict[str, List[int]] = {}
+        actions: Dict[str, List[int]] = {}
+        agents: Dict[Optional[str], List[int]] = {}
+        for position, (ts, entry) in enumerate(fresh, start):
+            self._timestamps.append(ts)
+            self._entries.append(entry)
+            for name in entry.tags:
+                tags.setdefault(name, []).append(position)
+            actions.setdefault(entry.action, []).append(position)
+            agents.setdefault(entry.agent_id, []).append(position)
+        for target, positions in ((self._tags, tags), (self._actions, actions),
+                                  (self._agents, agents)):
+            for key, found in positions.items():
+                target.setdefault(key, array("q")).extend(found)
+        return added
+
+    def query(
+        self,
+        where: Optional[Filter] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = 100,
+        newest_first: bool = True,
+    ) -> List[MemoryEntry]:
+        """Entries matching ``where`` within ``[since, until)``, the newest ``limit`` first."""
+        mask = self._select(where, since, until)
+        results = []
+        if limit is not None and limit <= 0:
+            return results
+        for position in _bits(mask, newest_first):
+            results.append(self._entries[position])
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def count(
+        self,
+        where: Optional[Filter] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> int:
+        """Number of entries matching ``where`` within ``[since, until)``."""
+        return _popcount(self._select(where, since, until))
+
+    def facets(
+        self,
+        by: str,
+        where: Optional[Filter] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Dict[Any, int]:
+        """Matching entries counted per ``"tag"``, ``"action"`` or ``"agent_id"``."""
+        index = {"tag": self._tags, "action": self._actions, "agent_id": self._agents}
+        if by not in index:
+            raise ValueError(f"Cannot facet by {by!r}; choose from {sorted(index)}")
+        if where is None and since is None and until is None:
+            counts = {key: len(positions) for key, positions in index[by].items()}
+        else:
+            # One flag per entry, then a pass over each key's positions;
+            # no per-key bitmap is built.
+            selected = bytearray(len(self._entries))
+            for position in _bits(self._select(where, since, until), False):
+                selected[position] = 1
+            counts = {
+                key: sum(selected[p] for p in positions)
+                for key, positions in index[by].items()
+            }
+        return {key: n for key, n in sorted(counts.items(), key=lambda kv: -kv[1]) if n}
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        action: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[MemoryEntry]:
+        """Search the index, newest first. Mirrors ``MemorySystem.search``."""
+        parts = []
+        if query:
+            parts.append(text(query))
+        if tags:
+            parts.append(Filter("tag", tuple(tags)))
+        if action:
+            parts.append(Filter("action", (action,)))
+        if agent_id:
+            parts.append(Filter("agent", (agent_id,)))
+        where = Filter("and", tuple(parts)) if parts else None
+        return self.query(where, since=since, limit=limit)
+
+    def _select(
+        self, where: Optional[Filter], since: Optional[datetime], until: Optional[datetime]
+    ) -> int:
+        mask = (1 << len(self._entries)) - 1
+        if since is not None or until is not None:
+            mask &= self._mask(between(since, until))
+        if where is not None:
+            mask &= self._mask(where)
+        return mask
+
+    def _mask(self, f: Filter) -> int:
+        mask = self._cache.get(f)
+        if mask is not None:
+            return mask
+        op, args = f.op, f.args
+        if op == "and":
+            mask = (1 << len(self._entries)) - 1
+            # Cheapest-first so an empty intermediate ends the scan early.
+            for part in sorted(args, key=lambda p: p.op == "text"):
+                mask &= self._mask(part)
+                if not mask:
+                    break
+        elif op == "or":
+            mask = 0
+            for part in args:
+                mask |= self._mask(part)
+        elif op == "not":
+            mask = ((1 << len(self._entries)) - 1) & ~self._mask(args[0])
+        elif op in ("tag", "action", "agent") and len(args) == 1:
+            index = {"tag": self._tags, "action": self._actions, "agent": self._agents}[op]
+            positions = index.get(args[0])
+            mask = _bitmap(positions, len(self._entries)) if positions else 0
+        elif op == "tag":
+            mask = (1 << len(self._entries)) - 1
+            for name in args:
+                mask &= self._mask(Filter(op, (name,)))
+        elif op in ("action", "agent"):
+            mask = 0
+            for key in args:
+                mask |= self._mask(Filter(op, (key,)))
+        elif op == "range":
+            since, until = args
+            start = bisect.bisect_left(self._timestamps, since) if since is not None else 0
+            stop = (
+                bisect.bisect_left(self._timestamps, until)
+                if until is not None
+                else len(self._timestamps)
+            )
+            mask = ((1 << stop) - 1) ^ ((1 << start) - 1) if stop > start else 0
+        elif op == "text":
+            needle = args[0]
+            mask = _bitmap(
+                (
+                    i for i, e in enumerate(self._entries)
+                    if needle in e.details.lower() or needle in e.entity.lower()
+                ),
+                len(self._entries),
+            )
+        else:
+            raise ValueError(f"Unknown filter operation {op!r}")
+        if len(self._cache) >= _CACHE_SIZE:
+            self._cache.clear()
+        self._cache[f] = mask
+        return mask
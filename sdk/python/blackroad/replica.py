@@ -0,0 +1,249 @@
+"""
+BlackRoad OS Memory Replica
+
+Local append-only copy of the memory journal with incremental sync.
+"""
+
+import os
+import json
+import mmap
+import struct
+import bisect
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Iterator, Set, TYPE_CHECKING
+
+from .memory import MemoryEntry, _search_params
+from .pagination import iter_pages
+
+if TYPE_CHECKING:
+    from .query import MemoryIndex
+
+
+# offset into journal.dat, timestamp in epoch microseconds, record length
+_INDEX_RECORD = struct.Struct("<QqI")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_micros(value: datetime) -> int:
+    """Epoch microseconds; naive timestamps are treated as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+class MemoryReplica:
+    """
+    On-disk replica of the memory journal.
+
+    Entries are appended to ``journal.dat`` in timestamp order and located
+    through a fixed-width offset index in ``journal.idx``; both files are
+    memory-mapped for reads. ``sync()`` fetches only entries newer than the
+    last one stored, using the server's ``since`` filter.
+
+    Example:
+        >>> replica = client.memory.replica("~/.blackroad/journal")
+        >>> replica.sync()
+        42
+        >>> deploys = replica.search(action="deployed", limit=10)
+    """
+
+    def __init__(self, path: str, memory=None):
+        self.path = os.path.expanduser(path)
+        os.makedirs(self.path, exist_ok=True)
+        self._memory = memory
+        self._data_path = os.path.join(self.path, "journal.dat")
+        self._index_path = os.path.join(self.path, "journal.idx")
+
+        self._data = open(self._data_path, "a+b")
+        self._index = open(self._index_path, "a+b")
+        self._data_map: Optional[mmap.mmap] = None
+        self._index_map: Optional[mmap.mmap] = None
+        self._timestamps: List[int] = []
+        self._boundary_ids: Set[str] = set()
+        self._recover()
+        self._remap()
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __iter__(self) -> Iterator[MemoryEntry]:
+        return self.entries()
+
+    @property
+    def last_timestamp(self) -> Optional[datetime]:
+        """Timestamp of the newest replicated entry."""
+        if not self._timestamps:
+            return None
+        return self._read(len(self._timestamps) - 1).timestamp
+
+    def sync(self, page_size: int = 500) -> int:
+        """Fetch entries newer than the last replicated one. Returns the count added."""
+        if self._memory is None:
+            raise RuntimeError("MemoryReplica was opened without a MemorySystem")
+        params = _search_params(None, None, None, None, self.last_timestamp, page_size)
+        pages = iter_pages(
+            self._memory._client.get, "/v1/memory/search", params, "entries"
+        )
+        fresh = [raw for page in pages for raw in page]
+        return self.append(fresh)
+
+    def append(self, raw_entries: List[Dict[str, Any]]) -> int:
+        """
+        Append raw API entries, skipping ones already stored.
+
+        Entries older than the newest stored timestamp are ignored so the
+        journal stays sorted; ``since`` is inclusive, so entries sharing the
+        boundary timestamp are de-duplicated by id.
+        """
+        last = self._timestamps[-1] if self._timestamps else None
+        keyed = []
+        for raw in raw_entries:
+            ts = _to_micros(MemoryEntry.from_dict(raw).timestamp)
+            if last is not None and (
+                ts < last or (ts == last and raw["id"] in self._boundary_ids)
+            ):
+                continue
+            keyed.append((ts, raw))
+        if not keyed:
+            return 0
+        keyed.sort(key=lambda item: item[0])
+
+        self._data.seek(0, os.SEEK_END)
+        offset = self._data.tell()
+        records = bytearray()
+        for ts, raw in keyed:
+            line = json.dumps(raw, separators=(",", ":")).encode() + b"\n"
+            self._data.write(line)
+            records += _INDEX_RECORD.pack(offset, ts, len(line))
+            offset += len(line)
+            if self._timestamps and ts != self._timestamps[-1]:
+                self._boundary_ids.clear()
+            self._timestamps.append(ts)
+            self._boundary_ids.add(raw["id"])
+        # Data before index: a crash between the two leaves unindexed bytes
+        # that _recover() truncates on the next open.
+        self._data.flush()
+        os.fsync(self._data.fileno())
+        self._index.write(records)
+        self._index.flush()
+        os.fsync(self._index.fileno())
+        self._remap()
+        return len(keyed)
+
+    def entries(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        reverse: bool = False,
+    ) -> Iterator[MemoryEntry]:
+        """Iterate replicated entries in timestamp order within ``[since, until)``."""
+        start, stop = self._range(since, until)
+        positions = range(stop - 1, start - 1, -1) if reverse else range(start, stop)
+        for position in positions:
+            yield self._read(position)
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        action: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[MemoryEntry]:
+        """
+        Search the local replica, newest first. Mirrors ``MemorySystem.search``:
+        entries must carry every tag in ``tags``.
+        """
+        needle = query.lower() if query else None
+        wanted = set(tags) if tags else None
+        results: List[MemoryEntry] = []
+        for entry in self.entries(since=since, reverse=True):
+            if action and entry.action != action:
+                continue
+            if agent_id and entry.agent_id != agent_id:
+                continue
+            if wanted and not wanted.issubset(entry.tags):
+                continue
+            if needle and not (
+                needle in entry.details.lower() or needle in entry.entity.lower()
+            ):
+                continue
+            results.append(entry)
+            if len(results) >= limit:
+                break
+        return results
+
+    def index(
+        self, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> "MemoryIndex":
+        """Load entries within ``[since, until)`` into a :class:`~blackroad.query.MemoryIndex`."""
+        from .query import MemoryIndex
+
+        return MemoryIndex(self.entries(since, until))
+
+    def close(self):
+        """Unmap and close the journal files."""
+        for view in (self._data_map, self._index_map):
+            if view is not None:
+                view.close()
+        self._data_map = self._index_map = None
+        self._data.close()
+        self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _range(self, since: Optional[datetime], until: Optional[datetime]):
+        start = bisect.bisect_left(self._timestamps, _to_micros(since)) if since else 0
+        stop = (
+            bisect.bisect_left(self._timestamps, _to_micros(until))
+            if until
+            else len(self._timestamps)
+        )
+        return start, stop
+
+    def _read(self, position: int) -> MemoryEntry:
+        offset, _, length = _INDEX_RECORD.unpack_from(
+            self._index_map, position * _INDEX_RECORD.size
+        )
+        return MemoryEntry.from_dict(json.loads(self._data_map[offset:offset + length]))
+
+    def _recover(self):
+        """Drop a torn index record and any data written after the last indexed entry."""
+        size = os.path.getsize(self._index_path)
+        whole = size - size % _INDEX_RECORD.size
+        if whole != size:
+            self._index.truncate(whole)
+        data_end = 0
+        self._index.seek(0)
+        raw = self._index.read(whole)
+        for offset, ts, length in _INDEX_RECORD.iter_unpack(raw):
+            self._timestamps.append(ts)
+            data_end = offset + length
+        if os.path.getsize(self._data_path) > data_end:
+            self._data.truncate(data_end)
+        if self._timestamps:
+            last = self._timestamps[-1]
+            first = bisect.bisect_left(self._timestamps, last)
+            self._remap()
+            self._boundary_ids = {
+                self._read(i).id for i in range(first, len(self._timestamps))
+            }
+
+    def _remap(self):
+        for name, handle in (("_data_map", self._data), ("_index_map", self._index)):
+            view = getattr(self, name)
+            if view is not None:
+                view.close()
+            size = os.fstat(handle.fileno()).st_size
+            if size:
+                view = mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ)
+            else:
+                view = None
+            setattr(self, name, view)
@@ -0,0 +1,167 @@
+"""
+BlackRoad OS Retry and Rate Limiting
+
+Retry policy with exponential backoff and client-side token-bucket limiting.
+"""
+
+import time
+import random
+import threading
+from datetime import datetime, timezone
+from typing import Optional, FrozenSet, TYPE_CHECKING
+from dataclasses import dataclass
+
+if TYPE_CHECKING:
+    import httpx
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    Idempotent methods are retried on any transport error or retryable
+    status. Other methods (POST) are only retried when the request is known
+    not to have been processed: connection failures and the statuses in
+    ``retry_unsafe_statuses`` (429 by default).
+
+    Example:
+        >>> client = BlackRoadClient(retry=RetryPolicy(max_attempts=5))
+        >>> client = BlackRoadClient(retry=RetryPolicy(max_attempts=1))  # disable
+    """
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+    retry_unsafe_statuses: FrozenSet[int] = frozenset({429})
+    idempotent_methods: FrozenSet[str] = frozenset(
+        {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    )
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+
+    def is_idempotent(self, method: str) -> bool:
+        return method.upper() in self.idempotent_methods
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for the given attempt (0-based)."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional["httpx.Response"] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt, or None to give up.
+
+        Args:
+            method: HTTP method of the failed request
+            attempt: Number of attempts already made minus one
+            response: The error response, if one was received
+            error: The transport error, if no response was received
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+
+        if error is not None:
+            import httpx
+
+            if not isinstance(error, httpx.TransportError):
+                return None
+            sent = not isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+            if sent and not self.is_idempotent(method):
+                return None
+            return self.backoff(attempt)
+
+        if response is None or response.status_code not in self.retry_statuses:
+            return None
+        if (
+            not self.is_idempotent(method)
+            and response.status_code not in self.retry_unsafe_statuses
+        ):
+            return None
+
+        if self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        return self.backoff(attempt)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given as seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by every client that holds it.
+
+    Each request takes one token; tokens refill at ``rate`` per second up to
+    ``burst``. A 429 with ``Retry-After`` pauses the whole bucket so every
+    worker sharing it backs off together instead of retrying in a burst.
+
+    Example:
+        >>> limiter = RateLimiter(rate=50, burst=100)
+        >>> clients = [BlackRoadClient(rate_limiter=limiter) for _ in range(8)]
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait to use it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._paused_until - now)
+
+    def acquire(self):
+        """Block until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait on the event loop until a token is available."""
+        import asyncio
+
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold every caller for ``seconds``, e.g. after a 429."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
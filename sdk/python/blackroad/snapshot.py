@@ -0,0 +1,321 @@
+"""
+BlackRoad OS Codex Snapshot
+
+Offline copy of the Codex index with local BM25 search.
+"""
+
+import re
+import gzip
+import json
+import math
+import heapq
+import os
+from collections import defaultdict
+from typing import Optional, List, Dict, Any, Tuple, Set, Iterable
+
+from .codex import CodexComponent, _search_params
+from .pagination import iter_pages
+
+
+FORMAT_VERSION = 1
+
+_FIELDS = (
+    "name", "type", "language", "file_path",
+    "line_number", "signature", "docstring", "repository",
+)
+
+_WORD = re.compile(r"[A-Za-z0-9]+")
+_CAMEL = re.compile(r"[A-Z]+(?=[A-Z][a-z]|\d|\b)|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Split identifiers and prose into lowercase search terms.
+
+    ``getUserName`` and ``get_user_name`` both yield ``get``, ``user`` and
+    ``name``; compound identifiers also keep their joined form.
+    """
+    if not text:
+        return []
+    tokens = []
+    for word in _WORD.findall(text):
+        parts = _CAMEL.findall(word)
+        if len(parts) > 1:
+            tokens.append(word.lower())
+        tokens.extend(part.lower() for part in parts)
+    return tokens
+
+
+def _file_key(component: CodexComponent) -> Tuple[Optional[str], str]:
+    return (component.repository, component.file_path)
+
+
+class CodexSnapshot:
+    """
+    Local, searchable snapshot of the Codex.
+
+    Components are held with an inverted index over name, signature and
+    docstring and ranked with BM25 (name matches weigh more). Filters for
+    type, language and repository use precomputed id sets. Snapshots are
+    saved as gzip-compressed JSON with an interned string table. The
+    ``query`` and ``scope`` filters a snapshot was downloaded with are
+    kept (and saved), so :meth:`refresh` stays within them.
+
+    Example:
+        >>> snap = client.codex.snapshot()
+        >>> snap.save("codex.snap")
+        >>> snap = CodexSnapshot.load("codex.snap")
+        >>> snap.search("agent registry", language="python", limit=5)
+        [CodexComponent(name='AgentRegistry', ...), ...]
+    """
+
+    FIELD_WEIGHTS = {"name": 3.0, "signature": 1.0, "docstring": 1.0}
+
+    def __init__(
+        self,
+        components: Iterable[CodexComponent],
+        last_indexed: Optional[str] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+        query: str = "*",
+        scope: Optional[Dict[str, str]] = None,
+    ):
+        self.components: List[CodexComponent] = list(components)
+        self.last_indexed = last_indexed
+        self.query = query
+        # The type, language and repository filters given to download().
+        self.scope: Dict[str, str] = dict(scope or {})
+        # Whether the last refresh() got the whole index back instead of a delta.
+        self.last_refresh_full = False
+        self.k1 = k1
+        self.b = b
+        self._build_index()
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    @classmethod
+    def download(
+        cls,
+        codex,
+        query: str = "*",
+        type: Optional[str] = None,
+        language: Optional[str] = None,
+        repository: Optional[str] = None,
+        page_size: int = 500,
+    ) -> "CodexSnapshot":
+        """
+        Pull components from the API into a new snapshot.
+
+        ``query`` selects what to download; the default ``"*"`` asks for the
+        whole index.
+        """
+        stats = _stats(codex)
+        params = _search_params(query, type, language, repository, page_size)
+        components = cls._fetch(codex, params)
+        scope = {
+            name: value
+            for name, value in (("type", type), ("language", language), ("repository", repository))
+            if value
+        }
+        return cls(components, last_indexed=_last_indexed(stats), query=query, scope=scope)
+
+    def refresh(self, codex, page_size: int = 500) -> int:
+        """
+        Pull components re-indexed since this snapshot was taken, within
+        the query and filters it was downloaded with.
+
+        Does nothing when the server's ``last_indexed`` has not moved (read
+        past any ``codex_cache``). Each re-indexed file's components replace
+        the ones held for that file. Returns the number of components
+        received. Files deleted outright are only dropped by a full
+        :meth:`download`.
+
+        ``since`` is not part of the published search contract, and a
+        server that ignores it sends everything in scope. That is detected
+        by comparing the reply with the scope's size (the server's
+        ``totalComponents`` for an unfiltered ``"*"`` snapshot, otherwise
+        the ``total`` of a one-row search): the snapshot is then replaced
+        outright (which also drops deleted files) and
+        ``last_refresh_full`` is set, so callers can see that the refresh
+        cost a full download.
+        """
+        stats = _stats(codex)
+        last_indexed = _last_indexed(stats)
+        self.last_refresh_full = False
+        if last_indexed is not None and last_indexed == self.last_indexed:
+            return 0
+        params = self._params(page_size)
+        if self.last_indexed:
+            params["since"] = self.last_indexed
+        changed = self._fetch(codex, params)
+        total = self._scope_size(codex, stats) if changed else None
+        if isinstance(total, int) and len(changed) >= total:
+            self.last_refresh_full = True
+            self.components = changed
+            self._build_index()
+        elif changed:
+            files = {_file_key(c) for c in changed}
+            kept = [c for c in self.components if _file_key(c) not in files]
+            self.components = kept + changed
+            self._build_index()
+        self.last_indexed = last_indexed
+        return len(changed)
+
+    def search(
+        self,
+        query: str,
+        type: Optional[str] = None,
+        language: Optional[str] = None,
+        repository: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[CodexComponent]:
+        """Search the snapshot. Mirrors ``CodexSearch.search``."""
+        allowed = self._filter(type, language, repository)
+        if allowed is not None and not allowed:
+            return []
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            if not scores:
+                scores = dict(postings)
+                continue
+            get = scores.get
+            for doc, score in postings.items():
+                scores[doc] = get(doc, 0.0) + score
+        if allowed is not None:
+            scores = {doc: score for doc, score in scores.items() if doc in allowed}
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [self.components[doc] for doc, _ in best]
+
+    def save(self, path: str):
+        """Write the snapshot as gzip-compressed JSON with interned strings."""
+        strings: Dict[Optional[str], int] = {}
+
+        def intern(value: Optional[str]) -> int:
+            if value not in strings:
+                strings[value] = len(strings)
+            return strings[value]
+
+        rows = []
+        for c in self.components:
+            rows.append([
+                intern(c.name), intern(c.type), intern(c.language),
+                intern(c.file_path), c.line_number, intern(c.signature),
+                intern(c.docstring), intern(c.repository),
+            ])
+        payload = {
+            "version": FORMAT_VERSION,
+            "last_indexed": self.last_indexed,
+            "query": self.query,
+            "scope": self.scope,
+            "fields": list(_FIELDS),
+            "strings": list(strings),
+            "rows": rows,
+        }
+        tmp = f"{path}.tmp"
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "CodexSnapshot":
+        """Read a snapshot written by :meth:`save`."""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {payload.get('version')}")
+        strings = payload["strings"]
+        components = [
+            CodexComponent(
+                name=strings[r[0]], type=strings[r[1]], language=strings[r[2]],
+                file_path=strings[r[3]], line_number=r[4], signature=strings[r[5]],
+                docstring=strings[r[6]], repository=strings[r[7]],
+            )
+            for r in payload["rows"]
+        ]
+        return cls(
+            components,
+            last_indexed=payload.get("last_indexed"),
+            query=payload.get("query", "*"),
+            scope=payload.get("scope"),
+        )
+
+    def _params(self, limit: int) -> Dict[str, Any]:
+        scope = self.scope
+        return _search_params(
+            self.query, scope.get("type"), scope.get("language"), scope.get("repository"), limit
+        )
+
+    def _scope_size(self, codex, stats: Dict[str, Any]) -> Optional[int]:
+        """Components in this snapshot's scope on the server, if it says."""
+        if self.query == "*" and not self.scope:
+            return stats.get("total_components", stats.get("totalComponents"))
+        return codex._client.get("/v1/codex/search", params=self._params(1)).get("total")
+
+    @staticmethod
+    def _fetch(codex, params: Dict[str, Any]) -> List[CodexComponent]:
+        pages = iter_pages(codex._client.get, "/v1/codex/search", params, "components")
+        return [CodexComponent.from_dict(raw) for page in pages for raw in page]
+
+    def _filter(
+        self, type: Optional[str], language: Optional[str], repository: Optional[str]
+    ) -> Optional[Set[int]]:
+        selected: Optional[Set[int]] = None
+        for facet, value in (
+            (self._by_type, type),
+            (self._by_language, language),
+            (self._by_repository, repository),
+        ):
+            if value is None:
+                continue
+            ids = facet.get(value, set())
+            selected = ids if selected is None else selected & ids
+        return selected
+
+    def _build_index(self):
+        postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        lengths: List[float] = []
+        self._by_type: Dict[str, Set[int]] = defaultdict(set)
+        self._by_language: Dict[str, Set[int]] = defaultdict(set)
+        self._by_repository: Dict[str, Set[int]] = defaultdict(set)
+
+        for doc, component in enumerate(self.components):
+            self._by_type[component.type].add(doc)
+            self._by_language[component.language].add(doc)
+            if component.repository:
+                self._by_repository[component.repository].add(doc)
+            length = 0.0
+            for field_name, weight in self.FIELD_WEIGHTS.items():
+                for term in tokenize(getattr(component, field_name)):
+                    doc_terms = postings[term]
+                    doc_terms[doc] = doc_terms.get(doc, 0.0) + weight
+                    length += weight
+            lengths.append(length)
+
+        count = len(self.components)
+        average = (sum(lengths) / count) if count else 0.0
+        norms = [
+            self.k1 * (1 - self.b + self.b * (length / average if average else 0.0))
+            for length in lengths
+        ]
+        # BM25 term weights do not depend on the query, so each posting
+        # stores its final score and search only has to sum them.
+        self._postings: Dict[str, Dict[int, float]] = {}
+        for term, docs in postings.items():
+            idf = math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+            self._postings[term] = {
+                doc: idf * tf * (self.k1 + 1) / (tf + norms[doc])
+                for doc, tf in docs.items()
+            }
+
+
+def _stats(codex) -> Dict[str, Any]:
+    """Codex stats straight from the server, never from ``codex_cache``."""
+    return codex._client.get("/v1/codex/stats")
+
+
+def _last_indexed(stats: Dict[str, Any]) -> Optional[str]:
+    return stats.get("last_indexed") or stats.get("lastIndexed")
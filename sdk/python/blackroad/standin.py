@@ -0,0 +1,738 @@
+"""
+BlackRoad OS Stand-in Server
+
+Local in-memory implementation of the API for load and soak testing.
+"""
+
+import gzip
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, List, Dict, Any, Callable, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+
+# (method, path template, operationId). The first block mirrors
+# specs/api/openapi.yaml; the rest are endpoints the SDK also calls.
+ROUTES: Tuple[Tuple[str, str, str], ...] = (
+    ("GET", "/v1/agents", "listAgents"),
+    ("POST", "/v1/agents", "registerAgent"),
+    ("GET", "/v1/agents/{agentId}", "getAgent"),
+    ("POST", "/v1/memory/log", "logMemory"),
+    ("GET", "/v1/codex/search", "searchCodex"),
+    ("GET", "/v1/codex/stats", "getCodexStats"),
+    ("GET", "/v1/traffic-lights", "listTrafficLights"),
+    ("GET", "/v1/traffic-lights/{projectId}", "getTrafficLight"),
+    ("PUT", "/v1/traffic-lights/{projectId}", "setTrafficLight"),
+    ("GET", "/v1/tasks", "listTasks"),
+    ("POST", "/v1/tasks", "createTask"),
+    ("POST", "/v1/tasks/{taskId}/claim", "claimTask"),
+    ("POST", "/v1/tasks/{taskId}/complete", "completeTask"),
+    ("PUT", "/v1/agents/{agentId}", "updateAgent"),
+    ("DELETE", "/v1/agents/{agentId}", "deregisterAgent"),
+    ("POST", "/v1/agents/{agentId}/heartbeat", "heartbeatAgent"),
+    ("GET", "/v1/memory/search", "searchMemory"),
+    ("GET", "/v1/memory/summary", "getMemorySummary"),
+    ("GET", "/v1/memory/context/{agentId}", "getMemoryContext"),
+    ("GET", "/v1/codex/components/{componentId}", "getCodexComponent"),
+    ("GET", "/v1/codex/languages", "listCodexLanguages"),
+)
+
+WORDS = (
+    "agent registry memory journal codex search deploy route cache token "
+    "heartbeat worker queue stream index verify sync replica gateway"
+).split()
+
+
+def routes_from_spec(path: str) -> List[Tuple[str, str, str]]:
+    """
+    Read (method, path, operationId) routes from an OpenAPI document,
+    followed by the built-in routes the spec does not list.
+    Requires PyYAML for ``.yaml`` files.
+    """
+    with open(path) as f:
+        if path.endswith(".json"):
+            spec = json.load(f)
+        else:
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError(
+                    "Reading a YAML spec requires the 'PyYAML' package. "
+                    "Install it with: pip install pyyaml"
+                ) from None
+            spec = yaml.safe_load(f)
+    routes = [
+        (method.upper(), template, operation["operationId"])
+        for template, operations in spec.get("paths", {}).items()
+        for method, operation in operations.items()
+        if isinstance(operation, dict) and "operationId" in operation
+    ]
+    known = {(method, template) for method, template, _ in routes}
+    routes.extend(r for r in ROUTES if (r[0], r[1]) not in known)
+    return routes
+
+
+@dataclass
+class FaultConfig:
+    """
+    Faults injected into responses.
+
+    Every request waits ``latency`` seconds plus up to ``jitter`` more.
+    A fraction ``rate_limit_rate`` of requests then gets ``429`` with a
+    ``Retry-After`` of ``retry_after`` seconds, and a fraction
+    ``error_rate`` gets ``error_status``.
+    """
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    rate_limit_rate: float = 0.0
+    retry_after: float = 1.0
+
+
+@dataclass
+class StandInStats:
+    """Request counters for a :class:`StandInServer`."""
+    requests: int = 0
+    rate_limited: int = 0
+    errors_injected: int = 0
+    handler_errors: int = 0
+    by_operation: Dict[str, int] = field(default_factory=dict)
+
+
+# Handler exceptions answered with 400 rather than 500.
+_BAD_INPUT = (KeyError, TypeError, ValueError, AttributeError)
+
+
+class Rejected(Exception):
+    """Raised by a handler to answer with an error status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _limit(query: Dict[str, str], default: int) -> Tuple[int, int]:
+    try:
+        return int(query.get("limit", default)), int(query.get("offset", 0))
+    except ValueError:
+        raise Rejected(400, "limit and offset must be integers") from None
+
+
+def _require(body: Dict[str, Any], *names: str):
+    for name in names:
+        if name not in body:
+            raise Rejected(400, f"missing required field: {name}")
+
+
+class StandInState:
+    """In-memory data behind the stand-in server, seeded deterministically."""
+
+    def __init__(
+        self,
+        components: int = 2000,
+        projects: int = 200,
+        tasks: int = 200,
+        seed: int = 0,
+    ):
+        from .verify import GENESIS_HASH
+
+        rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.versions: Dict[str, int] = {"agents": 0, "tasks": 0, "traffic-lights": 0}
+        self.agents: Dict[str, Dict[str, Any]] = {}
+        self.memory: List[Dict[str, Any]] = []
+        self.last_hash = GENESIS_HASH
+        self.components = [self._component(rng, i) for i in range(components)]
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc).isoformat()
+        self.lights: Dict[str, Dict[str, Any]] = {
+            f"project-{i}": {
+                "projectId": f"project-{i}",
+                "status": rng.choices(["green", "yellow", "red"], [90, 8, 2])[0],
+                "reason": "seeded",
+                "updatedAt": start,
+                "updatedBy": "stand-in",
+                "history": [],
+            }
+            for i in range(projects)
+        }
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        for i in range(tasks):
+            self.tasks[f"task-{i}"] = {
+                "id": f"task-{i}",
+                "title": " ".join(rng.choice(WORDS) for _ in range(3)),
+                "description": " ".join(rng.choice(WORDS) for _ in range(12)),
+                "status": "available",
+                "priority": rng.choice(["urgent", "high", "medium", "low"]),
+                "tags": rng.sample(WORDS, 2),
+                "requiredSkills": rng.sample(["python", "go", "rust", "testing"], rng.randrange(3)),
+                "claimedBy": None,
+                "completedAt": None,
+                "completionSummary": None,
+                "createdAt": start,
+            }
+
+    @staticmethod
+    def _component(rng: random.Random, i: int) -> Dict[str, Any]:
+        name = "_".join(rng.choice(WORDS) for _ in range(rng.randrange(1, 4)))
+        return {
+            "name": f"{name}_{i}",
+            "type": rng.choice(["function", "class", "module"]),
+            "language": rng.choice(["python", "javascript", "typescript", "go", "rust"]),
+            "file_path": f"src/{rng.choice(WORDS)}/{name}.py",
+            "line_number": rng.randrange(1, 2000),
+            "signature": f"def {name}(self) -> None",
+            "docstring": " ".join(rng.choice(WORDS) for _ in range(rng.randrange(5, 20))),
+            "repository": f"BlackRoad-OS/{rng.choice(WORDS)}-{rng.randrange(40)}",
+        }
+
+    def touch(self, collection: str):
+        self.versions[collection] += 1
+
+    def etag(self, collection: str) -> str:
+        return f'"{collection}-{self.versions[collection]}"'
+
+
+class StandInApp:
+    """Request handlers keyed by operationId."""
+
+    def __init__(self, state: StandInState):
+        self.state = state
+
+    # Agents
+
+    def listAgents(self, params, query, body):
+        limit, offset = _limit(query, 100)
+        with self.state.lock:
+            agents = [
+                a for a in self.state.agents.values()
+                if query.get("type", a["type"]) == a["type"]
+                and query.get("status", a["status"]) == a["status"]
+            ]
+        return 200, {"agents": agents[offset:offset + limit], "total": len(agents)}
+
+    def registerAgent(self, params, query, body):
+        _require(body, "name")
+        agent = {
+            "id": f"agent_{uuid.uuid4().hex[:12]}",
+            "name": body["name"],
+            "type": body.get("type", "ai"),
+            "status": "active",
+            "capabilities": body.get("capabilities", []),
+            "metadata": body.get("metadata", {}),
+            "created_at": _now(),
+            "last_seen": None,
+        }
+        with self.state.lock:
+            self.state.agents[agent["id"]] = agent
+            self.state.touch("agents")
+        return 201, agent
+
+    def _agent(self, agent_id: str) -> Dict[str, Any]:
+        agent = self.state.agents.get(agent_id)
+        if agent is None:
+            raise Rejected(404, f"agent not found: {agent_id}")
+        return agent
+
+    def getAgent(self, params, query, body):
+        with self.state.lock:
+            return 200, self._agent(params["agentId"])
+
+    def updateAgent(self, params, query, body):
+        with self.state.lock:
+            agent = self._agent(params["agentId"])
+            for name in ("status", "capabilities", "metadata"):
+                if name in body:
+                    agent[name] = body[name]
+            self.state.touch("agents")
+            return 200, agent
+
+    def deregisterAgent(self, params, query, body):
+        with self.state.lock:
+            self._agent(params["agentId"])
+            del self.state.agents[params["agentId"]]
+            self.state.touch("agents")
+        return 200, {"deleted": True}
+
+    def heartbeatAgent(self, params, query, body):
+        with self.state.lock:
+            agent = self._agent(params["agentId"])
+            agent["last_seen"] = _now()
+            agent["status"] = "active"
+        return 200, {"ok": True, "agent_id": agent["id"], "last_seen": agent["last_seen"]}
+
+    # Memory
+
+    def logMemory(self, params, query, body):
+        from .memory import MemoryEntry
+        from .verify import entry_digest
+
+        _require(body, "action", "entity", "details")
+        with self.state.lock:
+            entry = {
+                "id": f"mem_{len(self.state.memory):08d}",
+                "timestamp": _now(),
+                "action": body["action"],
+                "entity": body["entity"],
+                "details": body["details"],
+                "tags": body.get("tags", []),
+                "agent_id": body.get("agent_id"),
+                "previous_hash": self.state.last_hash,
+            }
+            entry["hash"] = entry_digest(MemoryEntry.from_dict(entry), self.state.last_hash)
+            self.state.last_hash = entry["hash"]
+            self.state.memory.append(entry)
+        return 201, entry
+
+    def searchMemory(self, params, query, body):
+        limit, offset = _limit(query, 20)
+        text = query.get("q", "").lower()
+        # Entries must carry every requested tag; the SDK's local search
+        # (MemoryReplica, MemoryIndex) follows the same rule.
+        tags = set(filter(None, query.get("tags", "").split(",")))
+        action = query.get("action")
+        agent_id = query.get("agent_id")
+        since = query.get("since")
+        with self.state.lock:
+            entries = list(self.state.memory)
+        matches = [
+            e for e in entries
+            if (not text or text in e["details"].lower() or text in e["entity"].lower())
+            and tags <= set(e["tags"])
+            and (action is None or e["action"] == action)
+            and (agent_id is None or e["agent_id"] == agent_id)
+            and (since is None or e["timestamp"] > since)
+        ]
+        return 200, {"entries": matches[offset:offset + limit], "total": len(matches)}
+
+    def getMemorySummary(self, params, query, body):
+        with self.state.lock:
+            entries = list(self.state.memory)
+        by_action: Dict[str, int] = {}
+        for entry in entries:
+            by_action[entry["action"]] = by_action.get(entry["action"], 0) + 1
+        return 200, {
+            "total_entries": len(entries),
+            "by_action": by_action,
+            "last_hash": self.state.last_hash,
+        }
+
+    def getMemoryContext(self, params, query, body):
+        agent_id = params["agentId"]
+        with self.state.lock:
+            recent = [e for e in self.state.memory if e["agent_id"] == agent_id][-20:]
+        return 200, {"agent_id": agent_id, "recent": recent}
+
+    # Codex
+
+    def searchCodex(self, params, query, body):
+        if "q" not in query:
+            raise Rejected(400, "missing required parameter: q")
+        limit, offset = _limit(query, 20)
+        text = query["q"].lower()
+        filters = [(n, query[n]) for n in ("type", "language", "repository") if n in query]
+        matches = [
+            c for c in self.state.components
+            if (text in ("", "*") or text in c["name"].lower() or text in c["docstring"].lower())
+            and all(c[n] == v for n, v in filters)
+        ]
+        return 200, {"components": matches[offset:offset + limit], "total": len(matches)}
+
+    def getCodexStats(self, params, query, body):
+        by_type: Dict[str, int] = {}
+        by_language: Dict[str, int] = {}
+        for c in self.state.components:
+            plural = c["type"] + ("es" if c["type"] == "class" else "s")
+            by_type[plural] = by_type.get(plural, 0) + 1
+            by_language[c["language"]] = by_language.get(c["language"], 0) + 1
+        return 200, {
+            "totalComponents": len(self.state.components),
+            "byType": by_type,
+            "byLanguage": by_language,
+            "lastIndexed": _now(),
+        }
+
+    def getCodexComponent(self, params, query, body):
+        for component in self.state.components:
+            if component["name"] == params["componentId"]:
+                return 200, component
+        raise Rejected(404, f"component not found: {params['componentId']}")
+
+    def listCodexLanguages(self, params, query, body):
+        counts: Dict[str, int] = {}
+        for c in self.state.components:
+            counts[c["language"]] = counts.get(c["language"], 0) + 1
+        languages = [{"language": k, "count": v} for k, v in sorted(counts.items())]
+        return 200, {"languages": languages}
+
+    # Traffic lights
+
+    def listTrafficLights(self, params, query, body):
+        status = query.get("status")
+        with self.state.lock:
+            projects = [p for p in self.state.lights.values() if status in (None, p["status"])]
+            summary = {"green": 0, "yellow": 0, "red": 0}
+            for project in self.state.lights.values():
+                summary[project["status"]] += 1
+        return 200, {"projects": projects, "summary": summary}
+
+    def getTrafficLight(self, params, query, body):
+        with self.state.lock:
+            light = self.state.lights.get(params["projectId"])
+        if light is None:
+            raise Rejected(404, f"project not found: {params['projectId']}")
+        return 200, light
+
+    def setTrafficLight(self, params, query, body):
+        _require(body, "status", "reason")
+        if body["status"] not in ("green", "yellow", "red"):
+            raise Rejected(400, "status must be green, yellow or red")
+        project_id = params["projectId"]
+        with self.state.lock:
+            light = self.state.lights.setdefault(
+                project_id, {"projectId": project_id, "history": []}
+            )
+            if "status" in light:
+                light["history"].append({
+                    "status": light["status"],
+                    "reason": light["reason"],
+                    "timestamp": light["updatedAt"],
+                })
+                del light["history"][:-20]
+            light.update(
+                status=body["status"], reason=body["reason"],
+                updatedAt=_now(), updatedBy="sdk",
+            )
+            self.state.touch("traffic-lights")
+            return 200, light
+
+    # Tasks
+
+    def listTasks(self, params, query, body):
+        status = query.get("status")
+        priority = query.get("priority")
+        with self.state.lock:
+            tasks = list(self.state.tasks.values())
+        stats = {"available": 0, "claimed": 0, "completed": 0}
+        for task in tasks:
+            if task["status"] in stats:
+                stats[task["status"]] += 1
+        matches = [
+            t for t in tasks
+            if status in (None, t["status"]) and priority in (None, t["priority"])
+        ]
+        return 200, {"tasks": matches, "stats": stats}
+
+    def createTask(self, params, query, body):
+        _require(body, "id", "title", "description", "priority")
+        with self.state.lock:
+            if body["id"] in self.state.tasks:
+                raise Rejected(409, f"task already exists: {body['id']}")
+            task = {
+                "id": body["id"],
+                "title": body["title"],
+                "description": body["description"],
+                "status": "available",
+                "priority": body["priority"],
+                "tags": body.get("tags", []),
+                "requiredSkills": body.get("requiredSkills", []),
+                "claimedBy": None,
+                "completedAt": None,
+                "completionSummary": None,
+                "createdAt": _now(),
+            }
+            self.state.tasks[task["id"]] = task
+            self.state.touch("tasks")
+        return 201, task
+
+    def _task(self, task_id: str) -> Dict[str, Any]:
+        task = self.state.tasks.get(task_id)
+        if task is None:
+            raise Rejected(404, f"task not found: {task_id}")
+        return task
+
+    def claimTask(self, params, query, body):
+        with self.state.lock:
+            task = self._task(params["taskId"])
+            if task["status"] != "available":
+                raise Rejected(409, "task already claimed")
+            task.update(status="claimed", claimedBy="sdk")
+            self.state.touch("tasks")
+            return 200, task
+
+    def completeTask(self, params, query, body):
+        _require(body, "summary")
+        with self.state.lock:
+            task = self._task(params["taskId"])
+            if task["status"] != "claimed":
+                raise Rejected(409, "task is not claimed")
+            task.update(
+                status="completed", completedAt=_now(), completionSummary=body["summary"]
+            )
+            self.state.touch("tasks")
+            return 200, task
+
+
+# List endpoints answered with ETags and 304s, by the collection they read.
+_CONDITIONAL = {
+    "listAgents": "agents",
+    "listTasks": "tasks",
+    "listTrafficLights": "traffic-lights",
+}
+
+
+class StandInServer:
+    """
+    Local stand-in for the BlackRoad API with in-memory state.
+
+    Serves the operations in ``specs/api/openapi.yaml`` (pass ``spec`` to
+    route from the document itself) plus the other endpoints the SDK
+    uses, over HTTP/1.1 keep-alive on a thread per connection. ``faults``
+    adds latency, errors and 429s; list endpoints for agents, tasks and
+    traffic lights support ETag revalidation. Any bearer token is accepted.
+
+    Example:
+        >>> with StandInServer(faults=FaultConfig(latency=0.005, rate_limit_rate=0.01)) as server:
+        ...     client = BlackRoadClient(api_key="test", base_url=server.url)
+        ...     client.agents.register("soak-1")
+        >>> server.stats()
+        StandInStats(requests=1, rate_limited=0, errors_injected=0, ...)
+
+    Run it standalone with ``python -m blackroad.standin --port 8787``.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        faults: Optional[FaultConfig] = None,
+        state: Optional[StandInState] = None,
+        spec: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
+        self.faults = faults or FaultConfig()
+        self.state = state or StandInState()
+        self.app = StandInApp(self.state)
+        self._routes = self._compile(routes_from_spec(spec) if spec else list(ROUTES))
+        self._random = random.Random(seed)
+        self._stats = StandInStats()
+        self._stats_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        """Serve on a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="blackroad-standin", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve on the calling thread until interrupted."""
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> StandInStats:
+        with self._stats_lock:
+            return StandInStats(
+                requests=self._stats.requests,
+                rate_limited=self._stats.rate_limited,
+                errors_injected=self._stats.errors_injected,
+                handler_errors=self._stats.handler_errors,
+                by_operation=dict(self._stats.by_operation),
+            )
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _compile(self, routes) -> List[Tuple[str, "re.Pattern[str]", str]]:
+        compiled = []
+        for method, template, operation in routes:
+            if not hasattr(self.app, operation):
+                continue
+            pattern = re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(template))
+            compiled.append((method, re.compile(f"^{pattern}$"), operation))
+        return compiled
+
+    def _match(self, method: str, path: str) -> Tuple[Optional[str], Dict[str, str], bool]:
+        path_known = False
+        for route_method, pattern, operation in self._routes:
+            match = pattern.match(path)
+            if match:
+                if route_method == method:
+                    return operation, match.groupdict(), True
+                path_known = True
+        return None, {}, path_known
+
+    def _fault(self, operation: str) -> Optional[Tuple[int, Dict[str, str], Dict[str, Any]]]:
+        faults = self.faults
+        delay = faults.latency + (self._random.random() * faults.jitter if faults.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+        roll = self._random.random()
+        with self._stats_lock:
+            self._stats.requests += 1
+            counts = self._stats.by_operation
+            counts[operation] = counts.get(operation, 0) + 1
+            if roll < faults.rate_limit_rate:
+                self._stats.rate_limited += 1
+                headers = {"Retry-After": f"{faults.retry_after:g}"}
+                return 429, headers, {"error": "rate limited"}
+            if roll < faults.rate_limit_rate + faults.error_rate:
+                self._stats.errors_injected += 1
+                return faults.error_status, {}, {"error": "injected failure"}
+        return None
+
+    def handle(
+        self, method: str, target: str, headers: Dict[str, str], raw: bytes
+    ) -> Tuple[int, Dict[str, str], Optional[Dict[str, Any]]]:
+        """Route one request; returns (status, headers, JSON body or None)."""
+        if not headers.get("authorization", "").startswith("Bearer "):
+            return 401, {}, {"error": "missing bearer token"}
+        url = urlsplit(target)
+        operation, params, path_known = self._match(method, url.path)
+        if operation is None:
+            return (405 if path_known else 404), {}, {"error": "no such route"}
+        fault = self._fault(operation)
+        if fault is not None:
+            return fault
+
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            if headers.get("content-encoding") == "gzip":
+                raw = gzip.decompress(raw)
+            body = json.loads(raw) if raw else {}
+        except (OSError, ValueError):
+            return 400, {}, {"error": "invalid request body"}
+
+        handler: Callable = getattr(self.app, operation)
+        try:
+            status, payload = handler(params, query, body)
+        except Rejected as exc:
+            return exc.status, {}, {"error": str(exc)}
+        except Exception as exc:
+            # A handler tripping over a malformed body is the client's
+            # fault; anything else is a stand-in bug. Either way answer in
+            # JSON rather than dropping the connection.
+            with self._stats_lock:
+                self._stats.handler_errors += 1
+            status = 400 if isinstance(exc, _BAD_INPUT) else 500
+            return status, {}, {"error": f"{type(exc).__name__}: {exc}"}
+
+        collection = _CONDITIONAL.get(operation)
+        if collection is None or status != 200:
+            return status, {}, payload
+        with self.state.lock:
+            etag = self.state.etag(collection)
+        if headers.get("if-none-match") == etag:
+            return 304, {"ETag": etag}, None
+        return status, {"ETag": etag}, payload
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Write headers and body in one segment; separate small writes
+            # stall on delayed ACKs.
+            wbufsize = -1
+            disable_nagle_algorithm = True
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                headers = {k.lower(): v for k, v in self.headers.items()}
+                status, extra, payload = server.handle(self.command, self.path, headers, raw)
+                body = b"" if payload is None else json.dumps(payload).encode()
+                if body and "gzip" in headers.get("accept-encoding", "") and len(body) > 1024:
+                    body = gzip.compress(body, compresslevel=5)
+                    extra = dict(extra, **{"Content-Encoding": "gzip"})
+                self.send_response(status)
+                if payload is not None:
+                    self.send_header("Content-Type", "application/json")
+                for name, value in extra.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main(argv: Optional[List[str]] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the BlackRoad API stand-in server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--spec", help="route from this OpenAPI document")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--components", type=int, default=2000)
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    server = StandInServer(
+        host=args.host,
+        port=args.port,
+        spec=args.spec,
+        seed=args.seed,
+        state=StandInState(args.components, args.projects, args.tasks),
+        faults=FaultConfig(
+            latency=args.latency_ms / 1000,
+            jitter=args.jitter_ms / 1000,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            rate_limit_rate=args.rate_limit_rate,
+            retry_after=args.retry_after,
+        ),
+    )
+    print(f"BlackRoad stand-in listening on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(server.stats())
+
+
+if __name__ == "__main__":
+    main()
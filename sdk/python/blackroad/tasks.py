@@ -0,0 +1,253 @@
+"""
+BlackRoad OS Task Marketplace
+
+Create, claim and complete tasks in the BlackRoad task marketplace.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Callable, TYPE_CHECKING
+from datetime import datetime
+
+from .models import Model, Field, slots, parse_datetime
+
+if TYPE_CHECKING:
+    from .worker import TaskWorker
+
+
+PRIORITIES = ("urgent", "high", "medium", "low")
+
+
+class Task(Model):
+    """Represents a marketplace task."""
+    id: str
+    title: str
+    description: Optional[str]
+    status: Optional[str]  # 'available', 'claimed', 'in_progress', 'completed', 'cancelled'
+    priority: Optional[str]  # 'low', 'medium', 'high', 'urgent'
+    tags: List[str]
+    required_skills: List[str]
+    claimed_by: Optional[str]
+    completed_at: Optional[datetime]
+    completion_summary: Optional[str]
+    created_at: Optional[datetime]
+
+    _fields = (
+        Field("id"),
+        Field("title"),
+        Field("description", default=None),
+        Field("status", default=None),
+        Field("priority", default=None),
+        Field("tags", default_factory=list),
+        Field("required_skills", default_factory=list, key="requiredSkills"),
+        Field("claimed_by", default=None, key="claimedBy"),
+        Field("completed_at", decode=parse_datetime, default=None, key="completedAt"),
+        Field("completion_summary", default=None, key="completionSummary"),
+        Field("created_at", decode=parse_datetime, default=None, key="createdAt"),
+    )
+    __slots__ = slots(*_fields)
+
+
+@dataclass
+class TaskStats:
+    """Marketplace-wide task counts."""
+    available: int = 0
+    claimed: int = 0
+    completed: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TaskStats":
+        return cls(
+            available=data.get("available", 0),
+            claimed=data.get("claimed", 0),
+            completed=data.get("completed", 0),
+        )
+
+
+def _list_params(status: Optional[str], priority: Optional[str]) -> Dict[str, Any]:
+    params: Dict[str, Any] = {}
+    if status:
+        params["status"] = status
+    if priority:
+        params["priority"] = priority
+    return params
+
+
+def _create_body(
+    id: str,
+    title: str,
+    description: str,
+    priority: str,
+    tags: Optional[List[str]],
+    required_skills: Optional[List[str]],
+) -> Dict[str, Any]:
+    return {
+        "id": id,
+        "title": title,
+        "description": description,
+        "priority": priority,
+        "tags": tags or [],
+        "requiredSkills": required_skills or [],
+    }
+
+
+def _complete_body(summary: str, artifacts: Optional[List[str]]) -> Dict[str, Any]:
+    return {"summary": summary, "artifacts": artifacts or []}
+
+
+def _is_conflict(exc: Exception) -> bool:
+    response = getattr(exc, "response", None)
+    return response is not None and response.status_code == 409
+
+
+class TaskQueue:
+    """
+    Work with tasks in the BlackRoad marketplace.
+
+    Example:
+        >>> queue = client.tasks
+        >>> for task in queue.list(status="available"):
+        ...     if queue.try_claim(task.id):
+        ...         queue.complete(task.id, summary="done")
+    """
+
+    def __init__(self, client):
+        self._client = client
+
+    def list(
+        self,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+    ) -> List[Task]:
+        """List tasks, optionally filtered by status and priority."""
+        params = _list_params(status, priority)
+        return self._client.get("/v1/tasks", params=params, model=Task, key="tasks")
+
+    def stats(self) -> TaskStats:
+        """Marketplace-wide available/claimed/completed counts."""
+        response = self._client.get("/v1/tasks", params={"status": "available"})
+        return TaskStats.from_dict(response.get("stats", {}))
+
+    def create(
+        self,
+        id: str,
+        title: str,
+        description: str,
+        priority: str = "medium",
+        tags: Optional[List[str]] = None,
+        required_skills: Optional[List[str]] = None,
+    ) -> Task:
+        """Create a new task."""
+        data = _create_body(id, title, description, priority, tags, required_skills)
+        return self._client.post("/v1/tasks", data=data, model=Task)
+
+    def claim(self, task_id: str) -> Task:
+        """Claim a task. Raises ``httpx.HTTPStatusError`` (409) if already claimed."""
+        return self._client.post(f"/v1/tasks/{task_id}/claim", data={}, model=Task)
+
+    def try_claim(self, task_id: str) -> Optional[Task]:
+        """Claim a task, returning None if another worker got it first."""
+        import httpx
+
+        try:
+            return self.claim(task_id)
+        except httpx.HTTPStatusError as exc:
+            if _is_conflict(exc):
+                return None
+            raise
+
+    def complete(
+        self,
+        task_id: str,
+        summary: str,
+        artifacts: Optional[List[str]] = None,
+    ) -> Task:
+        """Mark a claimed task as completed."""
+        data = _complete_body(summary, artifacts)
+        return self._client.post(f"/v1/tasks/{task_id}/complete", data=data, model=Task)
+
+    def worker(
+        self,
+        handler: Callable[[Task], Any],
+        skills: Optional[List[str]] = None,
+        **options,
+    ) -> "TaskWorker":
+        """
+        Create a worker that claims, processes and completes matching tasks.
+
+        Options are passed to :class:`~blackroad.worker.TaskWorker`
+        (``workers``, ``mode``, ``prefetch``, ``poll_interval``,
+        ``require_all``, ``on_complete``, ``on_error``).
+        """
+        from .worker import TaskWorker
+
+        return TaskWorker(self, handler, skills=skills, **options)
+
+
+class AsyncTaskQueue:
+    """
+    Asyncio counterpart of :class:`TaskQueue`.
+
+    Example:
+        >>> tasks = await client.tasks.list(status="available")
+    """
+
+    def __init__(self, client):
+        self._client = client
+
+    async def list(
+        self,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+    ) -> List[Task]:
+        """List tasks, optionally filtered by status and priority."""
+        params = _list_params(status, priority)
+        return await self._client.get(
+            "/v1/tasks", params=params, model=Task, key="tasks"
+        )
+
+    async def stats(self) -> TaskStats:
+        """Marketplace-wide available/claimed/completed counts."""
+        response = await self._client.get("/v1/tasks", params={"status": "available"})
+        return TaskStats.from_dict(response.get("stats", {}))
+
+    async def create(
+        self,
+        id: str,
+        title: str,
+        description: str,
+        priority: str = "medium",
+        tags: Optional[List[str]] = None,
+        required_skills: Optional[List[str]] = None,
+    ) -> Task:
+        """Create a new task."""
+        data = _create_body(id, title, description, priority, tags, required_skills)
+        return await self._client.post("/v1/tasks", data=data, model=Task)
+
+    async def claim(self, task_id: str) -> Task:
+        """Claim a task. Raises ``httpx.HTTPStatusError`` (409) if already claimed."""
+        return await self._client.post(
+            f"/v1/tasks/{task_id}/claim", data={}, model=Task
+        )
+
+    async def try_claim(self, task_id: str) -> Optional[Task]:
+        """Claim a task, returning None if another worker got it first."""
+        import httpx
+
+        try:
+            return await self.claim(task_id)
+        except httpx.HTTPStatusError as exc:
+            if _is_conflict(exc):
+                return None
+            raise
+
+    async def complete(
+        self,
+        task_id: str,
+        summary: str,
+        artifacts: Optional[List[str]] = None,
+    ) -> Task:
+        """Mark a claimed task as completed."""
+        data = _complete_body(summary, artifacts)
+        return await self._client.post(
+            f"/v1/tasks/{task_id}/complete", data=data, model=Task
+        )
@@ -0,0 +1,500 @@
+"""
+BlackRoad OS Traffic Lights
+
+Project status lights with a local snapshot that streams only changes.
+"""
+
+import threading
+from dataclasses import dataclass, replace
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    AsyncIterator,
+    Mapping,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+from datetime import datetime
+
+from .models import Model, Field, slots, parse_datetime
+
+if TYPE_CHECKING:
+    from .bulk import BulkResult
+    from .conditional import Validators
+
+
+STATUSES = ("green", "yellow", "red")
+
+LightUpdates = Union[Mapping[str, Dict[str, Any]], Iterable[Tuple[str, Dict[str, Any]]]]
+
+
+class TrafficLight(Model):
+    """Represents a project's status light."""
+    project_id: str
+    status: str  # 'green', 'yellow', 'red'
+    reason: Optional[str]
+    updated_at: Optional[datetime]
+    updated_by: Optional[str]
+    history: List[Dict[str, Any]]
+
+    _fields = (
+        Field("project_id", key="projectId"),
+        Field("status"),
+        Field("reason", default=None),
+        Field("updated_at", decode=parse_datetime, default=None, key="updatedAt"),
+        Field("updated_by", default=None, key="updatedBy"),
+        Field("history", default_factory=list),
+    )
+    __slots__ = slots(*_fields)
+
+
+@dataclass
+class TrafficLightSummary:
+    """Number of projects per status."""
+    green: int = 0
+    yellow: int = 0
+    red: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TrafficLightSummary":
+        return cls(
+            green=data.get("green", 0),
+            yellow=data.get("yellow", 0),
+            red=data.get("red", 0),
+        )
+
+
+@dataclass
+class TrafficSnapshotStats:
+    """Polling counters for a :class:`TrafficLightSnapshot`."""
+    refreshes: int = 0
+    errors: int = 0
+    consecutive_errors: int = 0
+    callback_errors: int = 0
+    last_error: Optional[str] = None
+
+
+@dataclass
+class TrafficLightChange:
+    """
+    One project's transition between two snapshots.
+
+    ``old_status`` is None for a project seen for the first time and
+    ``new_status`` is None (with ``light`` None) for one that disappeared.
+    A change of reason alone keeps the same status on both sides.
+    """
+    project_id: str
+    old_status: Optional[str]
+    new_status: Optional[str]
+    light: Optional[TrafficLight] = None
+
+
+def _list_params(status: Optional[str]) -> Dict[str, Any]:
+    return {"status": status} if status else {}
+
+
+def _update_items(updates: LightUpdates) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    return updates.items() if isinstance(updates, Mapping) else updates
+
+
+def _version(raw: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+    return raw.get("status"), raw.get("reason"), raw.get("updatedAt")
+
+
+def _raw(light: TrafficLight) -> Dict[str, Any]:
+    if light._raw:
+        return light._raw
+    # Built locally rather than decoded from a response.
+    return {
+        "projectId": light.project_id,
+        "status": light.status,
+        "reason": light.reason,
+        "updatedAt": light.updated_at.isoformat() if light.updated_at else None,
+    }
+
+
+class TrafficLightSnapshot:
+    """
+    Local copy of every project's light, refreshed incrementally.
+
+    :meth:`refresh` revalidates the list with ``If-None-Match`` /
+    ``If-Modified-Since``, so an unchanged list costs a 304 and no
+    parsing. When the list did change, each project is compared by its
+    (status, reason, updatedAt) fields on the raw payload and only
+    changed projects are turned into :class:`TrafficLight` objects.
+    Subscribers receive the list of :class:`TrafficLightChange` after
+    every refresh that found some. A subscriber that raises is counted in
+    ``callback_errors`` and does not stop the others or fail the refresh.
+
+    Background polling never stops on a failed refresh. Failures are
+    counted in :meth:`stats` and passed to ``on_error``, and the wait
+    before the next attempt doubles up to ``max_interval`` until a
+    refresh succeeds.
+
+    Example:
+        >>> snapshot = client.traffic_lights.snapshot()
+        >>> snapshot.subscribe(lambda changes: alert(changes))
+        >>> snapshot.start(interval=10)
+        >>> snapshot.summary()
+        TrafficLightSummary(green=412, yellow=9, red=2)
+    """
+
+    def __init__(self, lights):
+        self._lights = lights
+        self._projects: Dict[str, TrafficLight] = {}
+        self._versions: Dict[str, Tuple[Any, Any, Any]] = {}
+        self._counts: Dict[Any, int] = {}
+        self._validators: Optional["Validators"] = None
+        self._stats = TrafficSnapshotStats()
+        self._subscribers: List[Callable[[List[TrafficLightChange]], Any]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._projects)
+
+    def __contains__(self, project_id: str) -> bool:
+        return project_id in self._projects
+
+    def get(self, project_id: str) -> Optional[TrafficLight]:
+        """The project's light as of the last refresh."""
+        return self._projects.get(project_id)
+
+    def projects(self, status: Optional[str] = None) -> List[TrafficLight]:
+        """All known lights, optionally only those with ``status``."""
+        with self._lock:
+            lights = list(self._projects.values())
+        if status is None:
+            return lights
+        return [light for light in lights if light.status == status]
+
+    def summary(self) -> TrafficLightSummary:
+        """Per-status project counts, maintained as changes are applied."""
+        with self._lock:
+            return TrafficLightSummary(
+                **{status: self._counts.get(status, 0) for status in STATUSES}
+            )
+
+    def stats(self) -> TrafficSnapshotStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def subscribe(
+        self, callback: Callable[[List[TrafficLightChange]], Any]
+    ) -> Callable[[], None]:
+        """Call ``callback(changes)`` after each refresh with changes. Returns an unsubscribe function."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def refresh(self) -> List[TrafficLightChange]:
+        """Fetch the list if it changed and return the per-project changes."""
+        client = self._lights._client
+        headers = self._validators.headers() if self._validators else {}
+        response = client.get_response("/v1/traffic-lights", headers=headers)
+        return self._receive(response, client.codec)
+
+    async def arefresh(self) -> List[TrafficLightChange]:
+        """Asyncio counterpart of :meth:`refresh`."""
+        client = self._lights._client
+        headers = self._validators.headers() if self._validators else {}
+        response = await client.get_response("/v1/traffic-lights", headers=headers)
+        return self._receive(response, client.codec)
+
+    def apply(self, lights: Iterable[TrafficLight]) -> List[TrafficLightChange]:
+        """Fold lights obtained elsewhere (e.g. from ``set``) into the snapshot."""
+        with self._lock:
+            changes = [
+                change
+                for change in (self._put(_raw(light), light) for light in lights)
+                if change is not None
+            ]
+        self._publish(changes)
+        return changes
+
+    def set_many(
+        self,
+        updates: LightUpdates,
+        max_concurrency: int = 16,
+    ) -> List["BulkResult[TrafficLight]"]:
+        """
+        Set many lights concurrently and apply the results locally.
+
+        Returns every :class:`~blackroad.bulk.BulkResult` in input order;
+        subscribers see the successful updates as one batch of changes.
+        Requires a snapshot from the synchronous client.
+        """
+        results = list(self._lights.set_many(updates, max_concurrency, ordered=True))
+        self.apply(result.value for result in results if result.ok)
+        return results
+
+    def watch(self, interval: float = 10.0) -> Iterator[TrafficLightChange]:
+        """Refresh every ``interval`` seconds, yielding each change."""
+        while True:
+            yield from self.refresh()
+            if self._stop.wait(interval):
+                return
+
+    def start(
+        self,
+        interval: float = 10.0,
+        on_error: Optional[Callable[[Exception], Any]] = None,
+        max_interval: float = 300.0,
+    ) -> "TrafficLightSnapshot":
+        """
+        Refresh every ``interval`` seconds on a background thread.
+
+        A failed refresh is counted, passed to ``on_error`` and retried
+        after a doubling delay capped at ``max_interval``.
+        """
+        if self._thread is not None:
+            raise RuntimeError("TrafficLightSnapshot is already polling")
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._poll,
+            args=(interval, on_error, max_interval),
+            name="blackroad-traffic",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop background polling (and any :meth:`watch` loop)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _poll(
+        self,
+        interval: float,
+        on_error: Optional[Callable[[Exception], Any]],
+        max_interval: float,
+    ):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as exc:
+                with self._lock:
+                    self._stats.errors += 1
+                    self._stats.consecutive_errors += 1
+                    self._stats.last_error = repr(exc)
+                    failures = self._stats.consecutive_errors
+                if on_error is not None:
+                    try:
+                        on_error(exc)
+                    except Exception:
+                        pass
+                delay = min(max_interval, interval * 2 ** failures)
+            else:
+                with self._lock:
+                    self._stats.refreshes += 1
+                    self._stats.consecutive_errors = 0
+                delay = interval
+            self._stop.wait(delay)
+
+    def _receive(self, response, codec) -> List[TrafficLightChange]:
+        from .conditional import Validators
+
+        if response.status_code == 304:
+            return []
+        rows = codec.loads(response.content).get("projects", [])
+        with self._lock:
+            changes = []
+            seen = set()
+            for raw in rows:
+                seen.add(raw["projectId"])
+                change = self._put(raw)
+                if change is not None:
+                    changes.append(change)
+            for project_id in [p for p in self._versions if p not in seen]:
+                changes.append(self._drop(project_id))
+            self._validators = Validators.from_response(response)
+        self._publish(changes)
+        return changes
+
+    def _put(
+        self, raw: Dict[str, Any], light: Optional[TrafficLight] = None
+    ) -> Optional[TrafficLightChange]:
+        project_id = raw["projectId"]
+        version = _version(raw)
+        previous = self._versions.get(project_id)
+        if previous == version:
+            return None
+        self._versions[project_id] = version
+        light = light if light is not None else TrafficLight.from_dict(raw)
+        self._projects[project_id] = light
+        old_status = None
+        if previous is not None:
+            old_status = previous[0]
+            self._counts[old_status] -= 1
+        self._counts[version[0]] = self._counts.get(version[0], 0) + 1
+        return TrafficLightChange(project_id, old_status, version[0], light)
+
+    def _drop(self, project_id: str) -> TrafficLightChange:
+        old_status = self._versions.pop(project_id)[0]
+        del self._projects[project_id]
+        self._counts[old_status] -= 1
+        return TrafficLightChange(project_id, old_status, None)
+
+    def _publish(self, changes: List[TrafficLightChange]):
+        if not changes:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(changes)
+            except Exception as exc:
+                with self._lock:
+                    self._stats.callback_errors += 1
+                    self._stats.last_error = repr(exc)
+
+
+class TrafficLights:
+    """
+    Read and set project status lights.
+
+    Example:
+        >>> lights = client.traffic_lights
+        >>> for light in lights.list(status="red"):
+        ...     print(f"{light.project_id}: {light.reason}")
+    """
+
+    def __init__(self, client):
+        self._client = client
+
+    def list(self, status: Optional[str] = None) -> List[TrafficLight]:
+        """List project lights, optionally only those with ``status``."""
+        return self._client.get(
+            "/v1/traffic-lights",
+            params=_list_params(status),
+            model=TrafficLight,
+            key="projects",
+        )
+
+    def summary(self) -> TrafficLightSummary:
+        """Number of projects per status."""
+        response = self._client.get("/v1/traffic-lights")
+        return TrafficLightSummary.from_dict(response.get("summary", {}))
+
+    def get(self, project_id: str) -> TrafficLight:
+        """Get one project's light."""
+        return self._client.get(f"/v1/traffic-lights/{project_id}", model=TrafficLight)
+
+    def set(self, project_id: str, status: str, reason: str) -> TrafficLight:
+        """Set a project's light."""
+        return self._client.put(
+            f"/v1/traffic-lights/{project_id}",
+            data={"status": status, "reason": reason},
+            model=TrafficLight,
+        )
+
+    def set_many(
+        self,
+        updates: LightUpdates,
+        max_concurrency: int = 16,
+        ordered: bool = False,
+    ) -> Iterator["BulkResult[TrafficLight]"]:
+        """
+        Set many lights concurrently from ``{project_id: {"status", "reason"}}``
+        (or ``(project_id, fields)`` pairs), yielding a result per project.
+        """
+        from .bulk import run_bulk
+
+        return run_bulk(
+            lambda pair: self.set(pair[0], **pair[1]),
+            _update_items(updates),
+            max_concurrency,
+            ordered,
+        )
+
+    def snapshot(self, refresh: bool = True) -> TrafficLightSnapshot:
+        """Create a :class:`TrafficLightSnapshot`, filled by a first refresh."""
+        snapshot = TrafficLightSnapshot(self)
+        if refresh:
+            snapshot.refresh()
+        return snapshot
+
+
+class AsyncTrafficLights:
+    """
+    Asyncio counterpart of :class:`TrafficLights`.
+
+    Example:
+        >>> red = await client.traffic_lights.list(status="red")
+    """
+
+    def __init__(self, client):
+        self._client = client
+
+    async def list(self, status: Optional[str] = None) -> List[TrafficLight]:
+        """List project lights, optionally only those with ``status``."""
+        return await self._client.get(
+            "/v1/traffic-lights",
+            params=_list_params(status),
+            model=TrafficLight,
+            key="projects",
+        )
+
+    async def summary(self) -> TrafficLightSummary:
+        """Number of projects per status."""
+        response = await self._client.get("/v1/traffic-lights")
+        return TrafficLightSummary.from_dict(response.get("summary", {}))
+
+    async def get(self, project_id: str) -> TrafficLight:
+        """Get one project's light."""
+        return await self._client.get(
+            f"/v1/traffic-lights/{project_id}", model=TrafficLight
+        )
+
+    async def set(self, project_id: str, status: str, reason: str) -> TrafficLight:
+        """Set a project's light."""
+        return await self._client.put(
+            f"/v1/traffic-lights/{project_id}",
+            data={"status": status, "reason": reason},
+            model=TrafficLight,
+        )
+
+    def set_many(
+        self,
+        updates: LightUpdates,
+        max_concurrency: int = 16,
+        ordered: bool = False,
+    ) -> AsyncIterator["BulkResult[TrafficLight]"]:
+        """Set many lights concurrently; iterate results with ``async for``."""
+        from .bulk import arun_bulk
+
+        return arun_bulk(
+            lambda pair: self.set(pair[0], **pair[1]),
+            _update_items(updates),
+            max_concurrency,
+            ordered,
+        )
+
+    async def snapshot(self, refresh: bool = True) -> TrafficLightSnapshot:
+        """Create a :class:`TrafficLightSnapshot`; use ``arefresh()`` on it."""
+        snapshot = TrafficLightSnapshot(self)
+        if refresh:
+            await snapshot.arefresh()
+        return snapshot
@@ -0,0 +1,295 @@
+"""
+BlackRoad OS Memory Chain Verification
+
+Verify hash-chained memory journals locally, incrementally and in parallel.
+"""
+
+import os
+import hmac
+import json
+import hashlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, islice
+from dataclasses import dataclass, field, asdict
+from typing import Optional, List, Iterable, Iterator, Callable, Tuple, Deque
+
+from .memory import MemoryEntry
+
+
+GENESIS_HASH = "0" * 64
+
+Digest = Callable[[MemoryEntry, str], str]
+
+
+def entry_digest(entry: MemoryEntry, previous_hash: str) -> str:
+    """
+    Chain hash of ``entry`` given the hash of the entry before it.
+
+    SHA-256 over the previous hash followed by the entry's canonical JSON
+    (sorted keys, no whitespace). Pass a different ``digest`` to
+    :class:`ChainVerifier` if the server uses another construction.
+    """
+    canonical = json.dumps(
+        {
+            "id": entry.id,
+            "timestamp": entry.timestamp.isoformat(),
+            "action": entry.action,
+            "entity": entry.entity,
+            "details": entry.details,
+            "tags": entry.tags,
+            "agent_id": entry.agent_id,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(previous_hash.encode() + canonical.encode()).hexdigest()
+
+
+@dataclass
+class Checkpoint:
+    """A signed record of the last verified position in a chain."""
+    index: int
+    entry_id: str
+    timestamp: str
+    hash: str
+    signature: str = ""
+
+    def _message(self) -> bytes:
+        return f"{self.index}|{self.entry_id}|{self.timestamp}|{self.hash}".encode()
+
+    def sign(self, key: bytes):
+        self.signature = hmac.new(key, self._message(), hashlib.sha256).hexdigest()
+
+    def is_valid(self, key: bytes) -> bool:
+        expected = hmac.new(key, self._message(), hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, self.signature)
+
+
+@dataclass
+class VerificationResult:
+    """Outcome of a chain verification run."""
+    valid: bool
+    entries_checked: int
+    errors: List[str] = field(default_factory=list)
+    last_hash: Optional[str] = None
+    checkpoint: Optional[Checkpoint] = None
+
+
+_FIELDS = (
+    "id", "timestamp", "action", "entity", "details",
+    "tags", "agent_id", "hash", "previous_hash",
+)
+
+
+def _pack(entries: List[MemoryEntry]) -> List[tuple]:
+    """Flatten entries to tuples, which pickle far faster than objects."""
+    return [tuple(getattr(entry, name) for name in _FIELDS) for entry in entries]
+
+
+def _verify_packed(
+    packed: List[tuple], previous_hash: str, start: int, digest: Digest
+) -> Tuple[str, List[str]]:
+    entries = [MemoryEntry(**dict(zip(_FIELDS, fields))) for fields in packed]
+    return _verify_segment(entries, previous_hash, start, digest)
+
+
+def _verify_segment(
+    entries: List[MemoryEntry], previous_hash: str, start: int, digest: Digest
+) -> Tuple[str, List[str]]:
+    """Verify one contiguous run of entries."""
+    errors = []
+    for offset, entry in enumerate(entries):
+        if entry.hash is None or entry.previous_hash is None:
+            # Nothing to check against; certifying it would vouch for the
+            # chain without evidence, so it fails the run instead.
+            errors.append(f"entry {start + offset} ({entry.id}): unverifiable, no hash")
+            previous_hash = entry.hash or digest(entry, previous_hash)
+            continue
+        if entry.previous_hash != previous_hash:
+            errors.append(f"entry {start + offset} ({entry.id}): broken link")
+        computed = digest(entry, previous_hash)
+        if entry.hash != computed:
+            errors.append(f"entry {start + offset} ({entry.id}): hash mismatch")
+        # Link the next entry to the stored hash so one bad entry is
+        # reported once rather than breaking every entry after it.
+        previous_hash = entry.hash
+    return previous_hash, errors
+
+
+class ChainVerifier:
+    """
+    Local verifier for hash-chained memory entries.
+
+    Entries must be supplied in chain order; every entry must carry its
+    ``hash`` and ``previous_hash``, and one without them is reported as
+    unverifiable. With ``checkpoint_path`` the
+    verifier resumes from the last signed checkpoint, so later runs only
+    hash entries added since. With ``workers > 1`` the chain is split into
+    segments hashed on a process pool; segments start from the
+    server-provided hash of the entry before them, and that hash is itself
+    checked by the preceding segment.
+
+    Example:
+        >>> verifier = ChainVerifier(key=b"secret", checkpoint_path="chain.ckpt")
+        >>> result = verifier.verify(client.memory.iter_search(), workers=8)
+        >>> result.valid, result.entries_checked
+        (True, 1250000)
+    """
+
+    def __init__(
+        self,
+        key: Optional[bytes] = None,
+        checkpoint_path: Optional[str] = None,
+        digest: Digest = entry_digest,
+        genesis: str = GENESIS_HASH,
+        max_errors: int = 100,
+    ):
+        if checkpoint_path and not key:
+            raise ValueError("A signing key is required to use checkpoints.")
+        self.key = key
+        self.checkpoint_path = checkpoint_path
+        self.digest = digest
+        self.genesis = genesis
+        self.max_errors = max_errors
+
+    def load_checkpoint(self) -> Optional[Checkpoint]:
+        """Read the stored checkpoint, rejecting it if the signature is wrong."""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path) as f:
+            checkpoint = Checkpoint(**json.load(f))
+        if not checkpoint.is_valid(self.key):
+            raise ValueError(f"Checkpoint signature invalid: {self.checkpoint_path}")
+        return checkpoint
+
+    def save_checkpoint(self, checkpoint: Checkpoint):
+        """Sign and atomically write ``checkpoint``."""
+        checkpoint.sign(self.key)
+        tmp = f"{self.checkpoint_path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(asdict(checkpoint), f)
+        os.replace(tmp, self.checkpoint_path)
+
+    def verify(
+        self,
+        entries: Iterable[MemoryEntry],
+        workers: int = 1,
+        segment_size: int = 50_000,
+    ) -> VerificationResult:
+        """
+        Verify ``entries`` and, if enabled, advance the checkpoint.
+
+        When resuming, the stream may start anywhere up to the checkpointed
+        entry, or with the entry right after it (the one whose
+        ``previous_hash`` is the checkpointed hash). Entries before that
+        point are skipped. An empty stream means nothing was added since
+        the checkpoint and is valid.
+        """
+        checkpoint = self.load_checkpoint()
+        stream: Iterator[MemoryEntry] = iter(entries)
+        previous_hash, index = self.genesis, 0
+        if checkpoint is not None:
+            previous_hash, index = checkpoint.hash, checkpoint.index + 1
+            seen = 0
+            for entry in stream:
+                seen += 1
+                if entry.id == checkpoint.entry_id:
+                    break
+                if entry.previous_hash == checkpoint.hash:
+                    stream = chain((entry,), stream)
+                    break
+            else:
+                if seen:
+                    return VerificationResult(
+                        valid=False,
+                        entries_checked=0,
+                        errors=[f"checkpoint entry {checkpoint.entry_id} not found"],
+                    )
+                return VerificationResult(
+                    valid=True,
+                    entries_checked=0,
+                    last_hash=checkpoint.hash,
+                    checkpoint=checkpoint,
+                )
+
+        if workers > 1:
+            last_hash, last_entry, checked, errors = self._verify_parallel(
+                stream, previous_hash, index, workers, segment_size
+            )
+        else:
+            last_hash, last_entry, checked, errors = self._verify_sequential(
+                stream, previous_hash, index
+            )
+
+        result = VerificationResult(
+            valid=not errors,
+            entries_checked=checked,
+            errors=errors[: self.max_errors],
+            last_hash=last_hash,
+        )
+        if result.valid and last_entry is not None and self.checkpoint_path:
+            result.checkpoint = Checkpoint(
+                index=index + checked - 1,
+                entry_id=last_entry.id,
+                timestamp=last_entry.timestamp.isoformat(),
+                hash=last_hash,
+            )
+            self.save_checkpoint(result.checkpoint)
+        return result
+
+    def _verify_sequential(self, stream, previous_hash: str, index: int):
+        errors: List[str] = []
+        last_entry, checked = None, 0
+        for chunk in _chunks(stream, 10_000):
+            previous_hash, chunk_errors = _verify_segment(
+                chunk, previous_hash, index + checked, self.digest
+            )
+            errors.extend(chunk_errors)
+            last_entry = chunk[-1]
+            checked += len(chunk)
+        return previous_hash, last_entry, checked, errors
+
+    def _verify_parallel(
+        self, stream, previous_hash: str, index: int, workers: int, segment_size: int
+    ):
+        errors: List[str] = []
+        last_entry, checked, last_hash = None, 0, previous_hash
+        in_flight: Deque[Future] = deque()
+
+        def collect():
+            nonlocal last_hash
+            last_hash, segment_errors = in_flight.popleft().result()
+            errors.extend(segment_errors)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk in _chunks(stream, segment_size):
+                future = pool.submit(
+                    _verify_packed,
+                    _pack(chunk),
+                    previous_hash,
+                    index + checked,
+                    self.digest,
+                )
+                in_flight.append(future)
+                # The next segment starts from the server's hash for this
+                # segment's tail; this segment checks that hash itself. Without
+                # a stored hash we must wait for the computed one.
+                tail = chunk[-1].hash
+                previous_hash = tail if tail is not None else future.result()[0]
+                last_entry = chunk[-1]
+                checked += len(chunk)
+                # Bound how many segments are held in memory at once.
+                while len(in_flight) > workers * 2:
+                    collect()
+            while in_flight:
+                collect()
+        return last_hash, last_entry, checked, errors
+
+
+def _chunks(stream, size: int):
+    while True:
+        chunk = list(islice(stream, size))
+        if not chunk:
+            return
+        yield chunk
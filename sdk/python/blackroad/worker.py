@@ -0,0 +1,349 @@
+"""
+BlackRoad OS Task Worker
+
+Claim, process and complete marketplace tasks on a thread or process pool.
+"""
+
+import os
+import queue
+import itertools
+import threading
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Callable, Iterable, Set, Tuple
+
+from .tasks import Task, PRIORITIES
+
+
+Handler = Callable[[Task], Any]
+
+
+@dataclass
+class TaskWorkerStats:
+    """Counters for a :class:`TaskWorker`."""
+    polls: int = 0
+    fetched: int = 0
+    claimed: int = 0
+    conflicts: int = 0
+    completed: int = 0
+    failed: int = 0
+    callback_errors: int = 0
+
+
+class SkillIndex:
+    """
+    Precomputed skill matching for task candidates.
+
+    Each worker skill gets one bit; a task's required skills are folded
+    into a mask once per distinct skill list and cached, so matching a
+    candidate is a dict lookup and an AND. By default a task matches when
+    it requires no skills or any of the worker's skills; with
+    ``require_all`` every required skill must be present.
+
+    Example:
+        >>> index = SkillIndex(["python", "testing"])
+        >>> index.matches(["rust", "python"])
+        True
+        >>> SkillIndex(["python"], require_all=True).matches(["rust", "python"])
+        False
+    """
+
+    def __init__(self, skills: Optional[Iterable[str]] = None, require_all: bool = False):
+        self.skills = tuple(dict.fromkeys(s.strip() for s in skills or () if s.strip()))
+        self.require_all = require_all
+        self._bits: Dict[str, int] = {s: 1 << i for i, s in enumerate(self.skills)}
+        self._mask = (1 << len(self.skills)) - 1
+        self._unknown = 1 << len(self.skills)
+        self._masks: Dict[Tuple[str, ...], int] = {}
+
+    def mask(self, required: Iterable[str]) -> int:
+        """Bit mask of ``required``; skills the worker lacks set one extra bit."""
+        key = tuple(required)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = 0
+            for skill in key:
+                mask |= self._bits.get(skill, self._unknown)
+            self._masks[key] = mask
+        return mask
+
+    def matches(self, required: Iterable[str]) -> bool:
+        """Whether a task requiring ``required`` can be taken by this worker."""
+        if not self.skills:
+            return True
+        mask = self.mask(required)
+        if not mask:
+            return True
+        if self.require_all:
+            return not mask & ~self._mask
+        return bool(mask & self._mask)
+
+
+def _priority_rank(priority: Optional[str]) -> int:
+    try:
+        return PRIORITIES.index(priority)
+    except ValueError:
+        return len(PRIORITIES)
+
+
+def _completion(task: Task, result: Any) -> Tuple[str, Optional[List[str]]]:
+    if isinstance(result, tuple):
+        summary, artifacts = result
+        return summary, artifacts
+    if result is None:
+        return f"Completed {task.title}", None
+    return str(result), None
+
+
+class TaskWorker:
+    """
+    Concurrent claim/process/complete loop for marketplace tasks.
+
+    One fetcher thread polls available tasks, keeps those matching the
+    worker's :class:`SkillIndex` and queues them by priority in a buffer
+    of ``prefetch`` candidates. Polling pauses while the buffer is more
+    than half full, so a slow handler is not flooded with stale tasks.
+    ``workers`` dispatcher threads take candidates, claim them and run
+    ``handler``; a claim lost to another worker (409) moves straight on
+    to the next buffered candidate instead of re-polling.
+
+    With ``mode="thread"`` the handler runs on the dispatcher threads,
+    which suits I/O-bound work. With ``mode="process"`` it runs in a
+    process pool of the same size, so CPU-bound handlers scale with the
+    number of cores; the handler must then be a picklable top-level
+    function. HTTP calls always stay in the parent process.
+
+    ``handler`` returns a summary string, a ``(summary, artifacts)``
+    tuple, or None for a default summary. A handler that raises leaves
+    the task claimed and is reported to ``on_error``. Exceptions raised
+    by ``on_complete`` or ``on_error`` are counted in ``callback_errors``
+    and never stop the worker's threads.
+
+    Example:
+        >>> def handle(task):
+        ...     return f"Built {task.title}"
+        >>> worker = client.tasks.worker(handle, skills=["python"], workers=8)
+        >>> worker.run(max_tasks=100)
+        TaskWorkerStats(polls=..., claimed=100, conflicts=..., completed=100, ...)
+    """
+
+    def __init__(
+        self,
+        tasks,
+        handler: Handler,
+        skills: Optional[Iterable[str]] = None,
+        workers: Optional[int] = None,
+        mode: str = "thread",
+        prefetch: Optional[int] = None,
+        poll_interval: float = 5.0,
+        require_all: bool = False,
+        on_complete: Optional[Callable[[Task, str], Any]] = None,
+        on_error: Optional[Callable[[Optional[Task], BaseException], Any]] = None,
+    ):
+        if mode not in ("thread", "process"):
+            raise ValueError("mode must be 'thread' or 'process'")
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        self._tasks = tasks
+        self.handler = handler
+        self.mode = mode
+        self.prefetch = max(prefetch or self.workers * 2, 1)
+        self.poll_interval = poll_interval
+        self.index = SkillIndex(skills, require_all=require_all)
+        self.on_complete = on_complete
+        self.on_error = on_error
+
+        self._buffer: "queue.PriorityQueue[Tuple[int, int, Task]]" = queue.PriorityQueue(
+            maxsize=self.prefetch
+        )
+        self._order = itertools.count()
+        self._seen: Set[str] = set()
+        self._stats = TaskWorkerStats()
+        self._lock = threading.Lock()
+        self._space = threading.Condition()
+        self._stop = threading.Event()
+        self._done = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._pool = None
+        self._max_tasks: Optional[int] = None
+        self._started = 0
+        self._finished = 0
+
+    def start(self, max_tasks: Optional[int] = None) -> "TaskWorker":
+        """Start fetching and processing tasks in the background."""
+        if self._threads:
+            raise RuntimeError("TaskWorker is already running")
+        self._max_tasks = max_tasks
+        if self.mode == "process":
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            # Start the pool's processes before any worker threads exist.
+            self._pool.submit(int).result()
+        self._threads.append(
+            threading.Thread(target=self._fetch, name="blackroad-tasks-fetch", daemon=True)
+        )
+        for i in range(self.workers):
+            self._threads.append(
+                threading.Thread(
+                    target=self._dispatch, name=f"blackroad-tasks-{i}", daemon=True
+                )
+            )
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def run(
+        self, max_tasks: Optional[int] = None, timeout: Optional[float] = None
+    ) -> TaskWorkerStats:
+        """Process tasks until ``max_tasks`` are done, ``timeout`` passes or :meth:`stop`."""
+        self.start(max_tasks)
+        try:
+            self._done.wait(timeout)
+        finally:
+            self.stop()
+        return self.stats()
+
+    def stop(self, wait: bool = True):
+        """Stop polling; in-flight tasks finish before the threads exit."""
+        self._stop.set()
+        self._done.set()
+        with self._space:
+            self._space.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+
+    def stats(self) -> TaskWorkerStats:
+        """Snapshot of the worker's counters."""
+        with self._lock:
+            return TaskWorkerStats(**vars(self._stats))
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _fetch(self):
+        low_water = self.prefetch // 2
+        while not self._stop.is_set():
+            with self._space:
+                self._space.wait_for(
+                    lambda: self._stop.is_set() or self._buffer.qsize() <= low_water
+                )
+            if self._stop.is_set():
+                return
+            try:
+                available = self._tasks.list(status="available")
+            except Exception as exc:
+                self._report(None, exc)
+                self._stop.wait(self.poll_interval)
+                continue
+            queued = self._enqueue(available)
+            if not queued:
+                self._stop.wait(self.poll_interval)
+
+    def _enqueue(self, available: List[Task]) -> int:
+        with self._lock:
+            self._stats.polls += 1
+            candidates = [
+                task for task in available
+                if task.id not in self._seen and self.index.matches(task.required_skills)
+            ]
+            self._stats.fetched += len(candidates)
+            self._seen.update(task.id for task in candidates)
+        queued = 0
+        for task in candidates:
+            item = (_priority_rank(task.priority), next(self._order), task)
+            while not self._stop.is_set():
+                try:
+                    self._buffer.put(item, timeout=0.1)
+                    queued += 1
+                    break
+                except queue.Full:
+                    continue
+            else:
+                break
+        return queued
+
+    def _dispatch(self):
+        while not self._stop.is_set():
+            try:
+                _, _, task = self._buffer.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            with self._space:
+                self._space.notify()
+            try:
+                if self._reserve():
+                    self._process(task)
+            finally:
+                with self._lock:
+                    self._seen.discard(task.id)
+
+    def _reserve(self) -> bool:
+        with self._lock:
+            if self._max_tasks is not None and self._started >= self._max_tasks:
+                return False
+            self._started += 1
+            return True
+
+    def _release(self, finished: bool):
+        with self._lock:
+            if finished:
+                self._finished += 1
+            else:
+                self._started -= 1
+            done = self._max_tasks is not None and self._finished >= self._max_tasks
+        if done:
+            self._done.set()
+
+    def _process(self, task: Task):
+        try:
+            claimed = self._tasks.try_claim(task.id)
+        except Exception as exc:
+            self._release(False)
+            self._report(task, exc)
+            return
+        if claimed is None:
+            with self._lock:
+                self._stats.conflicts += 1
+            self._release(False)
+            return
+        with self._lock:
+            self._stats.claimed += 1
+
+        try:
+            try:
+                if self._pool is not None:
+                    result = self._pool.submit(self.handler, claimed).result()
+                else:
+                    result = self.handler(claimed)
+                summary, artifacts = _completion(claimed, result)
+                self._tasks.complete(claimed.id, summary=summary, artifacts=artifacts)
+            except Exception as exc:
+                self._report(claimed, exc)
+                return
+            with self._lock:
+                self._stats.completed += 1
+            self._callback(self.on_complete, claimed, summary)
+        finally:
+            self._release(True)
+
+    def _report(self, task: Optional[Task], exc: BaseException):
+        with self._lock:
+            self._stats.failed += 1
+        self._callback(self.on_error, task, exc)
+
+    def _callback(self, callback: Optional[Callable[..., Any]], *args):
+        """Run a user callback; its exceptions are counted, never raised into worker threads."""
+        if callback is None:
+            return
+        try:
+            callback(*args)
+        except Exception:
+            with self._lock:
+                self._stats.callback_errors += 1
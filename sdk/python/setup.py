@@ -28,7 +28,25 @@ setup(
     install_requires=[
         "httpx>=0.24.0",
     ],
+    entry_points={
+        "console_scripts": [
+            "blackroad-standin=blackroad.standin:main",
+            "blackroad-loadgen=blackroad.loadgen:main",
+        ],
+    },
     extras_require={
+        "http2": [
+            "httpx[http2]>=0.24.0",
+        ],
+        "fast": [
+            "orjson>=3.9",
+        ],
+        "analytics": [
+            "numpy>=1.21",
+        ],
+        "compression": [
+            "httpx[brotli,zstd]>=0.27.1",
+        ],
         "dev": [
             "pytest>=7.0",
             "pytest-asyncio>=0.21",
@@ -0,0 +1,26 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from blackroad import BlackRoadClient, RetryPolicy  # noqa: E402
+from blackroad.standin import StandInServer, StandInState  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    with StandInServer(state=StandInState(components=200, projects=20, tasks=20)) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    client = BlackRoadClient(
+        api_key="test",
+        base_url=server.url,
+        retry=RetryPolicy(max_attempts=2, backoff_base=0.01),
+    )
+    yield client
+    client.close()
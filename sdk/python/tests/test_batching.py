@@ -0,0 +1,59 @@
+import threading
+import time
+
+import pytest
+
+
+def test_buffer_applies_backpressure_to_single_posts(client, server):
+    log = server.app.logMemory
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def logMemory(params, query, body):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return log(params, query, body)
+
+    server.app.logMemory = logMemory
+    buffered = client.memory.buffered(
+        batch_size=2, flush_interval=0.01, max_concurrency=2, max_queue=4
+    )
+    held = 0
+    futures = []
+    for i in range(20):
+        futures.append(buffered.log("progress", "buffer", f"step {i}"))
+        held = max(held, len(buffered._inflight))
+    buffered.close()
+
+    assert all(f.result().details == f"step {i}" for i, f in enumerate(futures))
+    assert peak[0] <= 2
+    # Queued, in-flight and the batch being handed over stay bounded
+    # (max_queue + max_concurrency + batch_size) instead of piling up.
+    assert held <= 4 + 2 + 2
+
+
+def test_log_blocked_on_a_full_queue_fails_when_closed(client, server):
+    buffered = client.memory.buffered(batch_size=10, flush_interval=60, max_queue=1)
+    first = buffered.log("progress", "buffer", "queued")
+    errors = []
+
+    def blocked():
+        try:
+            buffered.log("progress", "buffer", "blocked")
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    writer = threading.Thread(target=blocked)
+    writer.start()
+    time.sleep(0.1)
+    assert writer.is_alive()
+    buffered.close()
+    writer.join(5)
+
+    assert len(errors) == 1
+    assert first.result().details == "queued"
+    assert [e["details"] for e in server.state.memory] == ["queued"]
@@ -0,0 +1,22 @@
+import importlib.util
+import os
+
+BENCH = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "bench_sdk.py")
+
+
+def _load(monkeypatch):
+    # The suite imports its payload helpers as a sibling script would.
+    monkeypatch.syspath_prepend(os.path.dirname(BENCH))
+    spec = importlib.util.spec_from_file_location("bench_sdk", BENCH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_benchmark_suite_runs_every_case(monkeypatch, capsys):
+    bench = _load(monkeypatch)
+    results = bench.run(calls=5, rows=3, repeat=1)
+
+    assert results["requests"] and results["parse"]
+    assert all(row["req_per_s"] > 0 for row in results["requests"])
+    assert bench.compare(results, results) == 0
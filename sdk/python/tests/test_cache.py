@@ -0,0 +1,81 @@
+import asyncio
+
+from blackroad import AsyncBlackRoadClient, BlackRoadClient, BlackRoadConfig, ResponseCache
+
+
+def test_hits_share_values_by_default():
+    value = {"byType": {"functions": 1}}
+    cache = ResponseCache()
+    cache.get_or_fetch("stats", None, lambda: value)
+
+    assert cache.get_or_fetch("stats", None, lambda: {}) is value
+
+
+def test_copy_values_returns_copies():
+    cache = ResponseCache(copy_values=True)
+    first = cache.get_or_fetch("stats", None, lambda: {"byType": {"functions": 1}})
+    first["byType"]["functions"] = 99
+
+    again = cache.get_or_fetch("stats", None, lambda: {})
+    again["byType"].clear()
+
+    assert cache.get_or_fetch("stats", None, lambda: {}) == {"byType": {"functions": 1}}
+    assert cache.stats.hits == 2
+
+
+def test_params_keep_their_whitespace():
+    cache = ResponseCache()
+    cache.get_or_fetch("search", {"q": "rate  limiting"}, lambda: "two spaces")
+
+    assert cache.get_or_fetch("search", {"q": "rate limiting"}, lambda: "one space") == "one space"
+    assert cache.get_or_fetch("search", {"q": "rate  limiting"}, lambda: None) == "two spaces"
+
+
+def test_invalidate_by_name_or_path(server):
+    cache = ResponseCache()
+    client = BlackRoadClient(api_key="test", base_url=server.url, codex_cache=cache)
+    try:
+        client.codex.stats()
+        client.codex.languages()
+        client.codex.search("agent")
+        assert len(cache) == 3
+
+        cache.invalidate(path="/v1/codex/stats")
+        assert len(cache) == 2
+        cache.invalidate("search")
+        assert len(cache) == 1
+        cache.invalidate()
+        assert len(cache) == 0
+    finally:
+        client.close()
+
+
+def test_async_client_uses_codex_cache(server):
+    cache = ResponseCache()
+
+    async def main():
+        async with AsyncBlackRoadClient(
+            api_key="test", base_url=server.url, codex_cache=cache
+        ) as client:
+            first = await client.codex.search("agent")
+            second = await client.codex.search("agent")
+            return first, second
+
+    first, second = asyncio.run(main())
+    assert [c.name for c in first] == [c.name for c in second]
+    assert cache.stats.hits == 1
+    assert server.stats().by_operation["searchCodex"] == 1
+
+
+def test_codex_cache_from_config(server):
+    cache = ResponseCache()
+    config = BlackRoadConfig(api_key="test", base_url=server.url, codex_cache=cache)
+    client = BlackRoadClient(config=config)
+    try:
+        client.codex.stats()
+        client.codex.stats()
+    finally:
+        client.close()
+
+    assert cache.stats.hits == 1
+    assert server.stats().by_operation["getCodexStats"] == 1
@@ -0,0 +1,20 @@
+from blackroad import compression
+
+
+def test_zstd_follows_httpx_decoders(monkeypatch):
+    monkeypatch.setattr(compression, "_httpx_decoders", lambda: {"gzip", "deflate", "zstd"})
+    assert compression.available_encodings() == ["zstd", "gzip", "deflate"]
+
+    monkeypatch.setattr(compression, "_httpx_decoders", lambda: {"gzip", "deflate"})
+    assert "zstd" not in compression.available_encodings()
+
+
+def test_zstd_needs_httpx_0_27_1_without_decoder_table(monkeypatch):
+    monkeypatch.setattr(compression, "_httpx_decoders", lambda: None)
+    monkeypatch.setattr(compression, "_has_module", lambda *names: "zstandard" in names)
+
+    monkeypatch.setattr(compression, "_httpx_version", lambda: (0, 27, 0))
+    assert compression.available_encodings() == ["gzip", "deflate"]
+
+    monkeypatch.setattr(compression, "_httpx_version", lambda: (0, 27, 1))
+    assert compression.available_encodings() == ["zstd", "gzip", "deflate"]
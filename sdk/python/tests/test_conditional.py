@@ -0,0 +1,40 @@
+from blackroad import BlackRoadClient, ConditionalCache
+from blackroad.conditional import Validators, request_key
+
+
+def _cached_client(server, cache):
+    return BlackRoadClient(api_key="test", base_url=server.url, conditional_cache=cache)
+
+
+def test_not_modified_returns_fresh_models(server):
+    cache = ConditionalCache()
+    client = _cached_client(server, cache)
+    try:
+        first = client.tasks.list()
+        first[0].title = "changed by caller"
+        second = client.tasks.list()
+    finally:
+        client.close()
+
+    assert cache.stats.not_modified == 1
+    assert second[0] is not first[0]
+    assert second[0].title != "changed by caller"
+
+
+def test_not_modified_without_stored_body_is_refetched(server):
+    cache = ConditionalCache()
+    client = _cached_client(server, cache)
+    try:
+        expected = [a.id for a in client.tasks.list()]
+        cache_key = request_key("/v1/tasks", None)
+        cache.store.set(cache_key, Validators(cache.store.get(cache_key).etag, None, b""))
+        before = server.stats().by_operation["listTasks"]
+
+        agents = client.tasks.list()
+    finally:
+        client.close()
+
+    assert [a.id for a in agents] == expected
+    assert server.stats().by_operation["listTasks"] == before + 2
+    assert cache.stats.not_modified == 0
+    assert cache.store.get(cache_key).body
@@ -0,0 +1,77 @@
+import time
+
+from blackroad.standin import Rejected
+
+
+def test_malformed_bulk_reply_is_not_redelivered(client, server, tmp_path):
+    stored = []
+
+    def logMemory(params, query, body):
+        stored.extend(body["entries"])
+        return 201, {"entries": []}
+
+    server.app.logMemory = logMemory
+    outbox = client.memory.outbox(
+        str(tmp_path), bulk_endpoint="/v1/memory/log", retry_base=0.01, retry_max=0.05
+    )
+    for i in range(3):
+        outbox.log("progress", "outbox", f"step {i}")
+    assert outbox.flush(timeout=10)
+    time.sleep(0.2)
+    stats = outbox.stats()
+    outbox.close()
+
+    assert len(stored) == 3
+    assert stats.sent == 3
+    assert stats.unconfirmed == 3
+    assert stats.retries == 0
+
+
+def test_raising_on_reject_does_not_stop_delivery(client, server, tmp_path):
+    log = server.app.logMemory
+
+    def logMemory(params, query, body):
+        if body["details"] == "bad":
+            raise Rejected(422, "bad entry")
+        return log(params, query, body)
+
+    def on_reject(body, exc):
+        raise ZeroDivisionError
+
+    server.app.logMemory = logMemory
+    outbox = client.memory.outbox(str(tmp_path), on_reject=on_reject)
+    outbox.log("progress", "outbox", "bad")
+    outbox.log("progress", "outbox", "good")
+    assert outbox.flush(timeout=10)
+    stats = outbox.stats()
+    outbox.close()
+
+    assert stats.rejected == 1
+    assert stats.sent == 1
+    assert stats.callback_errors == 1
+    assert [e["details"] for e in server.state.memory] == ["good"]
+    assert (tmp_path / "rejected.jsonl").exists()
+
+
+def test_auth_errors_keep_the_spool(client, server, tmp_path):
+    log = server.app.logMemory
+
+    def logMemory(params, query, body):
+        raise Rejected(401, "expired key")
+
+    server.app.logMemory = logMemory
+    outbox = client.memory.outbox(str(tmp_path), retry_base=0.01, retry_max=0.05)
+    for i in range(3):
+        outbox.log("progress", "outbox", f"step {i}")
+    assert not outbox.flush(timeout=0.5)
+    stats = outbox.stats()
+    assert stats.rejected == 0
+    assert stats.pending == 3
+    assert stats.retries >= 1
+    assert "401" in stats.last_error
+    assert not (tmp_path / "rejected.jsonl").exists()
+
+    server.app.logMemory = log
+    assert outbox.flush(timeout=10)
+    outbox.close()
+    assert [e["details"] for e in server.state.memory] == [f"step {i}" for i in range(3)]
@@ -0,0 +1,46 @@
+def _fixed_page(server, total=None):
+    """Make memory search ignore ``offset`` and always return the first page."""
+    calls = []
+
+    def searchMemory(params, query, body):
+        calls.append(dict(query))
+        limit = int(query.get("limit", 20))
+        entries = server.state.memory[:limit]
+        response = {"entries": entries}
+        if total is not None:
+            response["total"] = total
+        return 200, response
+
+    server.app.searchMemory = searchMemory
+    return calls
+
+
+def test_paging_stops_when_server_ignores_offset(client, server):
+    for i in range(10):
+        client.memory.log("progress", "paging", f"step {i}")
+    calls = _fixed_page(server)
+
+    entries = list(client.memory.iter_search(page_size=5, prefetch=False))
+
+    assert [e.details for e in entries] == [f"step {i}" for i in range(5)]
+    assert len(calls) == 2
+
+
+def test_paging_stops_at_total(client, server):
+    for i in range(10):
+        client.memory.log("progress", "paging", f"step {i}")
+    calls = _fixed_page(server, total=5)
+
+    entries = list(client.memory.iter_search(page_size=5))
+
+    assert len(entries) == 5
+    assert len(calls) == 1
+
+
+def test_paging_follows_offset(client):
+    for i in range(12):
+        client.memory.log("progress", "paging", f"step {i}")
+
+    entries = list(client.memory.iter_search(page_size=5))
+
+    assert [e.details for e in entries] == [f"step {i}" for i in range(12)]
@@ -0,0 +1,53 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+from blackroad.memory import MemoryEntry
+from blackroad.query import MemoryIndex, action, agent, tag
+
+
+def _entries(n, start=0):
+    rng = random.Random(start)
+    base = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    return [
+        MemoryEntry(
+            id=f"mem_{i}",
+            timestamp=base + timedelta(seconds=i),
+            action=rng.choice(("progress", "deployed", "fixed")),
+            entity="svc",
+            details=f"step {i}",
+            tags=rng.sample(("prod", "release", "ci", "db"), rng.randrange(3)),
+            agent_id=rng.choice((None, "a1", "a2", "a3")),
+        )
+        for i in range(start, start + n)
+    ]
+
+
+def test_extend_and_facets_match_a_full_scan():
+    entries = _entries(300)
+    index = MemoryIndex(entries[:200])
+    index.extend(entries[200:])
+    where = (tag("prod") | action("fixed")) & ~agent(None)
+
+    expected = [
+        e for e in entries
+        if ("prod" in e.tags or e.action == "fixed") and e.agent_id is not None
+    ]
+    assert index.count(where) == len(expected)
+    assert index.query(where, limit=None, newest_first=False) == expected
+
+    by_agent = {}
+    for e in expected:
+        by_agent[e.agent_id] = by_agent.get(e.agent_id, 0) + 1
+    assert index.facets("agent_id", where=where) == dict(
+        sorted(by_agent.items(), key=lambda kv: -kv[1])
+    )
+    assert sum(index.facets("action").values()) == 300
+
+
+def test_out_of_order_extend_rebuilds():
+    entries = _entries(50)
+    index = MemoryIndex(entries[25:])
+    assert index.count(agent("a1")) == sum(e.agent_id == "a1" for e in entries[25:])
+    index.extend(entries[:25])
+    assert list(index) == entries
+    assert index.count(agent("a1")) == sum(e.agent_id == "a1" for e in entries)
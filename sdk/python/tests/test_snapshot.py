@@ -0,0 +1,48 @@
+from blackroad import BlackRoadClient, ResponseCache
+
+
+def test_refresh_detects_full_download_fallback(client, server):
+    snapshot = client.codex.snapshot()
+    assert len(snapshot) == 200
+
+    server.state.components.append(dict(server.state.components[0], name="FreshComponent"))
+    received = snapshot.refresh(client.codex)
+
+    assert received == 201
+    assert snapshot.last_refresh_full
+    assert len(snapshot) == 201
+    assert snapshot.search("FreshComponent", limit=1)[0].name == "FreshComponent"
+
+
+def test_refresh_reads_stats_past_the_codex_cache(server):
+    cached = BlackRoadClient(api_key="test", base_url=server.url, codex_cache=ResponseCache())
+    try:
+        snapshot = cached.codex.snapshot()
+        cached.codex.stats()
+        before = server.stats().by_operation.get("getCodexStats", 0)
+        snapshot.refresh(cached.codex)
+        assert server.stats().by_operation["getCodexStats"] == before + 1
+    finally:
+        cached.close()
+
+
+def test_refresh_keeps_download_filters(client, server, tmp_path):
+    snapshot = client.codex.snapshot(language="python")
+    python = [c for c in server.state.components if c["language"] == "python"]
+    assert 0 < len(snapshot) < 200
+
+    template = python[0]
+    server.state.components.append(dict(template, name="FreshPython", file_path="fresh.py"))
+    server.state.components.append(
+        dict(template, name="FreshGo", file_path="fresh.go", language="go")
+    )
+    path = str(tmp_path / "codex.snap")
+    snapshot.save(path)
+    loaded = type(snapshot).load(path)
+    assert loaded.scope == {"language": "python"}
+
+    loaded.refresh(client.codex)
+
+    assert loaded.last_refresh_full
+    assert len(loaded) == len(python) + 1
+    assert {c.language for c in loaded.components} == {"python"}
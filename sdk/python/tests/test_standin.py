@@ -0,0 +1,38 @@
+import httpx
+import pytest
+
+from blackroad.loadgen import run_load
+
+
+def test_handler_errors_answer_in_json(client, server):
+    def getCodexStats(params, query, body):
+        raise RuntimeError("boom")
+
+    server.app.getCodexStats = getCodexStats
+    with pytest.raises(httpx.HTTPStatusError) as error:
+        client.codex.stats()
+    assert error.value.response.status_code == 500
+    assert "boom" in error.value.response.json()["error"]
+
+    response = client._client.post("/v1/agents", content=b"[1, 2]")
+    assert response.status_code == 400
+    assert "error" in response.json()
+    assert server.stats().handler_errors == 2
+
+
+def test_run_load_deregisters_its_agents(client, server):
+    report = run_load(client, duration=0.2, concurrency=2, agents=4)
+    assert report.calls > 0
+    assert server.state.agents == {}
+
+
+def test_run_load_deregisters_when_the_run_fails(client, server, monkeypatch):
+    from blackroad import loadgen
+
+    def fail(*args):
+        raise RuntimeError("run failed")
+
+    monkeypatch.setattr(loadgen, "_drive", fail)
+    with pytest.raises(RuntimeError):
+        run_load(client, duration=0.2, agents=4)
+    assert server.state.agents == {}
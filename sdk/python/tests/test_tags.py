@@ -0,0 +1,25 @@
+def _log(client):
+    client.memory.log("deployed", "api", "both", ["prod", "release"])
+    client.memory.log("deployed", "api", "prod only", ["prod"])
+    client.memory.log("deployed", "api", "release only", ["release"])
+
+
+def test_replica_tags_match_every_tag_like_the_api(client, tmp_path):
+    _log(client)
+    with client.memory.replica(str(tmp_path / "replica")) as replica:
+        replica.sync()
+        local = replica.search(tags=["prod", "release"])
+
+    remote = client.memory.search(tags=["prod", "release"])
+    assert [e.details for e in local] == [e.details for e in remote] == ["both"]
+
+
+def test_index_tags_match_every_tag_like_the_api(client):
+    from blackroad.query import tag
+
+    _log(client)
+    index = client.memory.index()
+
+    assert [e.details for e in index.search(tags=["prod", "release"])] == ["both"]
+    assert index.count(tag("prod", "release")) == 1
+    assert index.count(tag("prod") | tag("release")) == 3
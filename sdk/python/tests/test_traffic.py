@@ -0,0 +1,60 @@
+import time
+
+from blackroad import BlackRoadClient, RetryPolicy
+from blackroad.metrics import RequestMetrics
+from blackroad.standin import Rejected
+
+
+def test_refresh_goes_through_hooks(server):
+    metrics = RequestMetrics()
+    client = BlackRoadClient(api_key="test", base_url=server.url, hooks=[metrics])
+    try:
+        snapshot = client.traffic_lights.snapshot()
+        assert len(snapshot) == 20
+        assert snapshot.refresh() == []
+    finally:
+        client.close()
+    [stats] = metrics.endpoints()
+    assert stats.requests == 2
+    assert stats.statuses == {200: 1, 304: 1}
+
+
+def test_poll_errors_are_counted_and_backed_off(server):
+    client = BlackRoadClient(
+        api_key="test", base_url=server.url, retry=RetryPolicy(max_attempts=1)
+    )
+    snapshot = client.traffic_lights.snapshot()
+
+    def listTrafficLights(params, query, body):
+        raise Rejected(400, "broken")
+
+    server.app.listTrafficLights = listTrafficLights
+    errors = []
+    snapshot.start(interval=0.01, on_error=errors.append, max_interval=0.2)
+    time.sleep(0.5)
+    snapshot.stop()
+    client.close()
+
+    stats = snapshot.stats()
+    assert stats.errors == len(errors) >= 2
+    # Doubling from 10ms and capped at 200ms leaves room for only a handful.
+    assert stats.errors < 10
+    assert stats.consecutive_errors == stats.errors
+    assert "400" in stats.last_error
+
+
+def test_raising_subscriber_does_not_hide_changes(client, server):
+    snapshot = client.traffic_lights.snapshot()
+    seen = []
+
+    def broken(changes):
+        raise ZeroDivisionError
+
+    snapshot.subscribe(broken)
+    snapshot.subscribe(seen.append)
+    client.traffic_lights.set("project-3", "red", "outage")
+    changes = snapshot.refresh()
+
+    assert [c.project_id for c in changes] == ["project-3"]
+    assert seen == [changes]
+    assert snapshot.stats().callback_errors == 1
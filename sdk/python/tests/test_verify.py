@@ -0,0 +1,46 @@
+from blackroad.memory import MemoryEntry
+from blackroad.verify import ChainVerifier
+
+
+def test_checkpoint_resumes_across_runs(client, tmp_path):
+    path = str(tmp_path / "chain.ckpt")
+    for i in range(5):
+        client.memory.log("progress", "verify", f"step {i}")
+
+    first = client.memory.verify(checkpoint_path=path, page_size=2)
+    assert first.valid, first.errors
+    assert first.entries_checked == 5
+
+    unchanged = client.memory.verify(checkpoint_path=path)
+    assert unchanged.valid, unchanged.errors
+    assert unchanged.entries_checked == 0
+
+    client.memory.log("progress", "verify", "step 5")
+    second = client.memory.verify(checkpoint_path=path)
+    assert second.valid, second.errors
+    assert second.entries_checked == 1
+    assert second.checkpoint.index == 5
+
+
+def test_stream_starting_after_checkpoint_is_accepted(client, server, tmp_path):
+    path = str(tmp_path / "chain.ckpt")
+    for i in range(3):
+        client.memory.log("progress", "verify", f"step {i}")
+    verifier = ChainVerifier(key=b"k", checkpoint_path=path)
+    assert verifier.verify(client.memory.iter_search()).valid
+
+    client.memory.log("progress", "verify", "step 3")
+    tail = [MemoryEntry.from_dict(server.state.memory[-1])]
+    result = verifier.verify(tail)
+    assert result.valid, result.errors
+    assert result.entries_checked == 1
+
+
+def test_entries_without_hashes_are_unverifiable(client):
+    client.memory.log("progress", "verify", "step")
+    entries = list(client.memory.iter_search())
+    entries[0].hash = None
+
+    result = ChainVerifier().verify(entries)
+    assert not result.valid
+    assert "unverifiable" in result.errors[0]
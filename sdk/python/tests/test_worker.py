@@ -0,0 +1,31 @@
+import time
+
+
+def test_raising_on_complete_does_not_stop_worker(client):
+    def on_complete(task, summary):
+        raise ZeroDivisionError
+
+    worker = client.tasks.worker(
+        lambda task: "done", workers=2, poll_interval=0.1, on_complete=on_complete
+    )
+    start = time.monotonic()
+    stats = worker.run(max_tasks=2, timeout=10)
+
+    assert time.monotonic() - start < 5
+    assert stats.completed == 2
+    assert stats.callback_errors == 2
+
+
+def test_raising_on_error_does_not_stop_worker(client):
+    def handler(task):
+        raise RuntimeError("handler failed")
+
+    def on_error(task, exc):
+        raise ZeroDivisionError
+
+    worker = client.tasks.worker(handler, workers=2, poll_interval=0.1, on_error=on_error)
+    stats = worker.run(max_tasks=3, timeout=10)
+
+    assert stats.failed == 3
+    assert stats.callback_errors == 3
+    assert all(not thread.is_alive() for thread in worker._threads)